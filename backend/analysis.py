@@ -1,12 +1,35 @@
 # frida_asset_suite/backend/analysis.py
 import logging
 from pathlib import Path
-from typing import Set, List, Optional, Dict
+from typing import Set, List, Optional, Dict, Iterable, Tuple
 from collections import defaultdict
 from .data_models import CharacterManager
+from .search_index import TrigramIndex
+from .report import StructuredReport, TimelineReport
+from .instrumentation import timed
 
 logger = logging.getLogger('frida_asset_suite')
 
+class CatalogTimeline:
+    """여러 버전에 걸친 에셋 경로의 추가/삭제 이력입니다.
+
+    deltas[i]는 versions[i] → versions[i+1] 사이의 변화입니다. 첫 버전의 경로는 따로 복사해 두지 않고
+    first_seen/last_seen(값은 versions의 인덱스)에만 기록하며, delta_counts[0]은 첫 버전의 전체 경로를 추가로 셉니다.
+    """
+    def __init__(self):
+        self.versions: List[str] = []
+        self.totals: List[int] = []
+        self.deltas: List[Dict[str, Set[str]]] = [] # [{"added": {...}, "removed": {...}}, ...]
+        self.delta_counts: List[Tuple[int, int]] = [] # 버전별 (추가 수, 삭제 수)
+        self.first_seen: Dict[str, int] = {}
+        self.last_seen: Dict[str, int] = {}
+
+    def history(self, path: str) -> Optional[Tuple[str, str]]:
+        """경로가 처음 등장한 버전과 마지막으로 존재한 버전의 이름을 반환합니다."""
+        if path not in self.first_seen:
+            return None
+        return self.versions[self.first_seen[path]], self.versions[self.last_seen[path]]
+
 class AssetComparer:
     def __init__(self, char_manager: CharacterManager):
         self.char_manager = char_manager
@@ -24,53 +47,84 @@ class AssetComparer:
         logger.info(f"버전 비교 시작: '{new_path_file.name}' vs '{old_path_file.name}'")
         new_paths = self.read_path_file(new_path_file)
         old_paths = self.read_path_file(old_path_file)
-        
+        return self.compare_path_sets(new_paths, old_paths)
+
+    @timed("diff")
+    def compare_path_sets(self, new_paths: Set[str], old_paths: Set[str]) -> Set[str]:
+        """메모리에 올라온 두 버전의 경로 Set을 비교하여 추가된 경로만 반환합니다."""
         added_paths = new_paths - old_paths
         logger.info(f"비교 완료: {len(added_paths)}개의 신규 에셋 경로 발견.")
         return added_paths
 
+    @timed("timeline diff")
+    def build_timeline(self, catalogs: Iterable[Tuple[str, Set[str]]]) -> CatalogTimeline:
+        """(버전 이름, 경로 Set)을 시간 순서대로 받아 인접 버전 간 추가/삭제 이력을 계산합니다.
+
+        catalogs는 지연 생성되는 이터러블이어도 되며, 한 번에 두 버전의 경로 Set만 참조합니다.
+        """
+        timeline = CatalogTimeline()
+        prev_paths: Optional[Set[str]] = None
+        for idx, (name, paths) in enumerate(catalogs):
+            if prev_paths is None:
+                added, counts = paths, (len(paths), 0)
+            else:
+                added, removed = paths - prev_paths, prev_paths - paths
+                timeline.deltas.append({"added": added, "removed": removed})
+                counts = (len(added), len(removed))
+            for path in added:
+                timeline.first_seen.setdefault(path, idx)
+            for path in paths:
+                timeline.last_seen[path] = idx
+            timeline.versions.append(name)
+            timeline.totals.append(len(paths))
+            timeline.delta_counts.append(counts)
+            logger.info(f"타임라인 [{idx + 1}] '{name}': +{counts[0]:,} / -{counts[1]:,} (총 {len(paths):,}개)")
+            prev_paths = paths
+        return timeline
+
+    @timed("filter")
     def _filter_and_structure_paths(self, paths: Set[str], squads: Optional[List[str]],
-                                    characters: Optional[List[str]], keyword: Optional[str]) -> Dict:
-        """주어진 경로 목록을 필터링하고 부대/캐릭터별로 구조화합니다."""
+                                    characters: Optional[List[str]], keyword: Optional[str],
+                                    index: Optional[TrigramIndex] = None) -> Dict:
+        """주어진 경로 목록을 필터링하고 부대/캐릭터별로 구조화합니다.
+
+        index가 주어지면 (paths를 포함하는 카탈로그의) 트라이그램 색인으로 키워드 필터링을 수행합니다.
+        """
         
         # 1. 키워드 필터링
         filtered_paths = paths
         if keyword:
-            keyword_lower = keyword.lower()
-            filtered_paths = {p for p in paths if keyword_lower in p.lower()}
+            if index is not None and index.covers(paths):
+                filtered_paths = index.search(keyword)
+            elif index is not None and index.narrows(keyword):
+                # paths가 색인한 카탈로그의 일부(비교의 추가 경로 등)이면 검색 결과와의 교집합만 남깁니다.
+                # (색인으로 좁힐 수 없는 짧은 검색어는 카탈로그 전체 대신 paths만 검사합니다)
+                filtered_paths = set(index.search(keyword)).intersection(paths)
+            else:
+                keyword_lower = keyword.lower()
+                filtered_paths = {p for p in paths if keyword_lower in p.lower()}
             logger.debug(f"키워드 '{keyword}' 필터링 후 {len(filtered_paths)}개 경로 남음.")
 
         # 2. 캐릭터/부대 필터링 및 데이터 구조화
         report_data: Dict[str, Dict[str, List[str]]] = defaultdict(lambda: defaultdict(list))
         
-        target_chars = set(characters) if characters else set()
-        target_squads = set(squads) if squads else set()
-
-        # 캐릭터 코드와 이름을 매핑하는 딕셔너리를 미리 생성하여 검색 효율 향상
-        name_to_code_map = {info['name']: code for code, info in self.char_manager.char_data.items()}
-        target_codes = {name_to_code_map.get(name) for name in target_chars}
+        # 필터 조건을 만족하는 캐릭터 코드(미리 만든 부대/이름 조회표로 계산)로 경로마다 사전 매처를 한 번만 실행합니다.
+        # (CSV가 바뀌었으면 여기서 다시 읽습니다)
+        allowed_codes = self.char_manager.allowed_codes(squads, characters)
+        char_data = self.char_manager.char_data
 
         for path in sorted(list(filtered_paths)):
-            found_char = False
-            for code, info in self.char_manager.char_data.items():
-                if f"_{code.lower()}_" in path.lower() or f"/{code.lower()}/" in path.lower():
-                    squad, name = info['squad'], info['name']
-                    
-                    squad_match = not target_squads or squad in target_squads
-                    char_match = not target_chars or name in target_chars
-                    
-                    if squad_match and char_match:
-                        report_data[squad][name].append(path)
-                        found_char = True
-                        break
-
-            if not found_char:
+            code = self.char_manager.match_character(path, allowed_codes)
+            if code is not None:
+                info = char_data[code]
+                report_data[info['squad']][info['name']].append(path)
+            elif allowed_codes is None:
                 # 필터가 없을 때만 '기타' 항목 추가
-                if not target_squads and not target_chars:
-                    report_data["기타"]["공용/미분류 에셋"].append(path)
+                report_data["기타"]["공용/미분류 에셋"].append(path)
         
         return report_data
 
+    @timed("render")
     def format_report_to_markdown(self, report_data: Dict, title: str) -> str:
         """구조화된 데이터를 사람이 읽기 좋은 마크다운 텍스트로 변환합니다."""
         if not report_data:
@@ -96,12 +150,43 @@ class AssetComparer:
         report_lines.insert(1, f"총 {total_assets}개의 에셋이 발견되었습니다.")
         return "\n".join(report_lines)
 
+    def build_timeline_report(self, timeline: CatalogTimeline, squads: Optional[List[str]],
+                              characters: Optional[List[str]], keyword: Optional[str]) -> TimelineReport:
+        """타임라인을 구간(인접 버전 간 추가/삭제)별로 페이지 단위 조회할 수 있는 보고서 객체로 만듭니다."""
+        sections = []
+        for idx, delta in enumerate(timeline.deltas):
+            for label, key in (("➕ 추가", "added"), ("➖ 삭제", "removed")):
+                structured = self._filter_and_structure_paths(delta[key], squads, characters, keyword)
+                sections.append((f"{timeline.versions[idx]} → {timeline.versions[idx + 1]} {label}",
+                                 StructuredReport(label, structured)))
+        return TimelineReport(timeline.versions, timeline.totals, timeline.delta_counts, sections, timeline.history)
+
     def generate_single_report(self, path_file: Path, squads: List, chars: List, keyword: str):
         """단일 카탈로그 분석 보고서를 생성합니다."""
         all_paths = self.read_path_file(path_file)
         structured_data = self._filter_and_structure_paths(all_paths, squads, chars, keyword)
         return self.format_report_to_markdown(structured_data, f"'{path_file.name}' 분석 결과")
 
+    def build_single_report_from_paths(self, all_paths: Set[str], name: str, squads: List, chars: List, keyword: str,
+                                       index: Optional[TrigramIndex] = None) -> StructuredReport:
+        """단일 카탈로그 분석 결과를 페이지 단위로 조회할 수 있는 보고서 객체로 만듭니다."""
+        structured_data = self._filter_and_structure_paths(all_paths, squads, chars, keyword, index)
+        return StructuredReport(f"'{name}' 분석 결과", structured_data)
+
+    def build_comparison_report_from_paths(self, new_paths: Set[str], old_paths: Set[str], new_name: str, old_name: str,
+                                           squads: List, chars: List, keyword: str,
+                                           new_index: Optional[TrigramIndex] = None) -> StructuredReport:
+        """비교 분석 결과(추가된 에셋)를 페이지 단위로 조회할 수 있는 보고서 객체로 만듭니다."""
+        logger.info(f"버전 비교 시작: '{new_name}' vs '{old_name}'")
+        added_paths = self.compare_path_sets(new_paths, old_paths)
+        return self.build_added_report(added_paths, new_name, old_name, squads, chars, keyword, new_index)
+
+    def build_added_report(self, added_paths: Set[str], new_name: str, old_name: str, squads: List, chars: List,
+                           keyword: str, new_index: Optional[TrigramIndex] = None) -> StructuredReport:
+        """이미 계산한 추가 경로로 비교 보고서 객체를 만듭니다. (같은 두 버전을 필터만 바꿔 다시 볼 때 비교를 생략)"""
+        structured_data = self._filter_and_structure_paths(added_paths, squads, chars, keyword, new_index)
+        return StructuredReport(f"'{new_name}' vs '{old_name}' 비교 결과", structured_data)
+
     def generate_comparison_report(self, new_file: Path, old_file: Path, squads: List, chars: List, keyword: str):
         """두 카탈로그 비교 분석 보고서를 생성합니다."""
         added_paths = self.compare_versions(new_file, old_file)
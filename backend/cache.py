@@ -0,0 +1,147 @@
+# frida_asset_suite/backend/cache.py
+import os
+import struct
+import hashlib
+import logging
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+from .instrumentation import report_progress, timed
+from .path_store import CompactPathSet
+
+logger = logging.getLogger('frida_asset_suite')
+
+class ProcessedCatalogCache:
+    """추출된 경로 Set을 암호화 파일 내용 기준(content-addressed)으로 디스크에 캐시합니다.
+
+    파일 포맷: [헤더][오프셋 인덱스(uint64 * (n+1))][정렬 후 '\\n'으로 이어 붙인 경로 blob]
+    헤더의 SHA-256 다이제스트로 인덱스와 blob의 무결성을 검사합니다.
+    """
+    _MAGIC = b'HBRPATH1'
+    _HEADER = struct.Struct('<8sQQ32s')  # magic, 경로 수, blob 길이, sha256(인덱스 + blob)
+    _SUFFIX = '.paths'
+    _HASH_CHUNK = 1 << 20
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # (경로, 크기, 수정시각) -> 파일 해시. 같은 파일을 반복해서 해싱하지 않도록 메모리에 보관합니다.
+        self._file_hashes: Dict[Tuple[str, int, int], str] = {}
+
+    @timed("cache hash")
+    def file_hash(self, input_path: str) -> str:
+        """암호화 파일 내용의 SHA-256 해시를 반환합니다. (경로·크기·수정시각 기준으로 메모)"""
+        stat = os.stat(input_path)
+        memo_key = (str(Path(input_path).resolve()), stat.st_size, stat.st_mtime_ns)
+        if memo_key not in self._file_hashes:
+            digest = hashlib.sha256()
+            with open(input_path, 'rb') as f:
+                while chunk := f.read(self._HASH_CHUNK):
+                    digest.update(chunk)
+                    report_progress("hash", len(chunk))
+            self._file_hashes[memo_key] = digest.hexdigest()
+        return self._file_hashes[memo_key]
+
+    def remember_file_hash(self, input_path: str, digest: str):
+        """다른 곳(Drive 로컬 사본 등)에서 이미 계산한 파일 해시를 등록해 다시 해싱하지 않게 합니다."""
+        stat = os.stat(input_path)
+        self._file_hashes[(str(Path(input_path).resolve()), stat.st_size, stat.st_mtime_ns)] = digest
+
+    def make_key(self, input_path: str, key_fingerprint: str, extractor_version: str) -> str:
+        """암호화 파일 해시, Key/IV 지문, 추출기(패턴/파서) 버전을 조합한 캐시 키를 만듭니다."""
+        file_hash = self.file_hash(input_path)
+        return hashlib.sha256(f"{file_hash}:{key_fingerprint}:{extractor_version}".encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self._SUFFIX}"
+
+    def _read_entry(self, entry: Path) -> Optional[Tuple[array, bytes]]:
+        with open(entry, 'rb') as f:
+            data = f.read()
+        if len(data) < self._HEADER.size:
+            return None
+        magic, count, blob_len, digest = self._HEADER.unpack_from(data)
+        payload = memoryview(data)[self._HEADER.size:]
+        index_len = (count + 1) * 8
+        if magic != self._MAGIC or len(payload) != index_len + blob_len:
+            return None
+        if hashlib.sha256(payload).digest() != digest:
+            return None
+        offsets = array('Q')
+        offsets.frombytes(payload[:index_len])
+        return offsets, bytes(payload[index_len:])
+
+    def _load(self, key: str) -> Optional[Tuple[array, bytes]]:
+        entry = self._entry_path(key)
+        if not entry.exists():
+            return None
+        try:
+            loaded = self._read_entry(entry)
+        except OSError as e:
+            logger.warning(f"캐시 파일을 읽지 못했습니다: '{entry.name}' ({e})")
+            return None
+        if loaded is None:
+            logger.warning(f"캐시 무결성 검사 실패, 항목을 삭제합니다: '{entry.name}'")
+            entry.unlink(missing_ok=True)
+            return None
+        # LRU 갱신: 수정 시각을 최근 사용 시각으로 사용합니다.
+        os.utime(entry)
+        return loaded
+
+    @timed("cache load")
+    def get(self, key: str) -> Optional[CompactPathSet]:
+        """캐시에 저장된 경로 Set을 반환합니다. 없거나 손상되었으면 None을 반환합니다.
+
+        저장된 blob이 이미 정렬되어 있으므로 경로별 str을 만들지 않고 바로 CompactPathSet으로 압축합니다.
+        """
+        loaded = self._load(key)
+        if loaded is None:
+            return None
+        offsets, blob = loaded
+        paths = CompactPathSet.from_sorted_blob(blob, len(offsets) - 1)
+        logger.info(f"✅ 캐시 적중: {len(paths):,}개의 경로를 불러왔습니다.")
+        return paths
+
+    @timed("cache store")
+    def put(self, key: str, paths: Iterable[str]):
+        """경로 목록을 정렬하여 캐시 파일로 저장한 뒤 용량 제한에 맞게 오래된 항목을 정리합니다."""
+        encoded = list(paths.iter_bytes()) if isinstance(paths, CompactPathSet) else sorted(p.encode('utf-8') for p in paths)
+        offsets = array('Q', [0])
+        for p in encoded:
+            offsets.append(offsets[-1] + len(p) + 1)
+        blob = b'\n'.join(encoded)
+        index = offsets.tobytes()
+        digest = hashlib.sha256(index + blob).digest()
+        header = self._HEADER.pack(self._MAGIC, len(encoded), len(blob), digest)
+
+        entry = self._entry_path(key)
+        tmp = entry.with_suffix('.tmp')
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(header)
+                f.write(index)
+                f.write(blob)
+            os.replace(tmp, entry)
+            logger.debug(f"캐시 저장 완료: '{entry.name}' ({len(encoded):,}개 경로)")
+        except OSError as e:
+            logger.warning(f"캐시 저장 실패: {e}")
+            tmp.unlink(missing_ok=True)
+            return
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for entry in self.cache_dir.glob(f"*{self._SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+            logger.debug(f"캐시 용량 초과로 항목을 삭제했습니다: '{entry.name}'")
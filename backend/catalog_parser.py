@@ -0,0 +1,204 @@
+# frida_asset_suite/backend/catalog_parser.py
+import json
+import base64
+import struct
+import logging
+from typing import List, Optional, Set
+import numpy as np
+from .instrumentation import timed
+
+logger = logging.getLogger('frida_asset_suite')
+
+# ContentCatalogData 의 m_EntryDataString 레코드 하나는 int32 7개로 구성됩니다.
+_ENTRY_FIELDS = 7
+(ENTRY_INTERNAL_ID, ENTRY_PROVIDER, ENTRY_DEPENDENCY_KEY, ENTRY_DEP_HASH,
+ ENTRY_DATA_INDEX, ENTRY_PRIMARY_KEY, ENTRY_RESOURCE_TYPE) = range(_ENTRY_FIELDS)
+
+class AddressablesCatalog:
+    """복호화된 Addressables content catalog(JSON)의 구조화된 표현입니다.
+
+    바이너리 테이블은 NumPy 배열로 보관합니다.
+    - entries: (엔트리 수, 7) int32 배열. 열 순서는 ENTRY_* 상수를 따릅니다.
+    - 버킷(키 → 엔트리 목록)은 CSR 형식: bucket_starts[i]:bucket_starts[i+1] 구간이 bucket_entries에서 키 i의 엔트리들입니다.
+    엔트리의 의존성(번들)은 ENTRY_DEPENDENCY_KEY 가 가리키는 키의 버킷입니다.
+    """
+    def __init__(self, internal_ids: List[str], provider_ids: List[str], key_data: bytes,
+                 bucket_data_offsets: np.ndarray, bucket_starts: np.ndarray, bucket_entries: np.ndarray,
+                 entries: np.ndarray):
+        self.internal_ids = internal_ids
+        self.provider_ids = provider_ids
+        self.key_data = key_data
+        self.bucket_data_offsets = bucket_data_offsets
+        self.bucket_starts = bucket_starts
+        self.bucket_entries = bucket_entries
+        self.entries = entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def key(self, key_index: int):
+        """키 하나를 필요할 때만 디코딩합니다. (문자열, 정수, Hash128 문자열 등)"""
+        return _decode_key(self.key_data, int(self.bucket_data_offsets[key_index]))
+
+    def bucket(self, key_index: int) -> np.ndarray:
+        return self.bucket_entries[self.bucket_starts[key_index]:self.bucket_starts[key_index + 1]]
+
+    def entry_dependencies(self) -> np.ndarray:
+        """(엔트리 번호, 의존 엔트리 번호) 쌍을 (N, 2) 배열로 한 번에 펼쳐 반환합니다."""
+        dep_keys = self.entries[:, ENTRY_DEPENDENCY_KEY]
+        owners = np.flatnonzero(dep_keys >= 0)
+        keys = dep_keys[owners]
+        starts = self.bucket_starts[keys]
+        counts = self.bucket_starts[keys + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            return np.empty((0, 2), dtype=np.int64)
+        # 가변 길이 구간들을 반복문 없이 이어 붙입니다.
+        run_starts = np.cumsum(counts) - counts
+        positions = np.repeat(starts - run_starts, counts) + np.arange(total)
+        return np.column_stack((np.repeat(owners, counts), self.bucket_entries[positions]))
+
+    def bundle_names(self, entry_index: int) -> List[str]:
+        dep_key = int(self.entries[entry_index, ENTRY_DEPENDENCY_KEY])
+        if dep_key < 0:
+            return []
+        return [self.internal_ids[self.entries[e, ENTRY_INTERNAL_ID]] for e in self.bucket(dep_key).tolist()]
+
+    def bundle_provider_mask(self) -> np.ndarray:
+        """엔트리별로 AssetBundle 제공자(=번들 자체)인지 여부를 담은 bool 배열을 반환합니다."""
+        is_bundle_provider = np.array(['AssetBundleProvider' in p for p in self.provider_ids] or [False], dtype=bool)
+        return is_bundle_provider[self.entries[:, ENTRY_PROVIDER]]
+
+    def asset_internal_ids(self) -> Set[str]:
+        """번들이 아닌 에셋 엔트리들의 내부 ID(Assets/ 외 경로 포함)를 반환합니다."""
+        id_indices = np.unique(self.entries[~self.bundle_provider_mask(), ENTRY_INTERNAL_ID])
+        return {self.internal_ids[i] for i in id_indices.tolist()}
+
+def _read_str(data: bytes, pos: int, length: int, encoding: str) -> str:
+    return data[pos:pos + length].decode(encoding)
+
+def _decode_key(data: bytes, pos: int):
+    key_type = data[pos]
+    pos += 1
+    if key_type == 0:  # ASCII 문자열
+        (length,) = struct.unpack_from('<i', data, pos)
+        return _read_str(data, pos + 4, length, 'ascii')
+    if key_type == 1:  # UTF-16 문자열
+        (length,) = struct.unpack_from('<i', data, pos)
+        return _read_str(data, pos + 4, length, 'utf-16-le')
+    if key_type == 2:
+        return struct.unpack_from('<H', data, pos)[0]
+    if key_type == 3:
+        return struct.unpack_from('<I', data, pos)[0]
+    if key_type == 4:
+        return struct.unpack_from('<i', data, pos)[0]
+    if key_type in (5, 6):  # Hash128 / Type 이름
+        return _read_str(data, pos + 1, data[pos], 'ascii')
+    if key_type == 7:  # JsonObject: 어셈블리명, 클래스명, JSON 본문
+        assembly_len = data[pos]
+        pos += 1 + assembly_len
+        class_len = data[pos]
+        class_name = _read_str(data, pos + 1, class_len, 'ascii')
+        pos += 1 + class_len
+        (length,) = struct.unpack_from('<i', data, pos)
+        return {"type": class_name, "json": _read_str(data, pos + 4, length, 'utf-16-le')}
+    raise ValueError(f"알 수 없는 키 타입: {key_type}")
+
+def _expand_internal_ids(internal_ids: List[str], prefixes: List[str]) -> List[str]:
+    """'번호#나머지' 형태로 접두사가 압축된 내부 ID를 m_InternalIdPrefixes로 복원합니다."""
+    if not prefixes:
+        return internal_ids
+    expanded = []
+    for internal_id in internal_ids:
+        head, sep, tail = internal_id.partition('#')
+        if sep and head.isdigit() and int(head) < len(prefixes):
+            internal_id = prefixes[int(head)] + tail
+        expanded.append(internal_id)
+    return expanded
+
+class CatalogParser:
+    # 파싱 결과가 달라지는 변경이 있을 때 올려서 처리 결과 캐시를 무효화합니다.
+    PARSER_VERSION = 1
+
+    @timed("parse")
+    def parse(self, content: bytes) -> Optional[AddressablesCatalog]:
+        """복호화된 카탈로그 JSON을 파싱합니다. 형식이 맞지 않으면 None을 반환합니다."""
+        try:
+            catalog = json.loads(content)
+            internal_ids = _expand_internal_ids(catalog['m_InternalIds'], catalog.get('m_InternalIdPrefixes') or [])
+            key_data = base64.b64decode(catalog['m_KeyDataString'])
+            bucket_data = base64.b64decode(catalog['m_BucketDataString'])
+            entry_data = base64.b64decode(catalog['m_EntryDataString'])
+        except (ValueError, KeyError, TypeError) as e:
+            logger.info(f"구조화된 카탈로그로 파싱할 수 없습니다: {type(e).__name__}: {e}")
+            return None
+
+        try:
+            entry_count = struct.unpack_from('<i', entry_data, 0)[0]
+            entries = np.frombuffer(entry_data, dtype='<i4', count=entry_count * _ENTRY_FIELDS,
+                                    offset=4).reshape(entry_count, _ENTRY_FIELDS)
+            bucket_data_offsets, bucket_starts, bucket_entries = self._parse_buckets(bucket_data)
+            self._check_bounds(entries, len(internal_ids), max(1, len(catalog.get('m_ProviderIds', []))),
+                               len(bucket_data_offsets), bucket_entries)
+        except (ValueError, IndexError, struct.error) as e:
+            logger.warning(f"카탈로그 바이너리 테이블 파싱 실패: {e}")
+            return None
+
+        logger.info(f"✅ 카탈로그 파싱 성공: 내부 ID {len(internal_ids):,}개, 엔트리 {entry_count:,}개, 키 {len(bucket_data_offsets):,}개")
+        return AddressablesCatalog(internal_ids, catalog.get('m_ProviderIds', []), key_data,
+                                   bucket_data_offsets, bucket_starts, bucket_entries, entries)
+
+    @staticmethod
+    def _check_bounds(entries: np.ndarray, id_count: int, provider_count: int, bucket_count: int,
+                      bucket_entries: np.ndarray):
+        """엔트리/버킷 테이블의 인덱스가 모두 범위 안에 있는지 확인합니다. 벗어나면 ValueError를 발생시킵니다.
+
+        여기서 걸러 두면 asset_internal_ids(), entry_dependencies(), bundle_names()가 IndexError를 내거나
+        음수 인덱스로 엉뚱한 항목을 읽지 않습니다. (의존성 키는 음수 = 의존성 없음)
+        """
+        if len(entries):
+            for column, limit in ((ENTRY_INTERNAL_ID, id_count), (ENTRY_PROVIDER, provider_count)):
+                values = entries[:, column]
+                if values.min() < 0 or values.max() >= limit:
+                    raise ValueError("엔트리가 범위를 벗어난 인덱스를 참조합니다.")
+            if entries[:, ENTRY_DEPENDENCY_KEY].max() >= bucket_count:
+                raise ValueError("엔트리의 의존성 키가 버킷 수를 벗어납니다.")
+        if len(bucket_entries) and (bucket_entries.min() < 0 or bucket_entries.max() >= len(entries)):
+            raise ValueError("버킷이 범위를 벗어난 엔트리를 참조합니다.")
+
+    def _parse_buckets(self, bucket_data: bytes):
+        """[count][dataOffset, entryCount, entries...]* 형식의 버킷 테이블을 CSR 배열로 변환합니다.
+
+        버킷 길이가 가변이라 각 헤더 위치는 앞 버킷들의 길이에 달려 있습니다. 모든 위치 p에 대해 'p가 헤더라면 다음 헤더
+        위치'를 한 번에 계산한 뒤, 포인터 점프(2^k번째 뒤 헤더를 단계마다 두 배로)로 헤더 위치를 log2(버킷 수)번의 배열
+        연산으로 모두 찾습니다.
+        """
+        ints = np.frombuffer(bucket_data, dtype='<i4', count=len(bucket_data) // 4)
+        bucket_count, n = int(ints[0]), len(ints)
+        if bucket_count < 0:
+            raise ValueError("버킷 수가 음수입니다.")
+        following = np.arange(2, n + 2, dtype=np.int64)
+        following[:-1] += ints[1:]
+        jump = np.append(np.clip(following, 0, n), n).astype(np.int32) # 테이블 밖은 n으로 모읍니다.
+        header_positions = np.ones(min(bucket_count, 1), dtype=np.int32)
+        spare = np.empty_like(jump)
+        while len(header_positions) < bucket_count:
+            # header_positions는 처음 2^k개 헤더 위치, jump[p]는 p에서 2^k번째 뒤 헤더 위치입니다.
+            ahead = jump[header_positions[:bucket_count - len(header_positions)]]
+            header_positions = np.concatenate((header_positions, ahead))
+            if len(header_positions) < bucket_count:
+                jump, spare = np.take(jump, jump, out=spare), jump
+        header_positions = header_positions.astype(np.int64)
+        if bucket_count and header_positions.max() >= n - 1:
+            raise ValueError("버킷 테이블이 잘려 있습니다.")
+        data_offsets = ints[header_positions].astype(np.int64)
+        counts = ints[header_positions + 1].astype(np.int64)
+        if (counts < 0).any():
+            raise ValueError("버킷의 엔트리 수가 음수입니다.")
+        if bucket_count and header_positions[-1] + 2 + counts[-1] > n:
+            raise ValueError("버킷 테이블이 잘려 있습니다.")
+        bucket_starts = np.concatenate(([0], np.cumsum(counts)))
+        total = int(bucket_starts[-1])
+        first = np.repeat(header_positions + 2 - bucket_starts[:-1], counts)
+        bucket_entries = ints[first + np.arange(total)].astype(np.int64)
+        return data_offsets, bucket_starts, bucket_entries
@@ -1,51 +1,175 @@
 # frida_asset_suite/backend/data_models.py
+import re
+import os
+import csv
+import time
 import logging
-import pandas as pd
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Collection, Dict, Iterable, List, Optional, Set, Tuple
 
 logger = logging.getLogger('frida_asset_suite')
 
 class CharacterManager:
-    def __init__(self, csv_path: str):
+    """character_info.csv를 읽어 코드/이름/부대 조회표와 코드 매처를 미리 만들어 둡니다.
+
+    CSV는 표준 csv 모듈로 읽으며, refresh()가 호출될 때(최대 reload_interval초마다 한 번) 파일의
+    (수정 시각, 크기)를 확인하여 바뀌었으면 다시 읽습니다. 다시 읽을 때마다 version이 1씩 증가합니다.
+    """
+    REQUIRED_COLUMNS = ('게임코드', '캐릭터명(K)', '소속 부대')
+
+    def __init__(self, csv_path: str, reload_interval: float = 2.0):
         self.csv_path = Path(csv_path)
+        self.reload_interval = reload_interval
+        self.version = 0
         self.char_data: Dict[str, Dict] = {} # { "게임코드": {"name": "캐릭터명", "squad": "부대"} }
         self.squad_data: Dict[str, List[str]] = {} # { "부대": ["캐릭터명1", "캐릭터명2"] }
-        self._load_data()
+        self._codes_by_squad: Dict[str, Set[str]] = {} # { "부대": {"게임코드", ...} }
+        self._codes_by_name: Dict[str, Set[str]] = {} # { "캐릭터명": {"게임코드", ...} }
+        self._squad_list: List[str] = []
+        self._all_names: List[str] = []
+        self._code_pattern: Optional[re.Pattern] = None
+        self._codes_by_token: Dict[str, List[str]] = {} # { "소문자 코드": ["게임코드", ...] } (CSV 순서)
+        self._code_rank: Dict[str, int] = {} # { "게임코드": CSV 내 순서 }
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._checked_at = 0.0
+        self._reload_lock = threading.Lock()
+        self.refresh(force=True)
 
-    def _load_data(self):
-        if not self.csv_path.exists():
-            logger.error(f"캐릭터 정보 파일을 찾을 수 없습니다: {self.csv_path}")
-            return
-        
+    def refresh(self, force: bool = False) -> bool:
+        """CSV 파일이 바뀌었으면 다시 읽고 True를 반환합니다. 읽기에 실패하면 기존 데이터를 유지합니다."""
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.reload_interval:
+            return False
+        self._checked_at = now
         try:
-            df = pd.read_csv(self.csv_path, encoding='utf-8-sig')
-            # 필수 컬럼 확인
-            required_cols = ['게임코드', '캐릭터명(K)', '소속 부대']
-            if not all(col in df.columns for col in required_cols):
-                logger.error(f"CSV 파일에 필수 컬럼({required_cols})이 없습니다.")
-                return
-
-            for _, row in df.iterrows():
-                code = row['게임코드']
-                name = row['캐릭터명(K)']
-                squad = row['소속 부대']
-                
-                self.char_data[code] = {'name': name, 'squad': squad}
-                if squad not in self.squad_data:
-                    self.squad_data[squad] = []
-                self.squad_data[squad].append(name)
-            
-            logger.info(f"✅ 캐릭터 정보 로드 완료: {len(self.char_data)}명, {len(self.squad_data)}개 부대")
-        except Exception as e:
+            stat = os.stat(self.csv_path)
+        except OSError:
+            if force:
+                logger.error(f"캐릭터 정보 파일을 찾을 수 없습니다: {self.csv_path}")
+            return False
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._reload_lock:
+            if stamp == self._stamp:
+                return False
+            # 잘못된 파일을 매번 다시 읽지 않도록 실패해도 지문은 기록합니다.
+            self._stamp = stamp
+            rows = self._read_rows()
+            if rows is None:
+                return False
+            self._apply(rows)
+            self.version += 1
+        logger.info(f"✅ 캐릭터 정보 로드 완료: {len(self.char_data)}명, {len(self.squad_data)}개 부대"
+                    + (" (파일 변경 감지)" if self.version > 1 else ""))
+        return True
+
+    def _read_rows(self) -> Optional[List[Tuple[str, str, str]]]:
+        """CSV에서 (게임코드, 캐릭터명, 부대) 행을 읽습니다. 실패 시 None을 반환합니다."""
+        try:
+            with open(self.csv_path, encoding='utf-8-sig', newline='') as f:
+                reader = csv.DictReader(f)
+                # 필수 컬럼 확인
+                if not all(col in (reader.fieldnames or ()) for col in self.REQUIRED_COLUMNS):
+                    logger.error(f"CSV 파일에 필수 컬럼({list(self.REQUIRED_COLUMNS)})이 없습니다.")
+                    return None
+                code_col, name_col, squad_col = self.REQUIRED_COLUMNS
+                return [(row[code_col].strip(), row[name_col].strip(), row[squad_col].strip())
+                        for row in reader if row[code_col] and row[code_col].strip()]
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
             logger.error(f"캐릭터 CSV 파일 처리 중 오류 발생: {e}", exc_info=True)
+            return None
+
+    def _apply(self, rows: List[Tuple[str, str, str]]):
+        """읽은 행으로 조회표와 코드 매처를 새로 만든 뒤 한꺼번에 교체합니다."""
+        char_data: Dict[str, Dict] = {}
+        squad_data: Dict[str, List[str]] = {}
+        codes_by_squad: Dict[str, Set[str]] = {}
+        codes_by_name: Dict[str, Set[str]] = {}
+        for code, name, squad in rows:
+            char_data[code] = {'name': name, 'squad': squad}
+            squad_data.setdefault(squad, []).append(name)
+            codes_by_squad.setdefault(squad, set()).add(code)
+            codes_by_name.setdefault(name, set()).add(code)
+        pattern, codes_by_token, code_rank = self._build_code_matcher(char_data)
+
+        self.char_data, self.squad_data = char_data, squad_data
+        self._codes_by_squad, self._codes_by_name = codes_by_squad, codes_by_name
+        self._squad_list = sorted(squad_data)
+        self._all_names = sorted(info['name'] for info in char_data.values())
+        self._code_pattern, self._codes_by_token, self._code_rank = pattern, codes_by_token, code_rank
+
+    @staticmethod
+    def _build_code_matcher(char_data: Dict[str, Dict]) -> Tuple[Optional[re.Pattern], Dict[str, List[str]], Dict[str, int]]:
+        """모든 캐릭터 코드의 '_code_' / '/code/' 토큰을 한 번에 찾는 정규표현식을 만듭니다."""
+        codes_by_token: Dict[str, List[str]] = {}
+        for code in char_data:
+            codes_by_token.setdefault(str(code).lower(), []).append(code)
+        if not codes_by_token:
+            return None, {}, {}
+        code_rank = {code: i for i, code in enumerate(char_data)}
+        alternation = "|".join(re.escape(t) for t in sorted(codes_by_token, key=len, reverse=True))
+        # 뒤쪽 구분자는 lookahead로 검사하여 '_a_b_'처럼 구분자를 공유하는 토큰도 모두 찾습니다.
+        return re.compile(f"_({alternation})(?=_)|/({alternation})(?=/)"), codes_by_token, code_rank
+
+    def allowed_codes(self, squads: Optional[Collection[str]], characters: Optional[Collection[str]]) -> Optional[Set[str]]:
+        """부대/캐릭터 필터를 모두 만족하는 캐릭터 코드 집합. 필터가 없으면 None을 반환합니다."""
+        self.refresh()
+        if not squads and not characters:
+            return None
+        allowed: Optional[Set[str]] = None
+        if squads:
+            allowed = set().union(*(self._codes_by_squad.get(s, ()) for s in squads))
+        if characters:
+            by_name = set().union(*(self._codes_by_name.get(n, ()) for n in characters))
+            allowed = by_name if allowed is None else allowed & by_name
+        return allowed
+
+    def match_character(self, path: str, allowed_codes: Optional[Collection[str]] = None) -> Optional[str]:
+        """경로에 포함된 캐릭터 코드 중 CSV 순서상 가장 먼저 오는 코드를 반환합니다.
+
+        allowed_codes가 주어지면 그 안의 코드만 대상으로 합니다. 해당하는 코드가 없으면 None을 반환합니다.
+        """
+        # 다시 읽기와 겹쳐도 한 번의 호출 안에서는 같은 매처를 사용합니다.
+        pattern, codes_by_token, code_rank = self._code_pattern, self._codes_by_token, self._code_rank
+        if pattern is None:
+            return None
+        best, best_rank = None, len(code_rank)
+        for m in pattern.finditer(path.lower()):
+            for code in codes_by_token[m.group(1) or m.group(2)]:
+                rank = code_rank[code]
+                if rank < best_rank and (allowed_codes is None or code in allowed_codes):
+                    best, best_rank = code, rank
+        return best
+
+    def first_character(self, codes: Iterable[str], allowed_codes: Optional[Collection[str]] = None) -> Optional[str]:
+        """codes 중 CSV 순서상 가장 먼저 오는 알려진 코드를 반환합니다. (match_character와 같은 우선순위)
+
+        이미 분류된 코드 목록(이력 저장소 등)에서 대표 캐릭터를 고를 때 사용합니다. 해당하는 코드가 없으면 None을 반환합니다.
+        """
+        code_rank = self._code_rank
+        best, best_rank = None, len(code_rank)
+        for code in codes:
+            rank = code_rank.get(code, best_rank)
+            if rank < best_rank and (allowed_codes is None or code in allowed_codes):
+                best, best_rank = code, rank
+        return best
+
+    def match_characters(self, path: str) -> List[str]:
+        """경로에 포함된 모든 캐릭터 코드를 CSV 순서대로 반환합니다. (필터와 무관한 사전 분류용)"""
+        pattern, codes_by_token, code_rank = self._code_pattern, self._codes_by_token, self._code_rank
+        if pattern is None:
+            return []
+        codes = {code for m in pattern.finditer(path.lower()) for code in codes_by_token[m.group(1) or m.group(2)]}
+        return sorted(codes, key=code_rank.__getitem__)
 
     def get_squad_list(self) -> List[str]:
-        return sorted(list(self.squad_data.keys()))
+        self.refresh()
+        return list(self._squad_list)
 
     def get_characters_by_squad(self, squads: Optional[List[str]] = None) -> List[str]:
+        self.refresh()
         if not squads: # None 이거나 빈 리스트일 경우
-            return sorted([info['name'] for info in self.char_data.values()])
+            return list(self._all_names)
         
         char_list = []
         for squad in squads:
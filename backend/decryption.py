@@ -1,13 +1,27 @@
 # frida_asset_suite/backend/decryption.py
 import gzip
+import hashlib
+import os
+import re
+import zlib
 import logging
 from pathlib import Path
-from Crypto.Cipher import AES
-from Crypto.Util.Padding import unpad
+from typing import Dict, Iterator, List, Optional, Tuple
+from .instrumentation import report_progress, stage, timed
 
 # 전역 로거 대신, 이 모듈의 이름을 사용하는 로거를 가져옵니다.
 logger = logging.getLogger('frida_asset_suite')
 
+# 스트리밍 처리 시 한 번에 읽어들이는 암호문 크기 (1 MiB)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# GZip 헤더: ID1 ID2 CM(8=deflate) FLG MTIME(4) XFL OS
+_GZIP_MAGIC = b'\x1f\x8b\x08'
+# 키 판별 결과를 기억할 때 사용하는 파일 앞부분 크기
+_PROBE_HASH_BYTES = 64 * 1024
+_AES_BLOCK_SIZE = 16
+# pycryptodome(Crypto)은 앱/CLI 시작 시간을 줄이기 위해 실제로 복호화하는 메서드 안에서 불러옵니다.
+
 class CatalogDecryptor:
     def __init__(self, key_hex: str, iv_hex: str):
         try:
@@ -18,6 +32,83 @@ class CatalogDecryptor:
             logger.critical(f"AES Key/IV 초기화 실패! 16진수 문자열이 올바른지 확인하세요: {e}")
             raise
 
+    def probe(self, head: bytes) -> bool:
+        """암호문 첫 블록만 복호화하여 GZip 헤더가 나오는지로 Key/IV가 맞는지 빠르게 판별합니다."""
+        if len(head) < _AES_BLOCK_SIZE:
+            return False
+        from Crypto.Cipher import AES
+        block = AES.new(self.key, AES.MODE_CBC, self.iv).decrypt(head[:_AES_BLOCK_SIZE])
+        flags, os_byte = block[3], block[9]
+        return block.startswith(_GZIP_MAGIC) and not flags & 0xE0 and (os_byte <= 13 or os_byte == 255)
+
+    @property
+    def fingerprint(self) -> str:
+        """Key/IV를 노출하지 않고 구분할 수 있는 짧은 지문을 반환합니다. (캐시 키 등에 사용)"""
+        return hashlib.sha256(self.key + self.iv).hexdigest()[:16]
+
+    def iter_decrypted_blocks(self, input_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """암호화된 파일을 청크 단위로 AES-CBC 복호화하여 패딩이 제거된 GZip 데이터를 순서대로 내보냅니다.
+
+        마지막 블록은 다음 청크가 없다는 것이 확인될 때까지 보류하였다가 unpad 합니다.
+        """
+        from Crypto.Cipher import AES
+        from Crypto.Util.Padding import unpad
+        cipher = AES.new(self.key, AES.MODE_CBC, self.iv)
+        block_size = _AES_BLOCK_SIZE
+        held = b""
+        with open(input_path, 'rb') as f:
+            while True:
+                with stage("read", sample_rss=False) as s:
+                    chunk = f.read(chunk_size)
+                    s.bytes_out = len(chunk)
+                if not chunk:
+                    break
+                report_progress("decrypt", len(chunk))
+                data = held + chunk
+                # 최소 한 블록(또는 블록 크기에 못 미치는 나머지)은 항상 남겨둡니다.
+                usable = ((len(data) - 1) // block_size) * block_size
+                held = data[usable:]
+                if usable:
+                    with stage("decrypt", usable, sample_rss=False) as s:
+                        plain = cipher.decrypt(data[:usable])
+                        s.bytes_out = usable
+                    yield plain
+
+        if not held or len(held) % block_size:
+            raise ValueError("암호문 길이가 AES 블록 크기의 배수가 아닙니다.")
+        with stage("decrypt", len(held), sample_rss=False) as s:
+            plain = cipher.decrypt(held)
+            s.bytes_out = len(plain)
+        with stage("unpad", len(plain)) as s:
+            last = unpad(plain, block_size)
+            s.bytes_out = len(last)
+        if last:
+            yield last
+
+    def iter_decompressed_chunks(self, input_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """복호화 스트림을 zlib으로 점진적으로 GZip 해제하여 원본 바이너리를 청크 단위로 내보냅니다."""
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        for block in self.iter_decrypted_blocks(input_path, chunk_size):
+            while block:
+                # 압축률이 높은 데이터도 한 번에 chunk_size 이상 풀어내지 않도록 제한합니다.
+                with stage("gunzip", len(block), sample_rss=False) as s:
+                    out = decompressor.decompress(block, chunk_size)
+                    s.bytes_in -= len(decompressor.unconsumed_tail)
+                    s.bytes_out = len(out)
+                if out:
+                    report_progress("gunzip", len(out))
+                    yield out
+                block = decompressor.unconsumed_tail
+                if decompressor.eof and decompressor.unused_data:
+                    # 여러 개의 GZip 멤버가 이어 붙은 경우 gzip.decompress와 동일하게 계속 해제합니다.
+                    block = decompressor.unused_data
+                    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        tail = decompressor.flush()
+        if tail:
+            yield tail
+        if not decompressor.eof:
+            raise zlib.error("GZip 스트림이 끝나기 전에 데이터가 종료되었습니다.")
+
     def decrypt_file(self, input_path: str, output_path: str) -> bool:
         """암호화된 카탈로그 파일을 복호화하여 GZip 압축 해제된 바이너리 파일로 저장합니다."""
         input_p = Path(input_path)
@@ -25,23 +116,13 @@ class CatalogDecryptor:
         
         try:
             logger.info(f"'{input_p.name}' 파일 복호화를 시작합니다 -> '{output_p.name}'")
-            
-            logger.debug("1/4: 암호화된 파일 읽기...")
-            with open(input_p, 'rb') as f:
-                encrypted_data = f.read()
-
-            logger.debug("2/4: AES 복호화 수행...")
-            cipher = AES.new(self.key, AES.MODE_CBC, self.iv)
-            decrypted_padded_data = cipher.decrypt(encrypted_data)
-            gzipped_data = unpad(decrypted_padded_data, AES.block_size)
-
-            logger.debug("3/4: GZip 압축 해제 수행...")
-            final_data_bytes = gzip.decompress(gzipped_data)
 
-            logger.debug("4/4: 복호화된 바이너리 파일 저장...")
+            logger.debug("1/2: 청크 단위 복호화 및 GZip 압축 해제 수행...")
             with open(output_p, 'wb') as f:
-                f.write(final_data_bytes)
-                
+                for chunk in self.iter_decompressed_chunks(str(input_p)):
+                    f.write(chunk)
+
+            logger.debug("2/2: 복호화된 바이너리 파일 저장 완료")
             logger.info(f"✅ 복호화 성공: '{output_p.name}'")
             return True
 
@@ -49,9 +130,68 @@ class CatalogDecryptor:
             logger.error(f"[복호화 실패] 입력 파일을 찾을 수 없습니다: '{input_path}'")
         except (ValueError, KeyError) as e:
             logger.error(f"[복호화 실패] 패딩 또는 키 오류. Key/IV 또는 파일이 올바른지 확인하세요. 오류: {e}")
-        except gzip.BadGzipFile:
+        except (gzip.BadGzipFile, zlib.error):
             logger.error("[복호화 실패] GZip 압축 해제 실패. 데이터가 손상되었거나 형식이 다를 수 있습니다.")
         except Exception as e:
             logger.error(f"[복호화 실패] 알 수 없는 오류가 발생했습니다: {e}", exc_info=True)
-            
-        return False
\ No newline at end of file
+
+        if output_p.exists():
+            output_p.unlink()
+        return False
+
+def file_probe_key(input_path: str) -> Tuple[int, str]:
+    """파일 전체를 읽지 않고 암호화 카탈로그를 구분하는 키: (파일 크기, 앞부분 + 마지막 암호 블록의 SHA-256).
+
+    CBC 모드의 마지막 암호 블록은 평문 전체에 따라 달라지므로, 같은 Key/IV로 암호화한 카탈로그는 이 키로 내용까지 구분됩니다.
+    (파일 전체 해시보다 약하므로 결과를 공유하기 전에는 전체 해시로 확인해야 합니다)
+    """
+    size = os.path.getsize(input_path)
+    with open(input_path, 'rb') as f:
+        head = f.read(_PROBE_HASH_BYTES)
+        f.seek(max(size - _AES_BLOCK_SIZE, 0))
+        tail = f.read(_AES_BLOCK_SIZE)
+    return size, hashlib.sha256(head + tail).hexdigest()
+
+def parse_keyring(text: str) -> List[Tuple[str, str]]:
+    """'KEY_HEX:IV_HEX' 항목들을 쉼표/공백/줄바꿈으로 구분한 문자열을 (key_hex, iv_hex) 목록으로 변환합니다."""
+    pairs = []
+    for item in re.split(r'[\s,;]+', text or ''):
+        if not item:
+            continue
+        key_hex, sep, iv_hex = item.partition(':')
+        if not sep:
+            raise ValueError(f"키링 항목은 'KEY_HEX:IV_HEX' 형식이어야 합니다: '{item[:8]}...'")
+        pairs.append((key_hex, iv_hex))
+    return pairs
+
+class CatalogKeyRing:
+    """여러 Key/IV 후보 중 카탈로그 파일에 맞는 복호화기를 첫 블록 복호화만으로 골라냅니다.
+
+    판별 결과는 (파일 크기, 앞부분 해시) 기준으로 기억하여 같은 파일은 다시 판별하지 않습니다.
+    """
+    def __init__(self, decryptors: List[CatalogDecryptor]):
+        self.decryptors = decryptors
+        self._matches: Dict[Tuple[int, str], int] = {}
+        logger.debug(f"키링 초기화 완료: 후보 {len(self.decryptors)}개")
+
+    @classmethod
+    def from_pairs(cls, key_iv_pairs: List[Tuple[str, str]]) -> 'CatalogKeyRing':
+        return cls([CatalogDecryptor(key_hex, iv_hex) for key_hex, iv_hex in key_iv_pairs])
+
+    @timed("key probe")
+    def select(self, input_path: str) -> Optional[CatalogDecryptor]:
+        """파일에 맞는 복호화기를 반환합니다. 맞는 키가 없으면 None을 반환합니다. (파일이 없으면 FileNotFoundError)"""
+        with open(input_path, 'rb') as f:
+            head = f.read(_PROBE_HASH_BYTES)
+        memo_key = (os.path.getsize(input_path), hashlib.sha256(head).hexdigest())
+        if memo_key in self._matches:
+            return self.decryptors[self._matches[memo_key]]
+
+        # 후보당 AES 블록 하나만 복호화하므로 순차 판별로도 충분히 빠릅니다.
+        for i, decryptor in enumerate(self.decryptors):
+            if decryptor.probe(head):
+                self._matches[memo_key] = i
+                logger.info(f"'{Path(input_path).name}'에 맞는 키를 찾았습니다: 후보 #{i + 1} ({decryptor.fingerprint})")
+                return decryptor
+        logger.error(f"[복호화 실패] '{Path(input_path).name}'에 맞는 Key/IV 후보가 없습니다. (후보 {len(self.decryptors)}개 확인)")
+        return None
@@ -0,0 +1,308 @@
+# frida_asset_suite/backend/drive_staging.py
+import os
+import json
+import time
+import queue
+import fnmatch
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger('frida_asset_suite')
+
+class DriveCatalogStager:
+    """Google Drive(FUSE 마운트)의 카탈로그를 로컬 디스크로 복사(staging)해 두고 로컬 사본만 읽게 합니다.
+
+    - 폴더 목록은 폴더 수정 시각이 바뀌었거나 listing_ttl이 지났을 때만 다시 읽습니다.
+    - 목록에 새로 보이거나 바뀐(크기/수정 시각) 파일은 백그라운드 스레드가 미리 복사합니다.
+      최신 파일부터 max_bytes 안에 들어가는 만큼만 복사하여, 미리 복사한 사본끼리 서로를 밀어내지 않게 합니다.
+    - 복사하면서 SHA-256을 계산해 매니페스트에 기록하고, 이전 세션의 사본은 처음 사용할 때 해시로 검증합니다.
+    - 로컬 사본 총량이 max_bytes를 넘으면 오래 사용하지 않은 사본부터 삭제합니다. pinned()로 사용 중인 사본은 삭제하지 않습니다.
+    """
+    _MANIFEST_NAME = "staging_manifest.json"
+    _COPY_CHUNK = 8 << 20
+
+    def __init__(self, source_dir: Path, staging_dir: Path, max_bytes: int, listing_ttl: float = 30.0):
+        self.source_dir = Path(source_dir)
+        self.staging_dir = Path(staging_dir)
+        self.max_bytes = max_bytes
+        self.listing_ttl = listing_ttl
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock() # 매니페스트와 목록 캐시 보호
+        self._file_locks: Dict[str, threading.Lock] = {}
+        # 패턴 -> (폴더 수정 시각, 읽은 시각, [(이름, 크기, 수정 시각)])
+        self._listings: Dict[str, Tuple[int, float, List[Tuple[str, int, int]]]] = {}
+        self._verified: set = set() # 이번 프로세스에서 해시 검증을 마친 사본 이름
+        self._pins: Dict[str, int] = {} # 사용 중인 사본 이름 -> 사용 수 (용량 정리에서 제외)
+        self._manifest: Dict[str, Dict] = self._load_manifest()
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._queued: set = set()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+    # --- 매니페스트 ---
+
+    def _manifest_path(self) -> Path:
+        return self.staging_dir / self._MANIFEST_NAME
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        try:
+            return json.loads(self._manifest_path().read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self):
+        tmp = self._manifest_path().with_suffix('.tmp')
+        tmp.write_text(json.dumps(self._manifest, ensure_ascii=False, indent=1), encoding='utf-8')
+        os.replace(tmp, self._manifest_path())
+
+    def _local(self, name: str) -> Path:
+        return self.staging_dir / name
+
+    # --- 목록 ---
+
+    def list_catalogs(self, pattern: str = "*.json") -> List[str]:
+        """Drive 폴더의 카탈로그 이름 목록(정렬)을 반환하고, 아직 복사되지 않은 파일을 미리 복사하도록 예약합니다."""
+        try:
+            dir_mtime = os.stat(self.source_dir).st_mtime_ns
+        except OSError:
+            return []
+        with self._lock:
+            cached = self._listings.get(pattern)
+        if cached and cached[0] == dir_mtime and time.monotonic() - cached[1] < self.listing_ttl:
+            return [name for name, _, _ in cached[2]]
+
+        entries = []
+        try:
+            with os.scandir(self.source_dir) as it:
+                for entry in it:
+                    if entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
+                        stat = entry.stat()
+                        entries.append((entry.name, stat.st_size, stat.st_mtime_ns))
+        except OSError as e:
+            logger.warning(f"Drive 카탈로그 폴더를 읽지 못했습니다: {e}")
+            return [name for name, _, _ in cached[2]] if cached else []
+        entries.sort()
+        with self._lock:
+            self._listings[pattern] = (dir_mtime, time.monotonic(), entries)
+        self.prefetch(self._prefetch_candidates(entries))
+        return [name for name, _, _ in entries]
+
+    def _prefetch_candidates(self, entries: List[Tuple[str, int, int]]) -> List[str]:
+        """최신 파일부터 로컬 사본 용량(max_bytes)에 들어가는 만큼 고른 뒤, 그중 아직 복사되지 않은 파일 이름을 반환합니다."""
+        budget = self.max_bytes
+        names = []
+        for name, size, mtime_ns in sorted(entries, key=lambda entry: entry[2], reverse=True):
+            if size > budget:
+                break
+            budget -= size
+            if not self._is_staged(name, size, mtime_ns):
+                names.append(name)
+        return names
+
+    def _is_staged(self, name: str, size: int, mtime_ns: int) -> bool:
+        with self._lock:
+            record = self._manifest.get(name)
+        if not record or record["size"] != size or record["mtime_ns"] != mtime_ns:
+            return False
+        try:
+            return os.stat(self._local(name)).st_size == size
+        except OSError:
+            return False
+
+    # --- 백그라운드 미리 복사 ---
+
+    def prefetch(self, names: List[str]):
+        """이름들을 백그라운드 복사 대기열에 넣습니다. shutdown() 이후에는 아무것도 하지 않습니다."""
+        with self._lock:
+            if self._closed:
+                return
+            fresh = [name for name in names if name not in self._queued]
+            self._queued.update(fresh)
+            if fresh and (self._worker is None or not self._worker.is_alive()):
+                self._worker = threading.Thread(target=self._run_worker, name="drive-prefetch", daemon=True)
+                self._worker.start()
+        for name in fresh:
+            self._queue.put(name)
+        if fresh:
+            logger.info(f"Drive 카탈로그 {len(fresh)}개를 로컬 디스크로 미리 복사합니다.")
+
+    def _run_worker(self):
+        while True:
+            name = self._queue.get()
+            if name is None: # shutdown() 신호
+                return
+            try:
+                self.stage(name)
+            except Exception as e:
+                logger.warning(f"Drive 카탈로그 미리 복사 실패 ('{name}'): {e}")
+            finally:
+                with self._lock:
+                    self._queued.discard(name)
+
+    def shutdown(self, timeout: Optional[float] = None):
+        """백그라운드 복사를 멈추고 스레드가 끝날 때까지 기다립니다. 대기 중인 복사는 취소되고, 진행 중인 복사는 끝까지 마칩니다."""
+        with self._lock:
+            self._closed = True
+            worker = self._worker
+        while True:
+            try:
+                name = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._queued.discard(name)
+        if worker is not None and worker.is_alive():
+            self._queue.put(None)
+            worker.join(timeout)
+
+    # --- 복사 ---
+
+    def _file_lock(self, name: str) -> threading.Lock:
+        with self._lock:
+            return self._file_locks.setdefault(name, threading.Lock())
+
+    def _hash_local(self, local: Path) -> str:
+        digest = hashlib.sha256()
+        with open(local, 'rb') as f:
+            while chunk := f.read(self._COPY_CHUNK):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _copy(self, name: str, source: Path) -> Optional[Dict]:
+        """Drive에서 로컬로 복사하면서 SHA-256을 계산합니다. 복사 도중 원본이 바뀌면 None을 반환합니다."""
+        before = os.stat(source)
+        local = self._local(name)
+        tmp = local.with_name(local.name + ".part")
+        digest = hashlib.sha256()
+        started = time.perf_counter()
+        try:
+            with open(source, 'rb') as src, open(tmp, 'wb') as dst:
+                while chunk := src.read(self._COPY_CHUNK):
+                    digest.update(chunk)
+                    dst.write(chunk)
+            after = os.stat(source)
+            if (after.st_size, after.st_mtime_ns) != (before.st_size, before.st_mtime_ns) or tmp.stat().st_size != after.st_size:
+                logger.warning(f"복사 중 Drive 원본이 변경되었습니다: '{name}'")
+                tmp.unlink(missing_ok=True)
+                return None
+            # 원본 수정 시각을 그대로 옮겨 다시 복사하더라도 로컬 사본이 원본과 같은 (크기, 수정 시각) 지문을 갖게 합니다.
+            os.utime(tmp, ns=(after.st_atime_ns, after.st_mtime_ns))
+            os.replace(tmp, local)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            raise
+        elapsed = time.perf_counter() - started
+        logger.info(f"Drive → 로컬 복사 완료: '{name}' ({after.st_size / 2**20:.1f} MiB, {elapsed:.1f}s)")
+        return {"size": after.st_size, "mtime_ns": after.st_mtime_ns, "sha256": digest.hexdigest(), "last_used": time.time()}
+
+    def stage(self, name: str) -> Optional[Path]:
+        """카탈로그의 검증된 로컬 사본 경로를 반환합니다. 필요하면 지금 복사하며, 실패하면 None을 반환합니다."""
+        source = self.source_dir / name
+        with self._file_lock(name):
+            try:
+                stat = os.stat(source)
+            except OSError:
+                logger.error(f"Drive에서 카탈로그를 찾을 수 없습니다: '{name}'")
+                return None
+            if self._is_staged(name, stat.st_size, stat.st_mtime_ns) and self._verify(name):
+                # 사용 시각은 메모리에서만 갱신하고 다음 복사/정리 때 매니페스트와 함께 저장합니다.
+                with self._lock:
+                    self._manifest[name]["last_used"] = time.time()
+                return self._local(name)
+            try:
+                record = self._copy(name, source)
+            except OSError as e:
+                logger.error(f"Drive 카탈로그 복사 실패 ('{name}'): {e}")
+                return None
+            if record is None:
+                return None
+            with self._lock:
+                self._manifest[name] = record
+                self._verified.add(name)
+                self._save_manifest()
+        self._evict(keep=name)
+        return self._local(name)
+
+    def _verify(self, name: str) -> bool:
+        """이전 세션에 복사된 사본은 이번 프로세스에서 처음 쓸 때 한 번 해시를 확인합니다."""
+        if name in self._verified:
+            return True
+        with self._lock:
+            expected = self._manifest[name]["sha256"]
+        if self._hash_local(self._local(name)) != expected:
+            logger.warning(f"로컬 사본 해시 불일치, 다시 복사합니다: '{name}'")
+            return False
+        self._verified.add(name)
+        return True
+
+    def local_path(self, name: str) -> Path:
+        """분석에 사용할 경로. 로컬 사본을 만들 수 없으면 Drive 원본 경로를 반환합니다."""
+        staged = self.stage(name)
+        if staged is None:
+            logger.warning(f"로컬 사본 없이 Drive에서 직접 읽습니다: '{name}'")
+            return self.source_dir / name
+        return staged
+
+    def staged_path(self, name: str) -> Optional[Path]:
+        """이번 프로세스에서 검증된 로컬 사본이 있으면 그 경로를, 없으면 None을 반환합니다.
+
+        Drive에 접근하거나 복사하지 않으므로 키워드 입력마다 호출해도 됩니다. (원본 변경 여부는 확인하지 않음)
+        """
+        with self._lock:
+            record = self._manifest.get(name)
+            if not record or name not in self._verified:
+                return None
+        local = self._local(name)
+        try:
+            return local if os.stat(local).st_size == record["size"] else None
+        except OSError:
+            return None
+
+    @contextmanager
+    def pinned(self, names: Iterable[str]) -> Iterator[None]:
+        """with 블록 동안 names의 로컬 사본을 용량 정리에서 제외합니다. (작업이 읽는 중이거나 읽을 예정인 사본 보호)"""
+        names = [name for name in names if name]
+        with self._lock:
+            for name in names:
+                self._pins[name] = self._pins.get(name, 0) + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                for name in names:
+                    self._pins[name] -= 1
+                    if not self._pins[name]:
+                        del self._pins[name]
+
+    def digest(self, name: str) -> Optional[str]:
+        """검증된 로컬 사본의 SHA-256. (처리 결과 캐시가 파일을 다시 해싱하지 않도록 넘겨줄 때 사용)"""
+        with self._lock:
+            record = self._manifest.get(name)
+        return record["sha256"] if record and name in self._verified else None
+
+    def _evict(self, keep: str):
+        with self._lock:
+            records = sorted(self._manifest.items(), key=lambda item: item[1].get("last_used", 0))
+            total = sum(record["size"] for _, record in records)
+            for name, record in records:
+                if total <= self.max_bytes:
+                    break
+                lock = self._file_locks.get(name)
+                if name == keep or name in self._pins or (lock is not None and lock.locked()):
+                    continue
+                self._local(name).unlink(missing_ok=True)
+                del self._manifest[name]
+                self._verified.discard(name)
+                total -= record["size"]
+                logger.debug(f"로컬 사본 용량 초과로 삭제했습니다: '{name}'")
+            self._save_manifest()
+
+    def status(self) -> Dict[str, int]:
+        """로컬 사본 수, 사용 중인 바이트 수, 복사 대기 중인 파일 수."""
+        with self._lock:
+            return {"staged": len(self._manifest), "bytes": sum(r["size"] for r in self._manifest.values()),
+                    "pending": len(self._queued)}
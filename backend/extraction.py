@@ -1,18 +1,88 @@
 # frida_asset_suite/backend/extraction.py
 import re
+import os
+import mmap
 import logging
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Set
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+from .instrumentation import stage
+from .worker_pool import discard_worker_pool, get_worker_pool, worker_pool_size
 
 logger = logging.getLogger('frida_asset_suite')
 
+def _scan_segments(binary_path: str, segments: List[tuple]) -> bytes:
+    """프로세스 풀 작업 함수. 파일을 직접 mmap하여 [start, end) 구간들을 검사합니다.
+
+    매치는 바이트열 그대로 중복을 제거한 뒤 '\n'으로 이어 반환하므로, 프로세스 간 전송량과 디코딩 횟수가 고유 경로 수로 줄어듭니다.
+    """
+    unique = set()
+    with open(binary_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for start, end in segments:
+            unique.update(PathExtractor._ASSET_PATH_PATTERN.findall(mm, start, end))
+    return b"\n".join(unique)
+
+def _scan_buffer(buffer: bytes) -> bytes:
+    """프로세스 풀 작업 함수. 메모리 구간 하나를 검사하여 중복을 제거한 매치를 '\n'으로 이어 반환합니다."""
+    return b"\n".join(set(PathExtractor._ASSET_PATH_PATTERN.findall(buffer)))
+
 class PathExtractor:
     # 정규표현식: 'Assets/'로 시작하며, 일반적인 경로에 사용되는 문자들(알파벳,숫자,_,/,.,-)로 구성.
     # NULL 문자(\x00)나 다른 제어 문자가 나오기 전까지의 경로를 탐색합니다.
     _ASSET_PATH_PATTERN = re.compile(rb'Assets/[-_a-zA-Z0-9./]+')
+    # 경로 문자가 아닌 바이트. 매치는 이 바이트를 넘지 못하므로 구간 경계로 사용합니다.
+    _PATH_BOUNDARY = re.compile(rb'[^-_a-zA-Z0-9./]')
+    # extract_from_binary가 파일을 나누어 검사하는 구간 크기. 구간이 2개 이상이고 작업자가 여럿이면 병렬로 검사합니다.
+    _SEGMENT_SIZE = 16 << 20
+    # 추출 결과가 달라지는 변경(정규표현식 등)이 있을 때 올려서 처리 결과 캐시를 무효화합니다.
+    PATTERN_VERSION = 1
+    # 청크 끝에 걸린 접두사('Asse', 'Assets/' 등)를 다음 청크로 넘기기 위해 남겨두는 길이.
+    # 매치는 최소 len('Assets/') + 1 바이트이므로 이 구간 안에 완결된 매치가 중복으로 들어가지 않습니다.
+    _PREFIX_CARRY = len(b'Assets/')
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+
+    def _add_matches(self, matches: Iterable[bytes], logical_paths: Set[str], sample_rss: bool = True):
+        with stage("set build", sample_rss=sample_rss):
+            for match in matches:
+                try:
+                    # 바이너리 문자열을 UTF-8로 디코딩하여 Set에 추가
+                    logical_paths.add(match.decode('utf-8'))
+                except UnicodeDecodeError:
+                    logger.warning(f"UTF-8 디코딩 실패. 바이너리 경로: {match}")
+
+    def _log_result(self, logical_paths: Set[str]):
+        if not logical_paths:
+            logger.warning("논리 경로를 하나도 찾지 못했습니다. 파일 내용이나 정규표현식을 확인하세요.")
+        else:
+            logger.info(f"✅ 경로 추출 성공: {len(logical_paths):,}개의 고유 경로 발견.")
+
+    @classmethod
+    def _segment_bounds(cls, buffer, size: int) -> List[int]:
+        """약 _SEGMENT_SIZE 간격의 구간 경계를 경로 문자가 아닌 바이트 위치에 맞춰 반환합니다. (처음 0, 끝 size 포함)
+
+        매치는 경로 문자로만 이루어지므로 경계를 넘는 매치가 없고, 구간별 결과의 합집합은 전체를 한 번에 검사한 결과와 같습니다.
+        """
+        bounds = [0]
+        pos = cls._SEGMENT_SIZE
+        while pos < size:
+            m = cls._PATH_BOUNDARY.search(buffer, pos)
+            if m is None:
+                break
+            bounds.append(m.start())
+            pos = m.start() + cls._SEGMENT_SIZE
+        bounds.append(size)
+        return bounds
 
     def extract_from_binary(self, binary_path: str) -> Set[str]:
-        """복호화된 바이너리 파일에서 'Assets/...' 형태의 논리 경로를 모두 추출합니다."""
+        """복호화된 바이너리 파일에서 'Assets/...' 형태의 논리 경로를 모두 추출합니다.
+
+        파일 전체를 읽지 않고 mmap하여 경로 경계에 맞춘 구간으로 나눠 검사합니다. 구간이 여러 개이고 작업자가 둘 이상이면
+        공유 프로세스 풀(worker_pool)에서 병렬로 검사합니다. (re는 검사 중 GIL을 놓지 않아 스레드로는 코어 수만큼 빨라지지 않습니다)
+        병렬 검사가 실패하면 현재 프로세스에서 다시 검사하며, 파일을 읽는 중의 오류(OSError 등)는 호출자에게 전달됩니다.
+        """
         binary_p = Path(binary_path)
         logical_paths: Set[str] = set()
         
@@ -21,27 +91,156 @@ class PathExtractor:
             return logical_paths
         
         logger.info(f"'{binary_p.name}' 파일에서 논리 경로 추출을 시작합니다.")
+        size = binary_p.stat().st_size
+        if size:  # 빈 파일은 mmap할 수 없습니다.
+            with open(binary_p, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                segments = self._segment_bounds(mm, size)
+                segments = list(zip(segments[:-1], segments[1:]))
+                if not self._scan_parallel(str(binary_p), segments, logical_paths):
+                    # 같은 경로가 여러 번 나오므로 바이트열 그대로 중복을 제거한 뒤 고유 경로만 디코딩합니다.
+                    unique = set()
+                    with stage("regex scan", size):
+                        for start, end in segments:
+                            unique.update(self._ASSET_PATH_PATTERN.findall(mm, start, end))
+                    self._add_matches(unique, logical_paths)
+        self._log_result(logical_paths)
+        return logical_paths
+
+    @staticmethod
+    def _add_blobs(blobs: Iterable[bytes], logical_paths: Set[str]):
+        """작업자가 반환한 '\n' 구분 매치 묶음을 경로 Set에 더합니다."""
+        with stage("set build"):
+            for blob in blobs:
+                if blob:
+                    # 경로는 ASCII 문자로만 매치되므로 구간 결과를 한 번에 디코딩하여 나눕니다.
+                    logical_paths.update(blob.decode('utf-8').split("\n"))
+
+    def _scan_parallel(self, binary_path: str, segments: List[tuple], logical_paths: Set[str]) -> bool:
+        """구간들을 작업자 수만큼의 묶음으로 나눠 공유 프로세스 풀에서 검사합니다.
+
+        구간이 하나뿐이거나 작업자가 하나뿐이거나 풀을 쓸 수 없으면 아무것도 하지 않고 False를 반환합니다.
+        작업자 오류로 검사를 끝내지 못한 경우에도 False를 반환하여 호출자가 현재 프로세스에서 다시 검사하게 합니다.
+        """
+        pool = get_worker_pool() if self.workers > 1 and len(segments) > 1 else None
+        workers = min(self.workers, worker_pool_size(), len(segments))
+        if pool is None or workers <= 1:
+            return False
+        logger.debug(f"{len(segments)}개 구간을 프로세스 {workers}개로 검사합니다.")
+        # 구간을 번갈아 나눠 묶음마다 크기가 고르게 하고, 같은 묶음 안의 중복은 작업자에서 바로 제거합니다.
+        groups = [segments[i::workers] for i in range(workers)]
         try:
-            with open(binary_p, 'rb') as f:
-                content = f.read()
+            with stage("regex scan", segments[-1][1]):
+                blobs = list(pool.map(_scan_segments, [binary_path] * workers, groups))
+        except Exception as e:
+            logger.warning(f"구간 병렬 검사 실패, 현재 프로세스에서 다시 검사합니다: {e}")
+            if isinstance(e, BrokenProcessPool):
+                discard_worker_pool(pool)
+            return False
+        self._add_blobs(blobs, logical_paths)
+        return True
 
-            matches = self._ASSET_PATH_PATTERN.findall(content)
+    @classmethod
+    def _iter_segments(cls, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """청크 스트림을 약 _SEGMENT_SIZE 크기의 메모리 구간으로 다시 나눕니다. 경계는 _segment_bounds와 같이 경로 문자가 아닌 바이트에 맞춥니다."""
+        buffer = bytearray()
+        search_from = cls._SEGMENT_SIZE
+        for chunk in chunks:
+            buffer += chunk
+            while len(buffer) > search_from:
+                m = cls._PATH_BOUNDARY.search(buffer, search_from)
+                if m is None:
+                    # 경계 바이트가 아직 없으면 이미 살펴본 부분은 다시 검색하지 않습니다.
+                    search_from = len(buffer)
+                    break
+                yield bytes(buffer[:m.start()])
+                del buffer[:m.start()]
+                search_from = cls._SEGMENT_SIZE
+        if buffer:
+            yield bytes(buffer)
 
-            for match in matches:
+    def extract_from_stream_parallel(self, chunks: Iterable[bytes]) -> Set[str]:
+        """바이너리 청크 스트림을 경로 경계에 맞춘 메모리 구간으로 나눠 공유 프로세스 풀에서 병렬로 검사합니다.
+
+        디스크에 기록하지 않으며, 작업자에 맡긴 구간은 작업자 수의 두 배까지만 유지하므로 최대 메모리는 구간 크기로 제한됩니다.
+        풀을 쓸 수 없으면 extract_from_stream과 같고, 검사 중 풀이 실패하면 남은 구간을 현재 프로세스에서 검사합니다.
+        결과는 전체 데이터를 한 번에 findall 한 결과와 동일하며, 복호화 등 청크를 만드는 쪽의 예외는 호출자에게 전달됩니다.
+        """
+        pool = get_worker_pool() if self.workers > 1 else None
+        workers = min(self.workers, worker_pool_size())
+        if pool is None or workers <= 1:
+            return self.extract_from_stream(chunks)
+
+        logical_paths: Set[str] = set()
+        in_flight: Dict = {}  # future -> 구간 (풀이 실패하면 현재 프로세스에서 다시 검사)
+        blobs: List[bytes] = []
+        local = set()  # 현재 프로세스에서 검사한 매치
+
+        def collect(return_when):
+            nonlocal pool
+            done, _ = wait(in_flight, return_when=return_when)
+            for future in done:
+                segment = in_flight.pop(future)
                 try:
-                    # 바이너리 문자열을 UTF-8로 디코딩하여 Set에 추가
-                    path_str = match.decode('utf-8')
-                    logical_paths.add(path_str)
-                except UnicodeDecodeError:
-                    logger.warning(f"UTF-8 디코딩 실패. 바이너리 경로: {match}")
-            
-            if not logical_paths:
-                logger.warning("논리 경로를 하나도 찾지 못했습니다. 파일 내용이나 정규표현식을 확인하세요.")
-            else:
-                logger.info(f"✅ 경로 추출 성공: {len(logical_paths):,}개의 고유 경로 발견.")
-            
-            return logical_paths
-            
-        except Exception as e:
-            logger.error(f"바이너리 파일 처리 중 예외 발생: {e}", exc_info=True)
-            return set()
\ No newline at end of file
+                    blobs.append(future.result())
+                except Exception as e:
+                    if pool is not None:
+                        logger.warning(f"구간 병렬 검사 실패, 현재 프로세스에서 검사합니다: {e}")
+                        if isinstance(e, BrokenProcessPool):
+                            discard_worker_pool(pool)
+                        pool = None
+                    local.update(self._ASSET_PATH_PATTERN.findall(segment))
+
+        scanned = 0
+        with stage("regex scan") as s:
+            for segment in self._iter_segments(chunks):
+                scanned += len(segment)
+                if pool is not None:
+                    try:
+                        in_flight[pool.submit(_scan_buffer, segment)] = segment
+                    except (BrokenProcessPool, RuntimeError) as e:
+                        logger.warning(f"구간 병렬 검사 실패, 현재 프로세스에서 검사합니다: {e}")
+                        discard_worker_pool(pool)
+                        pool = None
+                if pool is None:
+                    local.update(self._ASSET_PATH_PATTERN.findall(segment))
+                if len(in_flight) >= 2 * workers:
+                    collect(FIRST_COMPLETED)
+            if in_flight:
+                collect(ALL_COMPLETED)
+            s.bytes_in = scanned
+        self._add_blobs(blobs, logical_paths)
+        self._add_matches(local, logical_paths)
+        self._log_result(logical_paths)
+        return logical_paths
+
+    def extract_from_stream(self, chunks: Iterable[bytes]) -> Set[str]:
+        """바이너리 청크 스트림에서 경로를 점진적으로 추출합니다.
+
+        청크 끝에 걸쳐 아직 끝나지 않은 매치는 다음 청크와 이어 붙여 다시 검사하므로,
+        전체 데이터를 한 번에 findall 한 결과와 동일합니다. 예외는 호출자에게 전달됩니다.
+        """
+        logical_paths: Set[str] = set()
+        carry = b""
+        for chunk in chunks:
+            buffer = carry + chunk if carry else chunk
+            matches = []
+            last_end = 0
+            with stage("regex scan", len(chunk), sample_rss=False):
+                for m in self._ASSET_PATH_PATTERN.finditer(buffer):
+                    if m.end() == len(buffer):
+                        # 경로가 다음 청크로 이어질 수 있으므로 매치 시작점부터 보류합니다.
+                        last_end = m.start()
+                        break
+                    matches.append(m.group())
+                    last_end = m.end()
+                else:
+                    last_end = max(last_end, len(buffer) - self._PREFIX_CARRY)
+                carry = buffer[last_end:]
+            self._add_matches(matches, logical_paths, sample_rss=False)
+
+        if carry:
+            with stage("regex scan", sample_rss=False):
+                matches = self._ASSET_PATH_PATTERN.findall(carry)
+            self._add_matches(matches, logical_paths, sample_rss=False)
+        self._log_result(logical_paths)
+        return logical_paths
@@ -0,0 +1,260 @@
+# frida_asset_suite/backend/history_store.py
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+import numpy as np
+from pathlib import Path
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from .data_models import CharacterManager
+from .report import StructuredReport
+from .instrumentation import timed
+
+logger = logging.getLogger('frida_asset_suite')
+
+class CatalogHistoryStore:
+    """카탈로그 버전 이력을 SQLite에 영구 저장합니다.
+
+    고유한 경로는 paths 테이블에 한 번만 저장(interning)되어 정수 ID를 받고, 각 버전의 경로 목록은
+    (버전 ID, 경로 ID) 순서로 정렬된 version_paths 행으로만 기록됩니다. 버전 하나의 경로 ID는 기본 키 구간 조회로
+    정렬된 uint32 배열로 읽어 메모리에 캐시합니다. 경로별 캐릭터 분류는 처음 저장될 때 한 번만 계산하여
+    path_codes에 보관하므로, 버전 간 비교·경로 이력 조회·필터 보고서가 전부 색인 조회로 끝납니다.
+    """
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS paths (id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE);
+        CREATE TABLE IF NOT EXISTS path_codes (
+            path_id INTEGER NOT NULL, code TEXT NOT NULL, PRIMARY KEY (path_id, code)) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS path_codes_by_code ON path_codes (code, path_id);
+        CREATE TABLE IF NOT EXISTS versions (
+            id INTEGER PRIMARY KEY, name TEXT NOT NULL, source_key TEXT NOT NULL UNIQUE,
+            recorded_at REAL NOT NULL, path_count INTEGER NOT NULL);
+        CREATE TABLE IF NOT EXISTS version_paths (
+            version_id INTEGER NOT NULL, path_id INTEGER NOT NULL, PRIMARY KEY (version_id, path_id)) WITHOUT ROWID;
+    """
+    _ID_DTYPE = np.uint32
+
+    def __init__(self, db_path: Path, char_manager: CharacterManager):
+        self.db_path = Path(db_path)
+        self.char_manager = char_manager
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Gradio 이벤트는 여러 스레드에서 호출되므로 연결 하나를 잠금으로 보호하여 공유합니다.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+        self._migrate()
+        self._members: Dict[int, np.ndarray] = {} # version_id -> 정렬된 경로 ID 배열 (메모리 캐시)
+        self._classified_version = -1 # 분류에 사용한 CharacterManager.version (CSV가 다시 읽히면 재동기화)
+        self._sync_classification()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _migrate(self):
+        """버전 경로를 members BLOB과 (경로 ID, 버전 ID) 순서의 version_paths에 이중으로 저장하던 이전 형식을 변환합니다."""
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(versions)")]
+        if "members" not in columns:
+            return
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE version_paths_new (version_id INTEGER NOT NULL, path_id INTEGER NOT NULL, "
+                "PRIMARY KEY (version_id, path_id)) WITHOUT ROWID")
+            self._conn.execute("INSERT INTO version_paths_new (version_id, path_id) "
+                               "SELECT version_id, path_id FROM version_paths ORDER BY version_id, path_id")
+            self._conn.execute("DROP TABLE version_paths")
+            self._conn.execute("ALTER TABLE version_paths_new RENAME TO version_paths")
+            self._conn.execute("ALTER TABLE versions DROP COLUMN members")
+        self._conn.execute("VACUUM")
+        logger.info("이력 저장소 형식을 변환했습니다. (버전별 경로 BLOB 제거)")
+
+    # --- 경로 분류 ---
+
+    def _classifier_signature(self) -> str:
+        """분류 결과는 캐릭터 코드 집합에만 의존합니다. (CSV 순서는 조회 시점에 적용)"""
+        codes = sorted(str(code) for code in self.char_manager.char_data)
+        return hashlib.sha256("\n".join(codes).encode('utf-8')).hexdigest()
+
+    def _classify(self, rows: Iterable[Tuple[int, str]]):
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO path_codes (path_id, code) VALUES (?, ?)",
+            ((path_id, code) for path_id, path in rows for code in self.char_manager.match_characters(path)))
+
+    def _sync_classification(self):
+        """캐릭터 코드 목록이 바뀌었으면 저장된 모든 경로를 다시 분류합니다."""
+        self._classified_version = self.char_manager.version
+        signature = self._classifier_signature()
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'classifier'").fetchone()
+            if row and row[0] == signature:
+                return
+            self._conn.execute("DELETE FROM path_codes")
+            self._classify(self._conn.execute("SELECT id, path FROM paths").fetchall())
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('classifier', ?)", (signature,))
+        if row:
+            logger.info("캐릭터 코드 목록이 변경되어 저장된 경로의 분류를 갱신했습니다.")
+
+    # --- 버전 기록 ---
+
+    @timed("history record")
+    def record_version(self, name: str, source_key: str, paths: Set[str]) -> Optional[int]:
+        """카탈로그 버전의 경로 Set을 기록하고 버전 ID를 반환합니다.
+
+        source_key(암호화 파일 해시 등)가 같은 버전은 다시 기록하지 않습니다. 실패하면 None을 반환합니다.
+        """
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute("SELECT id FROM versions WHERE source_key = ?", (source_key,)).fetchone()
+                if row:
+                    return row[0]
+                last_id = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM paths").fetchone()[0]
+                self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS incoming (path TEXT PRIMARY KEY) WITHOUT ROWID")
+                self._conn.execute("DELETE FROM incoming")
+                self._conn.executemany("INSERT OR IGNORE INTO incoming (path) VALUES (?)", ((p,) for p in paths))
+                self._conn.execute("INSERT OR IGNORE INTO paths (path) SELECT path FROM incoming")
+                self._classify(self._conn.execute("SELECT id, path FROM paths WHERE id > ?", (last_id,)).fetchall())
+                cur = self._conn.execute(
+                    "INSERT INTO versions (name, source_key, recorded_at, path_count) "
+                    "VALUES (?, ?, ?, (SELECT COUNT(*) FROM incoming))", (name, source_key, time.time()))
+                version_id = cur.lastrowid
+                self._conn.execute("INSERT INTO version_paths (version_id, path_id) "
+                                   "SELECT ?, p.id FROM incoming i JOIN paths p ON p.path = i.path ORDER BY p.id",
+                                   (version_id,))
+                self._conn.execute("DELETE FROM incoming")
+                ids = self._read_members(version_id)
+            self._members[version_id] = ids
+            new_count = int(np.count_nonzero(ids > last_id))
+            logger.info(f"이력 저장소에 '{name}' 기록 완료: {len(ids):,}개 경로 (신규 경로 {new_count:,}개)")
+            return version_id
+        except sqlite3.Error as e:
+            logger.error(f"이력 저장소 기록 실패 ('{name}'): {e}")
+            return None
+
+    def find_version(self, source_key: str) -> Optional[int]:
+        """source_key로 이미 기록된 버전 ID를 찾습니다. 없으면 None을 반환합니다."""
+        with self._lock:
+            row = self._conn.execute("SELECT id FROM versions WHERE source_key = ?", (source_key,)).fetchone()
+        return row[0] if row else None
+
+    def list_versions(self) -> List[Dict]:
+        """기록된 버전 목록을 기록 순서대로 반환합니다."""
+        with self._lock:
+            rows = self._conn.execute("SELECT id, name, path_count, recorded_at FROM versions ORDER BY id").fetchall()
+        return [{"id": r[0], "name": r[1], "path_count": r[2], "recorded_at": r[3]} for r in rows]
+
+    def _read_members(self, version_id: int) -> np.ndarray:
+        """버전의 경로 ID를 정렬된 배열로 읽습니다. (version_paths 기본 키 구간 조회, 잠금을 잡은 상태에서 호출)"""
+        rows = self._conn.execute("SELECT path_id FROM version_paths WHERE version_id = ? ORDER BY path_id", (version_id,))
+        return np.fromiter((r[0] for r in rows), dtype=self._ID_DTYPE)
+
+    def _version_members(self, version_id: int) -> np.ndarray:
+        if version_id not in self._members:
+            with self._lock:
+                if self._conn.execute("SELECT 1 FROM versions WHERE id = ?", (version_id,)).fetchone() is None:
+                    raise KeyError(version_id)
+                self._members[version_id] = self._read_members(version_id)
+        return self._members[version_id]
+
+    def _version_name(self, version_id: int) -> str:
+        with self._lock:
+            row = self._conn.execute("SELECT name FROM versions WHERE id = ?", (version_id,)).fetchone()
+        return row[0] if row else str(version_id)
+
+    # --- 조회 ---
+
+    def _fetch_paths(self, ids: np.ndarray) -> Tuple[Dict[int, str], List[Tuple[int, str]]]:
+        """경로 ID 배열에 해당하는 {ID: 경로}와 (ID, 캐릭터 코드) 분류 목록을 조회합니다."""
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS wanted (id INTEGER PRIMARY KEY)")
+            self._conn.execute("DELETE FROM wanted")
+            self._conn.executemany("INSERT INTO wanted (id) VALUES (?)", ((int(i),) for i in ids))
+            rows = self._conn.execute("SELECT p.id, p.path FROM wanted w JOIN paths p ON p.id = w.id").fetchall()
+            codes = self._conn.execute(
+                "SELECT c.path_id, c.code FROM wanted w JOIN path_codes c ON c.path_id = w.id").fetchall()
+            self._conn.execute("DELETE FROM wanted")
+        return dict(rows), codes
+
+    def paths_for(self, version_id: int) -> Set[str]:
+        """버전에 포함된 전체 경로 Set을 반환합니다."""
+        paths, _ = self._fetch_paths(self._version_members(version_id))
+        return set(paths.values())
+
+    @timed("history diff")
+    def diff(self, new_version_id: int, old_version_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """두 버전 사이에 (추가된, 삭제된) 경로 ID 배열을 반환합니다."""
+        new_ids = self._version_members(new_version_id)
+        old_ids = self._version_members(old_version_id)
+        return (np.setdiff1d(new_ids, old_ids, assume_unique=True),
+                np.setdiff1d(old_ids, new_ids, assume_unique=True))
+
+    @timed("history lookup")
+    def versions_containing(self, path: str) -> List[str]:
+        """경로가 포함된 버전 이름 목록을 기록 순서대로 반환합니다."""
+        with self._lock:
+            # 버전마다 (버전 ID, 경로 ID) 기본 키를 한 번씩 조회합니다.
+            rows = self._conn.execute(
+                "SELECT v.name FROM versions v WHERE EXISTS (SELECT 1 FROM version_paths vp "
+                "WHERE vp.version_id = v.id AND vp.path_id = (SELECT id FROM paths WHERE path = ?)) ORDER BY v.id",
+                (path,)).fetchall()
+        return [r[0] for r in rows]
+
+    @timed("filter")
+    def _structure_ids(self, ids: np.ndarray, squads: Optional[List[str]], characters: Optional[List[str]],
+                       keyword: Optional[str]) -> Dict:
+        """경로 ID 배열을 미리 계산된 분류로 필터링하고 부대/캐릭터별로 구조화합니다.
+
+        AssetComparer._filter_and_structure_paths와 같은 규칙(CSV 순서상 첫 허용 코드, 필터 없을 때만 '기타')을 따릅니다.
+        """
+        allowed = self.char_manager.allowed_codes(squads, characters)
+        if self.char_manager.version != self._classified_version:
+            self._sync_classification()
+        char_data = self.char_manager.char_data
+        filtering = allowed is not None
+        if filtering:
+            # 분류 색인으로 허용 코드가 붙은 경로만 먼저 골라 경로 문자열 조회량을 줄입니다.
+            with self._lock, self._conn:
+                self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS allowed_codes (code TEXT PRIMARY KEY)")
+                self._conn.execute("DELETE FROM allowed_codes")
+                self._conn.executemany("INSERT INTO allowed_codes (code) VALUES (?)", ((str(c),) for c in allowed))
+                candidates = np.fromiter(
+                    (r[0] for r in self._conn.execute(
+                        "SELECT DISTINCT c.path_id FROM allowed_codes a JOIN path_codes c ON c.code = a.code")),
+                    dtype=self._ID_DTYPE)
+                self._conn.execute("DELETE FROM allowed_codes")
+            ids = np.intersect1d(ids, candidates, assume_unique=True)
+
+        paths, classified = self._fetch_paths(ids)
+        codes_by_id: Dict[int, List[str]] = defaultdict(list)
+        for path_id, code in classified:
+            codes_by_id[path_id].append(code)
+        keyword_lower = keyword.lower() if keyword else None
+
+        report_data: Dict[str, Dict[str, List[str]]] = defaultdict(lambda: defaultdict(list))
+        for path_id, path in sorted(paths.items(), key=lambda item: item[1]):
+            if keyword_lower and keyword_lower not in path.lower():
+                continue
+            code = self.char_manager.first_character(codes_by_id.get(path_id, ()), allowed)
+            info = char_data.get(code) if code is not None else None
+            if info is not None:
+                report_data[info['squad']][info['name']].append(path)
+            elif not filtering:
+                report_data["기타"]["공용/미분류 에셋"].append(path)
+        return report_data
+
+    def build_version_report(self, version_id: int, squads: List, chars: List, keyword: str) -> StructuredReport:
+        """기록된 버전 하나의 분석 보고서를 만듭니다."""
+        structured_data = self._structure_ids(self._version_members(version_id), squads, chars, keyword)
+        return StructuredReport(f"'{self._version_name(version_id)}' 분석 결과", structured_data)
+
+    def build_comparison_report(self, new_version_id: int, old_version_id: int,
+                                squads: List, chars: List, keyword: str) -> StructuredReport:
+        """두 기록된 버전의 비교 보고서(추가된 에셋)를 만듭니다."""
+        added, _ = self.diff(new_version_id, old_version_id)
+        logger.info(f"비교 완료: {len(added)}개의 신규 에셋 경로 발견.")
+        structured_data = self._structure_ids(added, squads, chars, keyword)
+        title = f"'{self._version_name(new_version_id)}' vs '{self._version_name(old_version_id)}' 비교 결과"
+        return StructuredReport(title, structured_data)
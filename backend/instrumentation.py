@@ -0,0 +1,198 @@
+# frida_asset_suite/backend/instrumentation.py
+import os
+import json
+import time
+import logging
+import functools
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, Optional
+
+try:
+    import resource  # Unix 전용
+except ImportError:
+    resource = None
+
+logger = logging.getLogger('frida_asset_suite')
+metrics_logger = logging.getLogger('frida_asset_suite.metrics')
+
+# 현재 실행 중인 측정 대상. 백엔드 함수 시그니처를 바꾸지 않고 단계 측정을 공유하기 위해 컨텍스트 변수로 전달합니다.
+_current_profile: ContextVar[Optional['RunProfile']] = ContextVar('frida_run_profile', default=None)
+# 진행률을 받을 콜백(작업 큐의 Job 등). 복호화/해시 루프가 실제로 처리한 바이트 수를 (단계 이름, 바이트 수)로 알립니다.
+_current_progress: ContextVar[Optional[Callable[[str, int], None]]] = ContextVar('frida_progress', default=None)
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+def _peak_rss_mb() -> Optional[float]:
+    """프로세스 시작 이후의 최대 RSS. 단계 하나의 메모리 사용량이 아니라 프로세스 전체 수명 동안의 최댓값입니다."""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux: KB 단위
+
+def _current_rss_mb() -> Optional[float]:
+    """현재 RSS. (Linux /proc/self/statm, 없으면 None) 실행과 단계 묶음의 시작/끝에서 읽어 RSS 증감을 계산합니다."""
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE / 2**20
+    except (OSError, ValueError, IndexError):
+        return None
+
+class StageCounter:
+    """단계 안에서 처리한 바이트 수를 기록하는 카운터입니다."""
+    __slots__ = ('bytes_in', 'bytes_out')
+
+    def __init__(self, bytes_in: int = 0):
+        self.bytes_in = bytes_in
+        self.bytes_out = 0
+
+class RunProfile:
+    """한 번의 실행(분석/비교 등)에 대한 단계별 벽시계/CPU 시간, 입출력 바이트, RSS 증감을 모읍니다.
+
+    with 블록 안에서 호출되는 stage()들이 자동으로 이 프로파일에 누적됩니다.
+    CPU 시간은 측정한 스레드의 CPU 시간(time.thread_time)이므로, 동시에 실행 중인 다른 작업이나 UI 스레드의 CPU는 섞이지 않습니다.
+    다른 프로세스(작업자)에서 합친 단계(merge(per_process=True))는 작업자별 측정값을 더한 프로세스 합계로 따로 표시합니다.
+    rss_delta_mb는 단계가 끝날 때의 RSS에서 시작할 때의 RSS를 뺀 값을 호출마다 더한 것(그 단계에서 늘어난 메모리)입니다.
+    청크마다 열리는 단계는 RSS를 읽지 않으므로(sample_rss=False) 값이 없고, 그 메모리는 실행 전체의 rss_delta_mb에 포함됩니다.
+    실행 전체에는 프로세스 수명 동안의 최대 RSS(process_peak_rss_mb)도 따로 기록합니다.
+    trace_memory=True이면 tracemalloc으로 단계별 최대 할당량도 기록합니다. (실행 속도가 느려집니다)
+    """
+    def __init__(self, name: str, trace_memory: bool = False):
+        self.name = name
+        self.trace_memory = trace_memory
+        self.stages: Dict[str, Dict] = {}
+        self.wall_s = 0.0
+        self.cpu_s = 0.0
+        self.rss_delta_mb: Optional[float] = None
+        self._token = None
+        self._started_tracing = False
+
+    def __enter__(self) -> 'RunProfile':
+        self._token = _current_profile.set(self)
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._rss0 = _current_rss_mb()
+        self._wall0, self._cpu0 = time.perf_counter(), time.thread_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.wall_s = time.perf_counter() - self._wall0
+        self.cpu_s = time.thread_time() - self._cpu0
+        rss1 = _current_rss_mb() if self._rss0 is not None else None
+        self.rss_delta_mb = rss1 - self._rss0 if rss1 is not None else None
+        _current_profile.reset(self._token)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self.log()
+        return False
+
+    def add(self, stage_name: str, wall_s: float, cpu_s: float, bytes_in: int = 0, bytes_out: int = 0,
+            traced_peak_mb: Optional[float] = None, calls: int = 1, rss_delta_mb: Optional[float] = None,
+            per_process: bool = False):
+        record = self.stages.setdefault(stage_name, {
+            "calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "bytes_in": 0, "bytes_out": 0,
+            "rss_delta_mb": None, "traced_peak_mb": None, "per_process": per_process,
+        })
+        record["calls"] += calls
+        record["wall_s"] += wall_s
+        record["cpu_s"] += cpu_s
+        record["bytes_in"] += bytes_in
+        record["bytes_out"] += bytes_out
+        if rss_delta_mb is not None:
+            record["rss_delta_mb"] = (record["rss_delta_mb"] or 0.0) + rss_delta_mb
+        if traced_peak_mb is not None:
+            record["traced_peak_mb"] = max(record["traced_peak_mb"] or 0.0, traced_peak_mb)
+
+    def merge(self, stages: Dict[str, Dict], prefix: str = "", per_process: bool = False):
+        """다른 스레드(작업 큐)나 프로세스(작업자, per_process=True)에서 수집한 단계 기록을 합칩니다."""
+        for stage_name, record in stages.items():
+            self.add(prefix + stage_name, record["wall_s"], record["cpu_s"], record["bytes_in"],
+                     record["bytes_out"], record.get("traced_peak_mb"), record["calls"], record.get("rss_delta_mb"),
+                     per_process or record.get("per_process", False))
+
+    def to_dict(self) -> Dict:
+        return {"run": self.name, "wall_s": round(self.wall_s, 6), "cpu_s": round(self.cpu_s, 6),
+                "rss_delta_mb": self.rss_delta_mb, "process_peak_rss_mb": _peak_rss_mb(), "stages": self.stages}
+
+    def log(self):
+        """단계별 측정 결과를 구조화된 JSON 한 줄로 기록합니다."""
+        metrics_logger.info(json.dumps({"event": "run_profile", **self.to_dict()}, ensure_ascii=False))
+
+    def to_markdown(self) -> str:
+        peak = _peak_rss_mb()
+        lines = [f"**⏱️ {self.name}**: 총 {self.wall_s:.3f}s (이 스레드 CPU {self.cpu_s:.3f}s)"
+                 + (f", RSS 증감 {self.rss_delta_mb:+.0f}MB" if self.rss_delta_mb is not None else "")
+                 + (f", 프로세스 최대 RSS {peak:.0f}MB (시작 이후 전체)" if peak is not None else "")]
+        in_process = {name: r for name, r in self.stages.items() if not r.get("per_process")}
+        per_process = {name: r for name, r in self.stages.items() if r.get("per_process")}
+        if in_process:
+            lines += ["", self._stage_table(in_process, "스레드 CPU(s)")]
+        if per_process:
+            lines += ["", "**작업자 프로세스 합계** (작업자별 측정값을 더한 값이며, 병렬로 실행되므로 전체 경과 시간보다 클 수 있습니다)",
+                      "", self._stage_table(per_process, "프로세스 CPU(s)")]
+        return "\n".join(lines)
+
+    @staticmethod
+    def _stage_table(stages: Dict[str, Dict], cpu_title: str) -> str:
+        lines = [f"| 단계 | 호출 | 시간(s) | {cpu_title} | 입력(MB) | 출력(MB) | RSS 증감(MB) |",
+                 "|---|---:|---:|---:|---:|---:|---:|"]
+        for stage_name, r in stages.items():
+            rss = f"{r['rss_delta_mb']:+.0f}" if r['rss_delta_mb'] is not None else "-"
+            lines.append(f"| {stage_name} | {r['calls']} | {r['wall_s']:.3f} | {r['cpu_s']:.3f} | "
+                         f"{r['bytes_in'] / 1e6:.1f} | {r['bytes_out'] / 1e6:.1f} | {rss} |")
+        return "\n".join(lines)
+
+def current_profile() -> Optional[RunProfile]:
+    return _current_profile.get()
+
+@contextmanager
+def stage(stage_name: str, bytes_in: int = 0, sample_rss: bool = True) -> Iterator[StageCounter]:
+    """현재 RunProfile에 단계 하나의 실행 시간과 (이 스레드의) CPU 시간을 누적합니다. 측정 중이 아니면 아무것도 하지 않습니다.
+
+    RSS를 읽으려면 단계마다 /proc/self/statm을 두 번 열어야 하므로, 청크마다 열리는 단계는 sample_rss=False로 호출합니다.
+    """
+    counter = StageCounter(bytes_in)
+    profile = _current_profile.get()
+    if profile is None:
+        yield counter
+        return
+    tracing = profile.trace_memory and tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+    rss0 = _current_rss_mb() if sample_rss else None
+    wall0, cpu0 = time.perf_counter(), time.thread_time()
+    try:
+        yield counter
+    finally:
+        wall_s, cpu_s = time.perf_counter() - wall0, time.thread_time() - cpu0
+        traced_peak = tracemalloc.get_traced_memory()[1] / 1e6 if tracing else None
+        rss1 = _current_rss_mb() if rss0 is not None else None
+        profile.add(stage_name, wall_s, cpu_s, counter.bytes_in, counter.bytes_out, traced_peak,
+                    rss_delta_mb=rss1 - rss0 if rss1 is not None else None)
+
+@contextmanager
+def progress_scope(callback: Callable[[str, int], None]) -> Iterator[None]:
+    """with 블록 안에서 report_progress()로 보고되는 처리량을 callback으로 전달합니다."""
+    token = _current_progress.set(callback)
+    try:
+        yield
+    finally:
+        _current_progress.reset(token)
+
+def report_progress(kind: str, nbytes: int):
+    """처리한 바이트 수를 현재 진행률 콜백에 알립니다. 콜백은 작업 취소를 위해 예외를 던질 수 있습니다."""
+    callback = _current_progress.get()
+    if callback is not None:
+        callback(kind, nbytes)
+
+def timed(stage_name: str):
+    """함수 호출 전체를 하나의 단계로 측정하는 데코레이터입니다."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(stage_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
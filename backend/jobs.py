@@ -0,0 +1,216 @@
+# frida_asset_suite/backend/jobs.py
+import os
+import time
+import uuid
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+from .instrumentation import RunProfile, progress_scope
+
+logger = logging.getLogger('frida_asset_suite')
+
+class JobCancelled(BaseException):
+    """작업 취소 신호. 처리 단계의 일반 오류 처리(except Exception)에 잡히지 않고 작업 끝까지 전달되도록 BaseException을 상속합니다."""
+
+class JobQueueFull(Exception):
+    """대기 중인 작업 수가 한도를 넘어 새 작업을 받을 수 없을 때 발생합니다."""
+
+class Job:
+    """작업 하나의 상태(queued → running → done/failed/cancelled)와 실제 처리 바이트 기반 진행률을 보관합니다.
+
+    진행률은 report_progress()로 보고되는 단계('hash', 'decrypt')별 바이트 수를 입력 파일 크기와 비교한 뒤,
+    단계마다 정해진 구간(_PHASE_SPANS)에 배치해 하나의 단조 증가하는 값으로 계산합니다.
+    'gunzip'은 해제된 바이트 수로만 표시합니다. 취소는 다음 청크 보고 시점에 JobCancelled로 처리를 중단시킵니다.
+    """
+    QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+    _PHASE_NAMES = {"hash": "파일 해시 계산", "decrypt": "복호화", "gunzip": "압축 해제"}
+    # 단계별로 전체 진행률에서 차지하는 구간 (처리 시간 비율에 맞춤). 해시가 이미 있으면 복호화 구간부터 시작합니다.
+    _PHASE_SPANS = {"hash": (0.0, 0.1), "decrypt": (0.1, 1.0)}
+
+    def __init__(self, key: Hashable, title: str, total_bytes: int, input_paths: Sequence[str] = ()):
+        self.id = uuid.uuid4().hex[:8]
+        self.key = key
+        self.title = title
+        self.total_bytes = total_bytes
+        self.input_paths = list(input_paths) # 작업을 처음 요청한 쪽의 입력 파일 (같은 key로 함께 기다리는 쪽과 다를 수 있음)
+        self.state = self.QUEUED
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.phase: Optional[str] = None
+        self.phase_bytes = 0
+        self.decompressed_bytes = 0
+        self._progress = 0.0
+        self.stages: Dict[str, Dict] = {} # 작업 스레드에서 수집한 단계별 측정 기록 (RunProfile.merge로 합칠 수 있음)
+        self._owners: set = set()
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+
+    # --- 진행률 ---
+
+    def _on_progress(self, kind: str, nbytes: int):
+        """작업 스레드에서 청크마다 호출됩니다. 취소 요청이 있으면 여기서 처리를 중단시킵니다."""
+        if self._cancel.is_set():
+            raise JobCancelled(self.id)
+        if kind == "gunzip":
+            self.decompressed_bytes += nbytes
+            return
+        if kind != self.phase:
+            self.phase, self.phase_bytes = kind, 0
+        self.phase_bytes += nbytes
+        span = self._PHASE_SPANS.get(kind)
+        if span and self.total_bytes:
+            start, end = span
+            self._progress = max(self._progress, start + (end - start) * min(self.phase_bytes / self.total_bytes, 1.0))
+
+    @property
+    def fraction(self) -> float:
+        """전체 진행률 (0~1). 단계가 바뀌어도 줄어들지 않으며, 완료된 작업은 1입니다."""
+        if self._done.is_set():
+            return 1.0
+        return self._progress
+
+    def describe(self) -> str:
+        """진행 표시줄에 쓸 한 줄 설명."""
+        if self.state == self.QUEUED:
+            return f"'{self.title}' 대기 중..."
+        if self.state != self.RUNNING:
+            return f"'{self.title}' {self.state}"
+        if self.phase is None:
+            return f"'{self.title}' 처리 중..."
+        text = (f"'{self.title}' {self._PHASE_NAMES.get(self.phase, self.phase)} 중... "
+                f"{self.phase_bytes / 2**20:.1f} / {self.total_bytes / 2**20:.1f} MiB")
+        if self.decompressed_bytes:
+            text += f" (해제 {self.decompressed_bytes / 2**20:.1f} MiB)"
+        return text
+
+    # --- 대기/취소 ---
+
+    @property
+    def finished(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """작업이 끝날 때까지 최대 timeout초 기다리고, 끝났으면 True를 반환합니다."""
+        return self._done.wait(timeout)
+
+    def cancel(self):
+        """작업을 취소합니다. 실행 중이면 다음 청크를 처리할 때 중단됩니다."""
+        self._cancel.set()
+
+class JobManager:
+    """카탈로그 처리 작업을 제한된 수의 작업 스레드에서 실행하는 작업 큐입니다.
+
+    - 같은 key(예: 같은 내용의 카탈로그 처리)로 진행 중인 작업이 있으면 새로 실행하지 않고 그 작업을 함께 기다립니다.
+    - 작업마다 요청한 소유자(세션)를 기록하며, 모든 소유자가 취소해야 실제로 중단됩니다.
+    - 실행 대기 중인 작업이 max_queued개를 넘으면 JobQueueFull을 발생시킵니다.
+    """
+    def __init__(self, max_workers: int = 2, max_queued: int = 16, history: int = 50):
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.history = history
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="catalog-job")
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Job] = {}          # 작업 ID -> 작업 (최근 history개의 끝난 작업 포함)
+        self._inflight: Dict[Hashable, Job] = {}  # 대기/실행 중인 작업의 key -> 작업
+
+    def submit(self, key: Hashable, title: str, func: Callable[[], Any], input_paths: Sequence[str] = (),
+               owner: Optional[str] = None) -> Job:
+        """func를 작업 큐에 넣고 Job을 반환합니다. 같은 key의 작업이 진행 중이면 그 작업을 반환합니다."""
+        with self._lock:
+            job = self._inflight.get(key)
+            if job is not None and not job.cancel_requested:
+                job._owners.add(owner)
+                logger.debug(f"진행 중인 작업을 함께 사용합니다: {job.title} ({job.id})")
+                return job
+            queued = sum(1 for j in self._inflight.values() if j.state == Job.QUEUED)
+            if queued >= self.max_queued:
+                raise JobQueueFull(f"대기 중인 작업이 너무 많습니다. ({queued}개) 잠시 후 다시 시도해주세요.")
+            total_bytes = sum(os.path.getsize(p) for p in input_paths if os.path.exists(p))
+            job = Job(key, title, total_bytes, input_paths)
+            job._owners.add(owner)
+            self._jobs[job.id] = job
+            self._inflight[key] = job
+            self._trim()
+        self._executor.submit(self._run, job, func)
+        return job
+
+    def _run(self, job: Job, func: Callable[[], Any]):
+        try:
+            if job.cancel_requested:
+                raise JobCancelled(job.id)
+            job.state, job.started_at = Job.RUNNING, time.time()
+            with RunProfile(f"job:{job.title}") as profile, progress_scope(job._on_progress):
+                try:
+                    job.result = func()
+                finally:
+                    job.stages = profile.stages
+            job.state = Job.DONE
+        except JobCancelled:
+            job.state = Job.CANCELLED
+            logger.info(f"작업이 취소되었습니다: {job.title} ({job.id})")
+        except Exception as e:
+            job.state, job.error = Job.FAILED, str(e)
+            logger.error(f"작업 실패: {job.title} ({job.id}): {e}", exc_info=True)
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                if self._inflight.get(job.key) is job:
+                    del self._inflight[job.key]
+            job._done.set()
+
+    def _trim(self):
+        """끝난 작업은 최근 history개만 남깁니다. (_lock 안에서 호출)"""
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(len(finished) - self.history, 0)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job: Job, owner: Optional[str] = None) -> bool:
+        """owner의 요청을 철회합니다. 작업을 기다리는 소유자가 더 없으면 작업을 취소하고 True를 반환합니다."""
+        with self._lock:
+            job._owners.discard(owner)
+            if job._owners or job.finished:
+                return False
+            job.cancel()
+            return True
+
+    def cancel_owner(self, owner: str) -> int:
+        """owner(세션)가 기다리는 모든 작업을 철회하고, 실제로 취소된 작업 수를 반환합니다."""
+        with self._lock:
+            jobs = [job for job in self._inflight.values() if owner in job._owners]
+        return sum(self.cancel(job, owner) for job in jobs)
+
+    def list_jobs(self) -> List[Job]:
+        """진행 중인 작업을 먼저, 그다음 최근에 끝난 작업 순서로 반환합니다."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return sorted(jobs, key=lambda job: (job.finished, -job.created_at))
+
+    def status_markdown(self) -> str:
+        jobs = self.list_jobs()
+        if not jobs:
+            return "### 처리 중이거나 최근에 처리한 작업이 없습니다."
+        lines = [f"### 작업 현황 (동시 실행 최대 {self.max_workers}개)", "| ID | 작업 | 상태 | 진행 | 소요 |", "|---|---|---|---|---|"]
+        for job in jobs:
+            elapsed = (job.finished_at or time.time()) - (job.started_at or job.created_at)
+            lines.append(f"| {job.id} | {job.title} | {job.state} | {job.fraction:.0%} | {elapsed:.1f}s |")
+        return "\n".join(lines)
+
+    def shutdown(self, cancel_running: bool = True):
+        """작업 큐를 닫습니다. cancel_running이면 대기/실행 중인 작업을 모두 취소합니다."""
+        if cancel_running:
+            with self._lock:
+                for job in self._inflight.values():
+                    job.cancel()
+        self._executor.shutdown(wait=True, cancel_futures=False)
@@ -1,9 +1,18 @@
 # frida_asset_suite/backend/logger.py
 import logging
+import logging.handlers
 import sys
 
-def setup_logger(debug=False):
-    """프로젝트 전역에서 사용할 로거를 설정하고 반환합니다."""
+# 성능 측정 기록 파일 하나의 최대 크기와 보관할 이전 파일 수 (run_metrics.jsonl.1 ~ .3)
+METRICS_LOG_MAX_BYTES = 5 * 1024 ** 2
+METRICS_LOG_BACKUPS = 3
+
+def setup_logger(debug=False, metrics_log_path=None):
+    """프로젝트 전역에서 사용할 로거를 설정하고 반환합니다.
+
+    metrics_log_path가 주어지면 단계별 성능 측정 결과(JSON)를 해당 파일에 한 줄씩 추가로 기록합니다.
+    파일이 METRICS_LOG_MAX_BYTES를 넘으면 이름을 바꿔 보관하고(최대 METRICS_LOG_BACKUPS개) 새 파일에 기록합니다.
+    """
     # 로거 이름으로 'frida_asset_suite'를 사용
     logger = logging.getLogger('frida_asset_suite')
     
@@ -25,5 +34,16 @@ def setup_logger(debug=False):
     
     # 다른 라이브러리의 로그가 최상위 레벨에 영향을 주지 않도록 전파(propagate) 방지
     logger.propagate = False 
+
+    # 성능 측정 로거('frida_asset_suite.metrics')는 상위 로거로 전파되어 콘솔에도 출력됩니다.
+    metrics_logger = logging.getLogger('frida_asset_suite.metrics')
+    for h in list(metrics_logger.handlers):
+        metrics_logger.removeHandler(h)
+        h.close()
+    if metrics_log_path:
+        metrics_handler = logging.handlers.RotatingFileHandler(
+            metrics_log_path, maxBytes=METRICS_LOG_MAX_BYTES, backupCount=METRICS_LOG_BACKUPS, encoding='utf-8')
+        metrics_handler.setFormatter(logging.Formatter('%(message)s'))
+        metrics_logger.addHandler(metrics_handler)
     
     return logger
\ No newline at end of file
@@ -0,0 +1,211 @@
+# frida_asset_suite/backend/path_store.py
+import logging
+from collections.abc import Set as AbstractSet
+from typing import Iterable, Iterator, List, Optional
+import numpy as np
+
+logger = logging.getLogger('frida_asset_suite')
+
+class CompactPathSet(AbstractSet):
+    """정렬된 경로를 앞부분 압축(front coding)하여 연속 버퍼 하나에 보관하는 불변 Set입니다.
+
+    경로는 UTF-8 바이트 순서로 정렬되며, _BLOCK개 단위 블록마다 첫 경로는 전체를, 나머지는
+    직전 경로와 공유하는 접두사 길이(_shared)와 나머지 접미사만 저장합니다.
+    경로마다 str 객체를 만들지 않으므로 'Assets/AddressableAssets/...'처럼 접두사가 긴 카탈로그에서
+    Python Set 대비 메모리를 크게 줄입니다. 차집합/교집합은 두 정렬 목록의 병합(merge)으로 계산합니다.
+    """
+    _BLOCK = 16
+    _SEPARATOR = 0x0A  # '\n'. 캐시/작업자 blob과 같은 구분자이며 경로에는 포함되지 않습니다.
+
+    def __init__(self, suffixes: bytes, offsets: np.ndarray, shared: np.ndarray):
+        self._suffixes = suffixes
+        self._offsets = offsets   # 접미사 시작 위치 (n+1개)
+        self._shared = shared     # 직전 경로와 공유하는 접두사 바이트 수 (블록 첫 경로는 0)
+        # 원소 하나씩 읽을 때는 numpy 스칼라 대신 Python int를 바로 돌려주는 memoryview를 사용합니다.
+        self._offset_view = memoryview(offsets)
+        self._shared_view = memoryview(shared)
+
+    # --- 생성 ---
+
+    @classmethod
+    def from_sorted_blob(cls, blob: bytes, count: Optional[int] = None) -> "CompactPathSet":
+        """정렬·중복 제거된 UTF-8 경로를 '\\n'으로 이어 붙인 blob에서 만듭니다. (캐시 파일 blob과 같은 형식)
+
+        빈 blob은 빈 Set과 빈 경로('') 하나만 있는 Set을 구분할 수 없으므로, 알고 있다면 경로 수(count)를 함께 넘깁니다.
+        """
+        if not blob:
+            count = 1 if count == 1 else 0
+            return cls(b'', np.zeros(count + 1, dtype=np.uint32), np.zeros(count, dtype=np.uint16))
+        data = np.frombuffer(blob, dtype=np.uint8)
+        ends = np.append(np.flatnonzero(data == cls._SEPARATOR), len(data)).astype(np.int64)
+        starts = np.concatenate(([0], ends[:-1] + 1))
+        lengths = ends - starts
+        count = len(starts)
+
+        # 인접 경로 쌍의 공통 접두사 길이를 바이트 위치별로 한 번에 비교합니다. (블록 첫 경로는 제외)
+        shared = np.zeros(count, dtype=np.int64)
+        pairs = np.arange(1, count)
+        pairs = pairs[pairs % cls._BLOCK != 0]
+        limit = np.minimum(lengths[pairs - 1], lengths[pairs])
+        prev_start, cur_start = starts[pairs - 1], starts[pairs]
+        active = np.arange(len(pairs))
+        k = 0
+        while len(active):
+            active = active[limit[active] > k]
+            active = active[data[prev_start[active] + k] == data[cur_start[active] + k]]
+            shared[pairs[active]] += 1
+            k += 1
+        shared = np.minimum(shared, np.iinfo(np.uint16).max)
+
+        # 각 경로의 공유 접두사와 구분자를 지운 나머지 바이트가 접미사 버퍼가 됩니다.
+        marks = np.zeros(len(data) + 1, dtype=np.int8)
+        has_prefix = shared > 0
+        marks[starts[has_prefix]] += 1
+        marks[starts[has_prefix] + shared[has_prefix]] -= 1
+        keep = (np.cumsum(marks[:-1], dtype=np.int8) == 0) & (data != cls._SEPARATOR)
+        suffixes = data[keep].tobytes()
+
+        offsets = np.zeros(count + 1, dtype=np.uint64 if len(suffixes) >= 1 << 32 else np.uint32)
+        offsets[1:] = np.cumsum(lengths - shared)
+        return cls(suffixes, offsets, shared.astype(np.uint16))
+
+    @classmethod
+    def from_sorted_bytes(cls, encoded: Iterable[bytes]) -> "CompactPathSet":
+        """정렬·중복 제거된 UTF-8 경로 바이트열에서 만듭니다."""
+        encoded = list(encoded)
+        return cls.from_sorted_blob(b'\n'.join(encoded), len(encoded))
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[str]) -> "CompactPathSet":
+        """임의 순서의 경로 문자열에서 만듭니다. 이미 CompactPathSet이면 그대로 반환합니다."""
+        if isinstance(paths, CompactPathSet):
+            return paths
+        return cls.from_sorted_bytes(sorted({p.encode('utf-8') for p in paths}))
+
+    # Set 믹스인의 |, ^ 등이 결과 집합을 만들 때 사용합니다.
+    _from_iterable = from_paths
+
+    # --- 조회 ---
+
+    def __len__(self) -> int:
+        return len(self._shared)
+
+    @property
+    def nbytes(self) -> int:
+        """경로 데이터가 차지하는 바이트 수."""
+        return len(self._suffixes) + self._offsets.nbytes + self._shared.nbytes
+
+    def _suffix(self, i: int) -> bytes:
+        return self._suffixes[self._offset_view[i]:self._offset_view[i + 1]]
+
+    def _entry(self, i: int) -> bytes:
+        block_start = i - i % self._BLOCK
+        entry = self._suffix(block_start)
+        for j in range(block_start + 1, i + 1):
+            entry = entry[:self._shared_view[j]] + self._suffix(j)
+        return entry
+
+    def iter_bytes(self, start: int = 0, stop: Optional[int] = None) -> Iterator[bytes]:
+        """start번째부터 stop번째 앞까지 정렬 순서대로 경로의 UTF-8 바이트열을 꺼냅니다."""
+        count = len(self) if stop is None else min(stop, len(self))
+        block = self._BLOCK
+        for block_start in range(start - start % block, count, block):
+            block_end = min(block_start + block, count)
+            offsets = self._offsets[block_start:block_end + 1].tolist()
+            shared = self._shared[block_start:block_end].tolist()
+            entry = b''
+            for j in range(block_end - block_start):
+                entry = entry[:shared[j]] + self._suffixes[offsets[j]:offsets[j + 1]]
+                if block_start + j >= start:
+                    yield entry
+
+    def __iter__(self) -> Iterator[str]:
+        for entry in self.iter_bytes():
+            yield entry.decode('utf-8')
+
+    def __getitem__(self, i: int) -> str:
+        count = len(self)
+        if i < 0:
+            i += count
+        if not 0 <= i < count:
+            raise IndexError(i)
+        return self._entry(i).decode('utf-8')
+
+    def _lower_bound(self, key: bytes) -> int:
+        """key 이상인 첫 경로의 위치를 반환합니다."""
+        # 블록 첫 경로(전체 문자열로 저장됨)로 블록을 찾은 뒤 블록 안에서만 순차 비교합니다.
+        lo, hi = 0, (len(self) + self._BLOCK - 1) // self._BLOCK
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._suffix(mid * self._BLOCK) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == 0:
+            return 0
+        start = (lo - 1) * self._BLOCK
+        end = min(start + self._BLOCK, len(self))
+        entry = b''
+        for i in range(start, end):
+            entry = entry[:self._shared_view[i]] + self._suffix(i)
+            if entry >= key:
+                return i
+        return end
+
+    def __contains__(self, path) -> bool:
+        if not isinstance(path, str):
+            return False
+        key = path.encode('utf-8')
+        pos = self._lower_bound(key)
+        return pos < len(self) and self._entry(pos) == key
+
+    def iter_prefix(self, prefix: str) -> Iterator[str]:
+        """prefix로 시작하는 경로(예: 특정 폴더 아래의 모든 에셋)를 정렬 순서대로 반환합니다."""
+        key = prefix.encode('utf-8')
+        for entry in self.iter_bytes(self._lower_bound(key)):
+            if not entry.startswith(key):
+                break
+            yield entry.decode('utf-8')
+
+    def count_prefix(self, prefix: str) -> int:
+        return sum(1 for _ in self.iter_prefix(prefix))
+
+    # --- 집합 연산 ---
+
+    def _merge(self, other: "CompactPathSet", keep_common: bool) -> "CompactPathSet":
+        """두 정렬 목록을 한 번 훑어 차집합(keep_common=False) 또는 교집합(True)을 만듭니다."""
+        result: List[bytes] = []
+        theirs = other.iter_bytes()
+        current: Optional[bytes] = next(theirs, None)
+        for entry in self.iter_bytes():
+            while current is not None and current < entry:
+                current = next(theirs, None)
+            if (current == entry) == keep_common:
+                result.append(entry)
+        return CompactPathSet.from_sorted_bytes(result)
+
+    def __sub__(self, other):
+        if isinstance(other, CompactPathSet):
+            return self._merge(other, keep_common=False)
+        if isinstance(other, AbstractSet):
+            return CompactPathSet.from_sorted_bytes(e for e in self.iter_bytes() if e.decode('utf-8') not in other)
+        return NotImplemented
+
+    def __and__(self, other):
+        if isinstance(other, CompactPathSet):
+            return self._merge(other, keep_common=True)
+        return super().__and__(other)
+
+    def __rsub__(self, other):
+        if isinstance(other, AbstractSet):
+            return {p for p in other if p not in self}
+        return NotImplemented
+
+    def difference(self, other: Iterable[str]) -> "CompactPathSet":
+        return self - CompactPathSet.from_paths(other)
+
+    def __reduce__(self):
+        return (CompactPathSet, (self._suffixes, self._offsets, self._shared))
+
+    def __repr__(self) -> str:
+        return f"CompactPathSet({len(self):,} paths, {self.nbytes:,} bytes)"
@@ -0,0 +1,298 @@
+# frida_asset_suite/backend/pipeline.py
+import gzip
+import zlib
+import logging
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, TimeoutError, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from .cache import ProcessedCatalogCache
+from .catalog_parser import CatalogParser
+from .decryption import CatalogDecryptor, CatalogKeyRing, DEFAULT_CHUNK_SIZE
+from .extraction import PathExtractor
+from .instrumentation import RunProfile, current_profile
+from .path_store import CompactPathSet
+from .worker_pool import acquire_progress_slot, discard_worker_pool, get_worker_pool, worker_pool_size, worker_progress
+
+logger = logging.getLogger('frida_asset_suite')
+
+# 작업자에 맡긴 카탈로그의 진행률을 부모 프로세스의 진행률 콜백으로 옮기는 간격(초)
+_PROGRESS_POLL_SEC = 0.1
+
+def _extract_paths_compact(key_hex: str, iv_hex: str, chunk_size: int, structured: bool,
+                           input_path: str, progress_slot: Optional[int] = None) -> Tuple[Optional[CompactPathSet], Dict]:
+    """프로세스 풀 작업 함수. 압축된 경로 Set(연속 버퍼 몇 개로 직렬화됨)과 단계별 측정 기록을 반환합니다.
+
+    progress_slot이 주어지면 처리한 바이트 수를 그 진행률 슬롯에 기록하고, 부모가 취소하면 다음 청크에서 중단합니다.
+    """
+    parser = CatalogParser() if structured else None
+    pipeline = CatalogPipeline(CatalogDecryptor(key_hex, iv_hex), PathExtractor(), chunk_size, parser=parser)
+    with RunProfile(f"worker:{Path(input_path).name}") as profile, worker_progress(progress_slot):
+        logical_paths = pipeline.extract_paths(input_path)
+    return logical_paths, profile.stages
+
+class CatalogPipeline:
+    """복호화 → GZip 해제 → 경로 추출을 임시 파일 없이 청크 단위로 연결합니다.
+
+    최대 메모리 사용량은 청크 크기와 결과 경로 Set의 크기로 제한되며, 결과는 CompactPathSet으로 압축해 반환합니다.
+    cache가 주어지면 이미 처리한 카탈로그는 복호화 없이 캐시에서 불러옵니다.
+    parser가 주어지면 카탈로그를 구조적으로 파싱하여 에셋 내부 ID를 추출하고(해제된 카탈로그 전체를 한 번 메모리에 올림),
+    파싱할 수 없는 카탈로그에만 정규표현식 추출기를 사용합니다.
+    keyring이 주어지면 파일마다 첫 블록 판별로 맞는 Key/IV를 골라 전체 복호화를 한 번만 수행합니다.
+    """
+    def __init__(self, decryptor: CatalogDecryptor, extractor: PathExtractor,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, cache: Optional[ProcessedCatalogCache] = None,
+                 parser: Optional[CatalogParser] = None, keyring: Optional[CatalogKeyRing] = None):
+        self.decryptor = decryptor
+        self.extractor = extractor
+        self.chunk_size = chunk_size
+        self.cache = cache
+        self.parser = parser
+        # 키가 하나뿐이어도 판별을 거치면 잘못된 키를 전체 복호화 전에 알아낼 수 있습니다.
+        self.keyring = keyring or CatalogKeyRing([decryptor])
+
+    @property
+    def extractor_version(self) -> str:
+        version = f"re{self.extractor.PATTERN_VERSION}"
+        return f"{version}-parser{self.parser.PARSER_VERSION}" if self.parser else version
+
+    def _select_decryptor(self, input_path: str) -> Optional[CatalogDecryptor]:
+        try:
+            return self.keyring.select(input_path)
+        except FileNotFoundError:
+            logger.error(f"[처리 실패] 입력 파일을 찾을 수 없습니다: '{input_path}'")
+            return None
+
+    def _cache_key(self, input_path: str, decryptor: CatalogDecryptor) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return self.cache.make_key(input_path, decryptor.fingerprint, self.extractor_version)
+
+    def source_key(self, input_path: str) -> Optional[str]:
+        """추출 결과를 식별하는 키(파일 내용 해시 + 맞는 Key/IV 지문 + 추출기 버전)를 반환합니다. 이력 저장소의 버전 키로 사용합니다.
+
+        처리 결과 캐시 키와 같은 값이며, 캐시가 없거나 맞는 Key/IV가 없으면 None을 반환합니다.
+        """
+        decryptor = self._select_decryptor(input_path)
+        return self._cache_key(input_path, decryptor) if decryptor is not None else None
+
+    def _store(self, cache_key: Optional[str], logical_paths: Optional[Set[str]]) -> Optional[CompactPathSet]:
+        """추출 결과를 CompactPathSet으로 압축하고 캐시에 저장합니다."""
+        if logical_paths is None:
+            return None
+        compact = CompactPathSet.from_paths(logical_paths)
+        if cache_key is not None and compact:
+            self.cache.put(cache_key, compact)
+        return compact
+
+    def _extract_regex(self, chunks: Iterable[bytes]) -> Set[str]:
+        """정규표현식 추출기로 경로를 추출합니다.
+
+        공유 프로세스 풀을 쓸 수 있으면 해제된 청크를 경로 경계에 맞춘 메모리 구간으로 나눠 병렬 검사하고
+        (작업자 프로세스 안에서는 풀이 없으므로 청크 단위로 검사), 어느 경우든 디스크에 기록하지 않습니다.
+        """
+        return self.extractor.extract_from_stream_parallel(chunks)
+
+    def _extract_uncached(self, input_path: str, decryptor: CatalogDecryptor) -> Optional[Set[str]]:
+        input_p = Path(input_path)
+        try:
+            logger.info(f"'{input_p.name}' 파일 스트리밍 처리를 시작합니다.")
+            chunks = decryptor.iter_decompressed_chunks(str(input_p), self.chunk_size)
+            if self.parser is None:
+                return self._extract_regex(chunks)
+
+            content = b"".join(chunks)
+            catalog = self.parser.parse(content)
+            if catalog is not None:
+                return catalog.asset_internal_ids()
+            logger.info("정규표현식 추출기로 대체합니다.")
+            return self._extract_regex(content[i:i + self.chunk_size] for i in range(0, len(content), self.chunk_size))
+
+        except FileNotFoundError:
+            logger.error(f"[처리 실패] 입력 파일을 찾을 수 없습니다: '{input_path}'")
+        except (ValueError, KeyError) as e:
+            logger.error(f"[처리 실패] 패딩 또는 키 오류. Key/IV 또는 파일이 올바른지 확인하세요. 오류: {e}")
+        except (gzip.BadGzipFile, zlib.error):
+            logger.error("[처리 실패] GZip 압축 해제 실패. 데이터가 손상되었거나 형식이 다를 수 있습니다.")
+        except Exception as e:
+            logger.error(f"[처리 실패] 알 수 없는 오류가 발생했습니다: {e}", exc_info=True)
+
+        return None
+
+    def extract_paths(self, input_path: str) -> Optional[CompactPathSet]:
+        """암호화된 카탈로그에서 논리 경로 Set(CompactPathSet)을 추출합니다. 실패 시 None을 반환합니다."""
+        decryptor = self._select_decryptor(input_path)
+        if decryptor is None:
+            return None
+        cache_key = self._cache_key(input_path, decryptor)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        return self._store(cache_key, self._extract_uncached(input_path, decryptor))
+
+    def extract_paths_in_worker(self, input_path: str) -> Optional[CompactPathSet]:
+        """extract_paths와 같지만, 캐시에 없는 카탈로그는 공유 프로세스 풀의 작업자 하나에서 처리합니다.
+
+        여러 스레드(작업 큐)가 동시에 호출해도 정규표현식 검사가 GIL을 나눠 쓰지 않고 카탈로그마다 다른 프로세스에서 실행됩니다.
+        작업자의 처리 바이트 수는 현재 진행률 콜백(report_progress)으로 전달되며, 콜백이 취소 예외를 던지면
+        작업자도 다음 청크에서 중단하도록 알린 뒤 예외를 그대로 전달합니다. 풀을 쓸 수 없으면 현재 스레드에서 처리합니다.
+        """
+        decryptor = self._select_decryptor(input_path)
+        if decryptor is None:
+            return None
+        cache_key = self._cache_key(input_path, decryptor)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        pool = get_worker_pool()
+        slot = acquire_progress_slot() if pool is not None else None
+        if slot is None:
+            return self._store(cache_key, self._extract_uncached(input_path, decryptor))
+        try:
+            future = pool.submit(_extract_paths_compact, decryptor.key.hex(), decryptor.iv.hex(),
+                                 self.chunk_size, self.parser is not None, input_path, slot.index)
+        except (BrokenProcessPool, RuntimeError):
+            slot.release()
+            return self._store(cache_key, self._extract_uncached(input_path, decryptor))
+
+        try:
+            while True:
+                try:
+                    logical_paths, worker_stages = future.result(timeout=_PROGRESS_POLL_SEC)
+                    break
+                except TimeoutError:
+                    slot.forward()
+            slot.forward()
+            profile = current_profile()
+            if profile is not None:
+                profile.merge(worker_stages, prefix="worker ", per_process=True)
+        except Exception as e:
+            logger.error(f"[처리 실패] 작업자 프로세스 오류 ('{Path(input_path).name}'): {e}", exc_info=True)
+            if isinstance(e, BrokenProcessPool):
+                discard_worker_pool(pool)
+            logical_paths = None
+        except BaseException:
+            # 작업 취소 등: 작업자도 다음 청크에서 멈추게 합니다.
+            slot.cancel()
+            raise
+        finally:
+            # 작업자가 아직 실행 중이면 끝난 뒤에 슬롯을 돌려줍니다. (이미 끝났으면 바로 호출됨)
+            future.add_done_callback(lambda _: slot.release())
+        return self._store(cache_key, logical_paths)
+
+    def iter_extract_paths(self, input_paths: Iterable[str], max_workers: Optional[int] = None
+                           ) -> Iterator[Tuple[int, str, Optional[CompactPathSet]]]:
+        """여러 카탈로그를 공유 프로세스 풀에서 동시에 처리하여, 끝나는 순서대로 (입력 순번, 경로, 경로 Set 또는 None)을 내보냅니다.
+
+        캐시 적중 항목은 작업자에 보내지 않고 바로 내보냅니다. 작업자에 한 번에 맡기는 카탈로그는 max_workers개(기본: 풀 크기)로
+        제한하여, 결과를 소비하는 동안에도 나머지 카탈로그가 계속 처리되면서 결과 Set이 한꺼번에 쌓이지 않게 합니다.
+        input_paths는 지연 생성되는 이터러블이어도 되며, 작업자 자리가 날 때마다 다음 입력을 꺼내므로
+        입력 준비(Drive 사본 복사 등)가 앞선 카탈로그의 처리와 겹칩니다. 처리할 카탈로그가 하나뿐이면 현재 프로세스에서 처리합니다.
+        작업자가 비정상 종료되어 풀을 쓸 수 없게 되면, 그 풀에서 처리 중이던 카탈로그를 모두 현재 프로세스에서 다시 처리합니다.
+        """
+        items = enumerate(input_paths)
+        ready: Deque = deque()    # 작업자에 보내지 않고 바로 내보낼 (순번, 경로, 결과)
+        pending: Deque = deque()  # 처리할 (순번, 경로, 복호화기, 캐시 키)
+        exhausted = False
+
+        def fill(count: int):
+            nonlocal exhausted
+            while not exhausted and len(pending) < count:
+                item = next(items, None)
+                if item is None:
+                    exhausted = True
+                    return
+                i, input_path = item
+                decryptor = self._select_decryptor(input_path)
+                cache_key = self._cache_key(input_path, decryptor) if decryptor is not None else None
+                cached = self.cache.get(cache_key) if cache_key is not None else None
+                if decryptor is None or cached is not None:
+                    ready.append((i, input_path, cached))
+                else:
+                    pending.append((i, input_path, decryptor, cache_key))
+
+        def process_here():
+            """풀 없이 남은 카탈로그를 현재 프로세스에서 하나씩 처리합니다."""
+            while True:
+                while ready:
+                    yield ready.popleft()
+                fill(1)
+                if not pending:
+                    yield from ready
+                    return
+                i, input_path, decryptor, cache_key = pending.popleft()
+                yield i, input_path, self._store(cache_key, self._extract_uncached(input_path, decryptor))
+
+        fill(2)
+        pool = get_worker_pool() if len(pending) > 1 and max_workers != 1 else None
+        workers = min(max_workers or worker_pool_size(), worker_pool_size())
+        if pool is None or workers <= 1:
+            yield from process_here()
+            return
+
+        logger.info(f"카탈로그를 프로세스 {workers}개로 동시에 처리합니다.")
+        futures: Dict = {}
+
+        def submit_next():
+            nonlocal pool
+            fill(1)
+            if pool is None or not pending:
+                return
+            i, input_path, decryptor, cache_key = pending[0]
+            try:
+                future = pool.submit(_extract_paths_compact, decryptor.key.hex(), decryptor.iv.hex(),
+                                     self.chunk_size, self.parser is not None, input_path)
+            except (BrokenProcessPool, RuntimeError):
+                pool = None  # 남은 항목은 현재 프로세스에서 처리합니다.
+                return
+            futures[future] = pending.popleft()
+
+        for _ in range(workers):
+            submit_next()
+        while futures:
+            while ready:
+                yield ready.popleft()
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future not in futures:
+                    continue  # 풀이 깨져 이미 다시 처리하도록 되돌린 항목
+                i, input_path, decryptor, cache_key = futures.pop(future)
+                try:
+                    logical_paths, worker_stages = future.result()
+                    profile = current_profile()
+                    if profile is not None:
+                        profile.merge(worker_stages, prefix="worker ", per_process=True)
+                except BrokenProcessPool as e:
+                    # 같은 풀에 맡긴 다른 카탈로그도 모두 실패하므로, 이미 결과가 나온 것을 빼고 입력 순서대로 대기열 앞에 되돌립니다.
+                    retry = [(i, input_path, decryptor, cache_key)]
+                    for other in list(futures):
+                        if not (other.done() and not other.cancelled() and other.exception() is None):
+                            retry.append(futures.pop(other))
+                    logger.warning(f"작업자 프로세스가 비정상 종료되어 카탈로그 {len(retry)}개를 현재 프로세스에서 다시 처리합니다: {e}")
+                    discard_worker_pool(pool)
+                    pool = None
+                    pending.extendleft(sorted(retry, key=lambda item: item[0], reverse=True))
+                    continue
+                except Exception as e:
+                    logger.error(f"[처리 실패] 작업자 프로세스 오류 ('{Path(input_path).name}'): {e}", exc_info=True)
+                    logical_paths = None
+                submit_next()
+                yield i, input_path, self._store(cache_key, logical_paths)
+        yield from process_here()
+
+    def extract_paths_many(self, input_paths: Sequence[str], max_workers: Optional[int] = None,
+                           on_done: Optional[Callable[[str, int, int], None]] = None) -> List[Optional[CompactPathSet]]:
+        """여러 카탈로그를 동시에 처리하여 입력 순서대로 경로 Set(실패 시 None)을 반환합니다. (iter_extract_paths 참고)
+
+        on_done(input_path, 완료 수, 전체 수)은 카탈로그 하나가 끝날 때마다 호출됩니다.
+        """
+        total = len(input_paths)
+        results: List[Optional[CompactPathSet]] = [None] * total
+        for done, (i, input_path, logical_paths) in enumerate(self.iter_extract_paths(input_paths, max_workers), 1):
+            results[i] = logical_paths
+            if on_done: on_done(input_path, done, total)
+        return results
@@ -0,0 +1,197 @@
+# frida_asset_suite/backend/report.py
+import csv
+import json
+import math
+import logging
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from .instrumentation import timed
+from .taxonomy import AssetTaxonomy
+
+logger = logging.getLogger('frida_asset_suite')
+
+class StructuredReport:
+    """부대/캐릭터별로 구조화된 보고서입니다.
+
+    전체 목록을 한 번에 문자열로 만들지 않고, 요약(개수)만 먼저 보여준 뒤
+    에셋 목록은 그룹별 페이지 단위로 꺼내거나 파일로 스트리밍 내보내기 합니다.
+    부대/캐릭터 외에 에셋 분류·최상위 폴더·확장자·경로 깊이 패싯으로도 묶어 볼 수 있으며,
+    패싯은 처음 요청될 때 보고서 전체 경로에 대해 한 번만 계산합니다.
+    """
+    def __init__(self, title: str, report_data: Dict[str, Dict[str, List[str]]]):
+        self.title = title
+        self.report_data = report_data
+        # (부대, 캐릭터) 순서 고정. 라벨은 UI 선택지로 사용됩니다.
+        self._groups: List[Tuple[str, str]] = [
+            (squad, char_name)
+            for squad in sorted(report_data.keys())
+            for char_name in sorted(report_data[squad].keys())
+        ]
+        self._label_to_group = {self._label(*g): g for g in self._groups}
+        self._facet_frame = None # pd.DataFrame (path + 패싯 열), 지연 계산
+        self._facet_labels: Dict[str, Tuple[str, str]] = {} # 패싯 라벨 -> (패싯, 값)
+
+    @staticmethod
+    def _label(squad: str, char_name: str) -> str:
+        return f"{squad} / {char_name}"
+
+    @property
+    def total(self) -> int:
+        return sum(len(self.report_data[s][c]) for s, c in self._groups)
+
+    def squad_counts(self) -> Dict[str, int]:
+        return {squad: sum(len(assets) for assets in chars.values()) for squad, chars in sorted(self.report_data.items())}
+
+    def character_counts(self) -> Dict[str, int]:
+        return {self._label(s, c): len(self.report_data[s][c]) for s, c in self._groups}
+
+    def group_labels(self, facet: Optional[str] = None) -> List[str]:
+        """부대/캐릭터 그룹 라벨을 반환합니다. facet이 주어지면 해당 패싯 값의 라벨(개수 많은 순)을 반환합니다."""
+        if facet is None:
+            return [self._label(*g) for g in self._groups]
+        return [label for label, (f, _) in self._facets_by_label().items() if f == facet]
+
+    def _facets(self):
+        if self._facet_frame is None:
+            self._facet_frame = AssetTaxonomy().classify(asset for _, _, asset in self.iter_rows())
+        return self._facet_frame
+
+    def _facets_by_label(self) -> Dict[str, Tuple[str, str]]:
+        if not self._facet_labels and self._groups:
+            for facet, title in AssetTaxonomy.FACETS.items():
+                for value in self.facet_counts(facet):
+                    self._facet_labels[f"{title}: {value}"] = (facet, value)
+        return self._facet_labels
+
+    def facet_counts(self, facet: str) -> Dict[str, int]:
+        """패싯 값별 에셋 개수. (facet: AssetTaxonomy.FACETS의 키)"""
+        return AssetTaxonomy.facet_counts(self._facets(), facet)
+
+    def facet_assets(self, facet: str, value: str) -> List[str]:
+        """패싯 값에 해당하는 에셋 경로를 정렬된 순서로 반환합니다."""
+        frame = self._facets()
+        column = frame[facet]
+        mask = column == (int(value) if facet == "depth" else value)
+        return sorted(frame["path"][mask.to_numpy()].tolist())
+
+    def assets(self, label: str) -> List[str]:
+        group = self._label_to_group.get(label)
+        if group:
+            return self.report_data[group[0]][group[1]]
+        facet_value = self._facets_by_label().get(label)
+        return self.facet_assets(*facet_value) if facet_value else []
+
+    @timed("render")
+    def summary_markdown(self) -> str:
+        """총계와 부대/캐릭터별 개수만 담은 가벼운 마크다운을 반환합니다."""
+        if not self._groups:
+            return "### 지정한 조건에 해당하는 에셋을 찾지 못했습니다."
+        lines = [f"# 📝 {self.title}", f"총 {self.total}개의 에셋이 발견되었습니다.", "="*30]
+        for squad, count in self.squad_counts().items():
+            lines.append(f"\n## 🏢 부대: {squad} ({count}개)")
+            chars = self.report_data[squad]
+            lines.append(", ".join(f"👤 {name} ({len(chars[name])}개)" for name in sorted(chars.keys())))
+        return "\n".join(lines)
+
+    @timed("render")
+    def facet_markdown(self, facet: str, top: int = 20) -> str:
+        """패싯 값별 개수 표(상위 top개)를 마크다운으로 반환합니다."""
+        if not self._groups:
+            return ""
+        counts = self.facet_counts(facet)
+        lines = [f"### 🗂️ {AssetTaxonomy.FACETS[facet]}별 에셋 수 ({len(counts)}종)", "| 값 | 에셋 수 | 비율 |", "|---|---:|---:|"]
+        total = max(1, self.total)
+        lines.extend(f"| {value} | {count:,} | {count / total:.1%} |" for value, count in list(counts.items())[:top])
+        if len(counts) > top:
+            lines.append(f"| … 외 {len(counts) - top}종 | {sum(list(counts.values())[top:]):,} | |")
+        return "\n".join(lines)
+
+    @timed("render")
+    def page_markdown(self, label: Optional[str], page: int, page_size: int) -> str:
+        if not label or (label not in self._label_to_group and label not in self._facets_by_label()):
+            return ""
+        assets = self.assets(label)
+        total_pages = max(1, math.ceil(len(assets) / page_size))
+        page = min(max(1, page), total_pages)
+        icon = "👤" if label in self._label_to_group else "🗂️"
+        lines = [f"### {icon} {label} ({len(assets)}개) — {page}/{total_pages} 페이지"]
+        start = (page - 1) * page_size
+        lines.extend(f"  - {asset}" for asset in assets[start:start + page_size])
+        return "\n".join(lines)
+
+    def iter_rows(self) -> Iterator[Tuple[str, str, str]]:
+        for squad, char_name in self._groups:
+            for asset in self.report_data[squad][char_name]:
+                yield squad, char_name, asset
+
+    @timed("export")
+    def export_jsonl(self, output_path: Path) -> Path:
+        """한 줄에 에셋 하나씩 JSON Lines 형식으로 스트리밍 저장합니다."""
+        with open(output_path, 'w', encoding='utf-8') as f:
+            for squad, char_name, asset in self.iter_rows():
+                f.write(json.dumps({"squad": squad, "character": char_name, "path": asset}, ensure_ascii=False) + "\n")
+        logger.info(f"보고서 JSONL 내보내기 완료: '{Path(output_path).name}'")
+        return Path(output_path)
+
+    @timed("export")
+    def export_csv(self, output_path: Path) -> Path:
+        """squad,character,path 컬럼의 CSV로 스트리밍 저장합니다. (엑셀 호환을 위해 BOM 포함)"""
+        with open(output_path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["squad", "character", "path"])
+            writer.writerows(self.iter_rows())
+        logger.info(f"보고서 CSV 내보내기 완료: '{Path(output_path).name}'")
+        return Path(output_path)
+
+class TimelineReport:
+    """버전 타임라인 보고서입니다.
+
+    버전별 총계 표만 먼저 보여주고, 인접 버전 구간의 추가/삭제 에셋 목록은 구간별 페이지 단위로 꺼냅니다.
+    sections는 (구간 라벨, 부대/캐릭터별로 구조화된 보고서) 목록이며, history(path)는 (최초, 최종) 버전 이름을 반환합니다.
+    """
+    def __init__(self, versions: List[str], totals: List[int], delta_counts: List[Tuple[int, int]],
+                 sections: List[Tuple[str, StructuredReport]], history: Callable[[str], Optional[Tuple[str, str]]]):
+        self.versions = versions
+        self.totals = totals
+        self.delta_counts = delta_counts # [(추가 수, 삭제 수), ...] (필터 적용 전)
+        self._sections = dict(sections)
+        self._history = history
+        self._rows: Dict[str, List[Tuple[str, str, str]]] = {} # 구간 라벨 -> 행 목록, 처음 조회할 때 만듭니다.
+
+    def group_labels(self) -> List[str]:
+        return list(self._sections)
+
+    def _section_rows(self, label: str) -> List[Tuple[str, str, str]]:
+        if label not in self._rows:
+            self._rows[label] = list(self._sections[label].iter_rows())
+        return self._rows[label]
+
+    @timed("render")
+    def summary_markdown(self) -> str:
+        if not self.versions:
+            return "### 타임라인을 만들 카탈로그가 없습니다."
+        lines = [f"# 🗓️ 버전 타임라인 ({len(self.versions)}개 버전)", "="*30,
+                 "\n| 버전 | 총 에셋 | 추가 | 삭제 |\n|---|---:|---:|---:|"]
+        for name, total, (added, removed) in zip(self.versions, self.totals, self.delta_counts):
+            lines.append(f"| {name} | {total:,} | +{added:,} | -{removed:,} |")
+        lines.append("\n| 구간 | 필터 적용 후 에셋 |\n|---|---:|")
+        lines.extend(f"| {label} | {section.total:,} |" for label, section in self._sections.items())
+        return "\n".join(lines)
+
+    @timed("render")
+    def page_markdown(self, label: Optional[str], page: int, page_size: int) -> str:
+        if not label or label not in self._sections:
+            return ""
+        rows = self._section_rows(label)
+        total_pages = max(1, math.ceil(len(rows) / page_size))
+        page = min(max(1, page), total_pages)
+        lines = [f"### 📦 {label} ({len(rows)}개) — {page}/{total_pages} 페이지"]
+        group = None
+        start = (page - 1) * page_size
+        for squad, char_name, asset in rows[start:start + page_size]:
+            if (squad, char_name) != group:
+                group = (squad, char_name)
+                lines.append(f"\n#### 🏢 {squad} / 👤 {char_name}")
+            first, last = self._history(asset) or ("?", "?")
+            lines.append(f"  - {asset} (최초: {first}, 최종: {last})")
+        return "\n".join(lines)
@@ -0,0 +1,143 @@
+# frida_asset_suite/backend/search_index.py
+import logging
+from typing import Iterable, List, Optional
+import numpy as np
+from .instrumentation import timed
+from .path_store import CompactPathSet
+
+logger = logging.getLogger('frida_asset_suite')
+
+class TrigramIndex:
+    """카탈로그 경로에 대한 소문자 트라이그램 역색인입니다.
+
+    posting은 경로 번호가 아니라 _BLOCK개 경로 단위의 블록 번호입니다. 정렬된 경로는 이웃끼리 긴 접두사를 공유하므로
+    같은 블록 안의 중복 트라이그램이 하나로 합쳐져, 경로 번호로 색인할 때보다 posting 수가 크게 줄어듭니다.
+    각 트라이그램의 posting list는 정렬된 블록 번호 배열(하나의 연속 버퍼의 구간, 블록 수에 따라 uint16/uint32)입니다.
+    부분 문자열 검색은 posting을 교집합한 뒤 후보 블록의 경로만 실제 문자열로 검증합니다. 후보는 연속한 블록끼리 묶어
+    CompactPathSet에서 한 번에 꺼내므로 경로마다 블록을 처음부터 다시 복원하지 않습니다.
+    색인 크기가 max_bytes를 넘으면 색인을 버리고 전체 경로를 검사합니다.
+    """
+    _SEPARATOR = 0  # 경로 사이 구분 바이트. 구분자를 포함한 트라이그램은 색인하지 않습니다.
+    _BLOCK = CompactPathSet._BLOCK  # CompactPathSet 블록과 맞춰 후보 블록을 꺼낼 때 앞 경로를 버리지 않게 합니다.
+    # 한 번에 트라이그램을 계산하는 블록 수. 블록 번호를 키의 하위 8비트에 담아 (트라이그램 24비트, 블록 8비트)를 uint32 하나로 정렬합니다.
+    _CHUNK_BLOCKS = 256
+
+    def __init__(self, paths: Iterable[str], max_bytes: Optional[int] = None):
+        # CompactPathSet은 그대로 참조하므로 (색인을 만든 Set이면 covers()가 True) 경로 문자열을 복사하지 않습니다.
+        self.paths = CompactPathSet.from_paths(paths)
+        self.max_bytes = max_bytes
+        self._grams: Optional[np.ndarray] = None # None이면 색인 없이 전체 경로를 검사합니다.
+        self._offsets = np.zeros(1, dtype=np.uint32)
+        self._postings = np.empty(0, dtype=np.uint32)
+        self._build()
+
+    @staticmethod
+    def _lowered(entry: bytes) -> bytes:
+        """경로 바이트열을 str.lower()와 같은 규칙으로 소문자화합니다. (ASCII 경로는 디코딩하지 않습니다)"""
+        return entry.lower() if entry.isascii() else entry.decode('utf-8').lower().encode('utf-8')
+
+    def _chunk_keys(self, first: int) -> np.ndarray:
+        """first번째 경로부터 _CHUNK_BLOCKS개 블록의 고유한 (트라이그램 << 8 | 청크 안 블록 번호) 키를 정렬하여 반환합니다."""
+        entries = list(self.paths.iter_bytes(first, first + self._BLOCK * self._CHUNK_BLOCKS))
+        joined = b'\x00'.join(entries) + b'\x00'
+        if joined.isascii():
+            # ASCII 경로는 소문자화해도 길이가 같으므로 청크 전체를 한 번에 소문자화합니다.
+            joined = joined.lower()
+        else:
+            entries = [self._lowered(e) for e in entries]
+            joined = b'\x00'.join(entries) + b'\x00'
+        data = np.frombuffer(joined, dtype=np.uint8)
+        if len(data) < 3:
+            return np.empty(0, dtype=np.uint32)
+        lengths = np.fromiter(map(len, entries), dtype=np.int64, count=len(entries)) + 1
+        local_blocks = np.repeat(np.arange(len(entries), dtype=np.uint32) // self._BLOCK, lengths)
+        b0, b1, b2 = data[:-2], data[1:-1], data[2:]
+        valid = (b0 != self._SEPARATOR) & (b1 != self._SEPARATOR) & (b2 != self._SEPARATOR)
+        keys = ((b0.astype(np.uint32) << 24) | (b1.astype(np.uint32) << 16)
+                | (b2.astype(np.uint32) << 8) | local_blocks[:-2])
+        keys = keys[valid]
+        keys.sort()
+        return keys[np.concatenate(([True], keys[1:] != keys[:-1]))] if len(keys) else keys
+
+    @timed("index build")
+    def _build(self):
+        block_count = -(-len(self.paths) // self._BLOCK)
+        posting_dtype = np.uint16 if block_count <= 1 << 16 else np.uint32
+        entry_bytes = np.dtype(np.uint32).itemsize + np.dtype(posting_dtype).itemsize
+        gram_parts: List[np.ndarray] = []
+        block_parts: List[np.ndarray] = []
+        count = 0
+        for first in range(0, len(self.paths), self._BLOCK * self._CHUNK_BLOCKS):
+            keys = self._chunk_keys(first)
+            gram_parts.append(keys >> 8)
+            block_parts.append(((keys & 0xFF) + first // self._BLOCK).astype(posting_dtype))
+            count += len(keys)
+            if self.max_bytes is not None and count * entry_bytes > self.max_bytes:
+                logger.warning(f"트라이그램 색인이 한도({self.max_bytes / 2**20:.0f}MiB)를 넘어 색인 없이 검색합니다. "
+                               f"(경로 {len(self.paths):,}개)")
+                return
+
+        grams = np.concatenate(gram_parts) if gram_parts else np.empty(0, dtype=np.uint32)
+        # 청크 안에서는 (트라이그램, 블록) 순서이고 청크는 블록 순서이므로, 안정 정렬하면 posting이 블록 순서로 정렬됩니다.
+        order = np.argsort(grams, kind='stable')
+        self._postings = np.concatenate(block_parts)[order] if block_parts else self._postings
+        grams = grams[order]
+        del order
+        boundaries = np.flatnonzero(np.diff(grams)) + 1
+        self._grams = grams[np.concatenate(([0], boundaries)).astype(np.int64)] if len(grams) else grams
+        self._offsets = np.concatenate(([0], boundaries, [len(grams)])).astype(np.uint32)
+        logger.debug(f"트라이그램 색인 생성 완료: 경로 {len(self.paths):,}개, 트라이그램 {len(self._grams):,}개, "
+                     f"{self.nbytes / 2**20:.1f}MiB")
+
+    @property
+    def nbytes(self) -> int:
+        """색인이 차지하는 바이트 수. (경로 Set 제외)"""
+        grams = self._grams.nbytes if self._grams is not None else 0
+        return grams + self._offsets.nbytes + self._postings.nbytes
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def covers(self, paths) -> bool:
+        """paths가 이 색인을 만든 경로 Set 자체인지 반환합니다. (검색 결과를 paths로 다시 거를 필요가 없음)"""
+        return paths is self.paths
+
+    def _posting(self, gram: int) -> np.ndarray:
+        pos = int(np.searchsorted(self._grams, gram))
+        if pos >= len(self._grams) or self._grams[pos] != gram:
+            return self._postings[:0]
+        return self._postings[self._offsets[pos]:self._offsets[pos + 1]]
+
+    def _verify(self, starts: List[int], stops: List[int], needle: bytes) -> List[str]:
+        """[start, stop) 구간들의 경로를 한 번에 꺼내 소문자 needle을 포함하는 경로만 반환합니다."""
+        lowered = self._lowered
+        return [entry.decode('utf-8')
+                for start, stop in zip(starts, stops)
+                for entry in self.paths.iter_bytes(start, stop) if needle in lowered(entry)]
+
+    def narrows(self, keyword: str) -> bool:
+        """keyword의 후보를 색인으로 좁힐 수 있는지 여부. (False이면 search도 전체 경로를 확인합니다)"""
+        return self._grams is not None and len(keyword.lower().encode('utf-8')) >= 3
+
+    def search(self, keyword: str) -> List[str]:
+        """keyword를 (대소문자 구분 없이) 포함하는 경로를 정렬된 순서로 반환합니다."""
+        encoded = keyword.lower().encode('utf-8')
+        if not self.narrows(keyword):
+            # 트라이그램을 만들 수 없는 짧은 검색어(또는 색인이 없을 때)는 전체를 확인합니다.
+            return self._verify([0], [len(self.paths)], encoded)
+
+        grams = {(encoded[i] << 16) | (encoded[i + 1] << 8) | encoded[i + 2] for i in range(len(encoded) - 2)}
+        postings = sorted((self._posting(g) for g in grams), key=len)
+        candidates = postings[0]
+        for posting in postings[1:]:
+            if not len(candidates):
+                break
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+        if not len(candidates):
+            return []
+        # 연속한 후보 블록을 하나의 경로 구간으로 묶습니다.
+        candidates = candidates.astype(np.int64)
+        breaks = np.flatnonzero(np.diff(candidates) != 1) + 1
+        starts = candidates[np.concatenate(([0], breaks))] * self._BLOCK
+        stops = (candidates[np.concatenate((breaks - 1, [len(candidates) - 1]))] + 1) * self._BLOCK
+        return self._verify(starts.tolist(), stops.tolist(), encoded)
@@ -0,0 +1,115 @@
+# frida_asset_suite/backend/taxonomy.py
+import logging
+import numpy as np
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
+from .instrumentation import timed
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger('frida_asset_suite')
+
+def _pandas():
+    """pandas는 불러오는 데만 수백 ms가 걸리므로 첫 분류 때 불러옵니다."""
+    import pandas
+    return pandas
+
+class AssetTaxonomy:
+    """에셋 경로를 확장자 / 최상위 폴더 / 에셋 분류 / 경로 깊이로 나누는 분류기입니다.
+
+    경로 열 전체에 pandas 문자열 연산을 한 번씩 적용하여 계산하며, 경로마다 Python 루프를 돌지 않습니다.
+    """
+    # 패싯 키 -> UI 표시 이름
+    FACETS: Dict[str, str] = {
+        "category": "에셋 분류",
+        "folder": "최상위 폴더",
+        "extension": "확장자",
+        "depth": "경로 깊이",
+    }
+    # (분류, 경로에 포함된 키워드, 폴더 이름, 확장자) — 소문자 기준이며 여러 규칙이 맞으면 위쪽 규칙이 우선합니다.
+    CATEGORY_RULES: List[Tuple[str, Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]] = [
+        ("보이스", ("voice", "_vo_"), ("vo",), (".acb", ".awb")),
+        ("스파인", ("spine", ".skel."), (), (".atlas", ".skel")),
+        ("시나리오", ("scenario", "story"), ("adv",), ()),
+        ("사운드", ("sound", "bgm"), ("se",), (".ogg", ".wav", ".mp3")),
+        ("영상", ("movie",), (), (".mp4", ".usm")),
+        ("UI", (), ("ui",), ()),
+        ("텍스처", ("texture",), (), (".png", ".jpg", ".jpeg", ".tga", ".psd")),
+        ("모델", ("model",), (), (".fbx", ".mesh")),
+        ("머티리얼/셰이더", ("shader",), (), (".mat", ".shader")),
+        ("프리팹", (), (), (".prefab",)),
+        ("데이터", (), (), (".asset", ".json", ".bytes", ".txt", ".csv")),
+    ]
+    OTHER = "기타"
+    NONE = "(없음)"
+    ROOT = "(루트)"
+    # 최상위 폴더는 이 공통 접두사들을 (순서대로) 제외한 첫 폴더입니다.
+    _ROOT_PREFIXES = ("Assets/", "AddressableAssets/")
+
+    def __init__(self):
+        self._no_rule = len(self.CATEGORY_RULES)
+        self._rule_of_extension = {ext: i for i, (_, _, _, exts) in reversed(list(enumerate(self.CATEGORY_RULES))) for ext in exts}
+        self._labels = np.array([rule[0] for rule in self.CATEGORY_RULES] + [self.OTHER], dtype=object)
+
+    def _dir_facets(self, directory: str) -> Tuple[int, str, int]:
+        """폴더 경로 하나의 (분류 규칙 번호, 최상위 폴더, 깊이)."""
+        lowered = directory.lower()
+        segments = set(lowered.split("/"))
+        rule = next((i for i, (_, keywords, folders, _) in enumerate(self.CATEGORY_RULES)
+                     if any(k in lowered for k in keywords) or segments.intersection(folders)), self._no_rule)
+        relative = directory + "/"
+        for prefix in self._ROOT_PREFIXES:
+            if relative.startswith(prefix):
+                relative = relative[len(prefix):]
+        folder = relative.split("/", 1)[0] or self.ROOT
+        return rule, folder, directory.count("/") + 1 if directory else 0
+
+    @timed("taxonomy")
+    def classify(self, paths: Iterable[str]) -> "pd.DataFrame":
+        """path 열과 패싯 열(category, folder, extension, depth)을 가진 DataFrame을 반환합니다.
+
+        폴더 부분은 고유값(보통 수백 개)마다 한 번만 분류하고, 파일 이름 부분은 열 전체에 대한
+        키워드 포함 검사와 확장자 추출로 처리합니다.
+        """
+        pd = _pandas()
+        series = pd.Series(list(paths), dtype=object, name="path")
+        if series.empty:
+            return pd.DataFrame({"path": series, "category": pd.Categorical([]), "folder": pd.Categorical([]),
+                                 "extension": pd.Categorical([]), "depth": np.empty(0, dtype=np.int32)})
+
+        parts = series.str.rpartition("/")
+        dir_codes, dir_uniques = pd.factorize(parts[0])
+        dir_rule, dir_folder, dir_depth = (np.array(col) for col in zip(*(self._dir_facets(d) for d in dir_uniques)))
+        rule = dir_rule[dir_codes]
+
+        names = parts[2].str.lower()
+        for i, (_, keywords, _, _) in enumerate(self.CATEGORY_RULES):
+            for keyword in keywords:
+                # 이미 더 우선하는 규칙에 걸린 경로는 다시 검사하지 않습니다.
+                pending = np.flatnonzero(rule > i)
+                if not len(pending):
+                    break
+                hit = names.iloc[pending].str.contains(keyword, regex=False).to_numpy(dtype=bool)
+                rule[pending[hit]] = i
+
+        ext_codes, ext_uniques = pd.factorize(names.str.extract(r"(\.[0-9a-z]+)$", expand=False))
+        ext_rule = np.array([self._rule_of_extension.get(ext, self._no_rule) for ext in ext_uniques] + [self._no_rule])
+        rule = np.minimum(rule, ext_rule[ext_codes])
+        extension = pd.Categorical.from_codes(np.where(ext_codes < 0, len(ext_uniques), ext_codes),
+                                              categories=list(ext_uniques) + [self.NONE])
+
+        return pd.DataFrame({
+            "path": series,
+            "category": pd.Categorical(self._labels[rule]),
+            "folder": pd.Categorical(dir_folder[dir_codes]),
+            "extension": extension,
+            "depth": (dir_depth[dir_codes] + 1).astype(np.int32),
+        })
+
+    @staticmethod
+    def facet_counts(frame: "pd.DataFrame", facet: str) -> Dict[str, int]:
+        """패싯 값별 개수를 많은 순서로 반환합니다. (경로 깊이는 얕은 순서)"""
+        counts = frame[facet].value_counts(sort=facet != "depth")
+        if facet == "depth":
+            counts = counts.sort_index()
+        return {str(value): int(count) for value, count in counts.items() if count}
@@ -0,0 +1,144 @@
+# frida_asset_suite/backend/worker_pool.py
+import os
+import logging
+import threading
+import multiprocessing
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, Optional
+from .instrumentation import progress_scope, report_progress
+from .jobs import JobCancelled
+
+logger = logging.getLogger('frida_asset_suite')
+
+# 카탈로그 일괄 처리(CatalogPipeline)와 구간 병렬 검사(PathExtractor)가 함께 쓰는 프로세스 풀.
+# 호출마다 fork 풀을 만들면 그 시점에 다른 스레드(Gradio, 작업 큐, Drive 복사)가 잡고 있던 잠금이 잠긴 채로 복사될 수 있고,
+# spawn/forkserver는 작업자마다 __main__(Gradio 앱)을 다시 임포트합니다.
+# 그래서 앱/CLI 시작 시(작업 스레드가 생기기 전) 작업자를 한 번에 fork해 두고 프로세스가 끝날 때까지 재사용합니다.
+_lock = threading.Lock()
+_executor: Optional[ProcessPoolExecutor] = None
+_max_workers = 0
+_owner_pid: Optional[int] = None # 풀을 만든(또는 만들지 않기로 한) 프로세스. 작업자 프로세스 안에서는 풀을 쓰지 않습니다.
+
+# 작업자가 처리한 바이트 수를 부모 프로세스의 진행률 콜백(작업 큐의 Job)으로 전달하고, 취소 요청을 작업자에 알리는 공유 메모리.
+# 작업자가 물려받을 수 있도록 fork 전에 만들며, 슬롯 하나는 [decrypt 바이트, gunzip 바이트, 취소 플래그]입니다.
+PROGRESS_SLOTS = 32
+_PROGRESS_KINDS = ("decrypt", "gunzip")
+_SLOT_WIDTH = len(_PROGRESS_KINDS) + 1
+_progress_counters = None
+_free_slots: list = []
+
+def start_worker_pool(max_workers: Optional[int] = None) -> bool:
+    """공유 프로세스 풀을 만들고 작업자를 모두 미리 fork합니다. 풀을 사용할 수 있으면 True를 반환합니다.
+
+    다른 스레드가 생기기 전(앱/CLI 시작 시)에 호출해야 합니다. 작업자가 1개 이하이거나 fork를 지원하지 않으면 풀 없이 처리합니다.
+    """
+    global _executor, _max_workers, _owner_pid, _progress_counters, _free_slots
+    with _lock:
+        if _owner_pid == os.getpid():
+            return _executor is not None
+        # 작업자 프로세스가 이 값을 물려받아 자기 안에서 다시 풀을 만들지 않도록 fork 전에 기록합니다.
+        _owner_pid = os.getpid()
+        workers = max_workers or os.cpu_count() or 1
+        if workers <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+            logger.debug("프로세스 풀 없이 현재 프로세스에서 처리합니다.")
+            return False
+        context = multiprocessing.get_context('fork')
+        _progress_counters = context.RawArray('q', PROGRESS_SLOTS * _SLOT_WIDTH)
+        _free_slots = list(range(PROGRESS_SLOTS))
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        # fork 방식의 풀은 첫 submit 때 작업자를 모두 만들므로, 지금 빈 작업을 하나 보내 작업자를 미리 만들어 둡니다.
+        executor.submit(os.getpid).result()
+        _executor, _max_workers = executor, workers
+        logger.info(f"프로세스 풀 준비 완료: 작업자 {workers}개")
+        return True
+
+def get_worker_pool() -> Optional[ProcessPoolExecutor]:
+    """공유 프로세스 풀을 반환합니다. 풀이 없으면 None을 반환하며, 호출자는 현재 프로세스에서 처리해야 합니다.
+
+    아직 풀을 만들지 않았고 현재 스레드가 유일한 스레드라면(스크립트, 벤치마크 등) 이 자리에서 안전하게 만듭니다.
+    """
+    with _lock:
+        if _owner_pid is not None:
+            return _executor if _owner_pid == os.getpid() else None
+    if threading.active_count() == 1 and start_worker_pool():
+        return _executor
+    return None
+
+def worker_pool_size() -> int:
+    """공유 프로세스 풀의 작업자 수. 풀이 없으면 1입니다."""
+    return _max_workers if _executor is not None and _owner_pid == os.getpid() else 1
+
+def discard_worker_pool(executor: ProcessPoolExecutor):
+    """작업자가 비정상 종료되어 사용할 수 없게 된(BrokenProcessPool) 풀을 버립니다. 이후에는 현재 프로세스에서 처리합니다."""
+    global _executor, _max_workers
+    with _lock:
+        if _executor is executor:
+            logger.warning("프로세스 풀을 사용할 수 없게 되어 현재 프로세스에서 처리합니다.")
+            _executor, _max_workers = None, 0
+    executor.shutdown(wait=False, cancel_futures=True)
+
+def shutdown_worker_pool():
+    """공유 프로세스 풀을 닫고 작업자가 끝날 때까지 기다립니다. (측정 스크립트 등에서 작업자 자원 사용량을 집계할 때)"""
+    global _executor, _max_workers, _owner_pid
+    with _lock:
+        executor = _executor if _owner_pid == os.getpid() else None
+        _executor, _max_workers, _owner_pid = None, 0, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+class ProgressSlot:
+    """작업자 하나의 진행률/취소 슬롯. 부모 프로세스에서 acquire_progress_slot()으로 얻고 작업이 끝나면 release()합니다."""
+    def __init__(self, index: int):
+        self.index = index
+        self._base = index * _SLOT_WIDTH
+        self._counters = _progress_counters
+        self._seen = [0] * len(_PROGRESS_KINDS)
+
+    def forward(self):
+        """작업자가 지난 호출 이후 처리한 바이트 수를 현재 진행률 콜백으로 전달합니다. 콜백이 던지는 취소 예외는 호출자에게 전달됩니다."""
+        for i, kind in enumerate(_PROGRESS_KINDS):
+            total = self._counters[self._base + i]
+            report_progress(kind, total - self._seen[i])
+            self._seen[i] = total
+
+    def cancel(self):
+        """작업자가 다음 청크를 처리할 때 JobCancelled로 중단하도록 알립니다."""
+        self._counters[self._base + len(_PROGRESS_KINDS)] = 1
+
+    def release(self):
+        with _lock:
+            if self._counters is _progress_counters: # 풀을 다시 만들었으면 이전 슬롯은 돌려주지 않습니다.
+                _free_slots.append(self.index)
+
+def acquire_progress_slot() -> Optional[ProgressSlot]:
+    """빈 진행률 슬롯을 반환합니다. 풀이 없거나 슬롯이 모두 사용 중이면 None을 반환합니다."""
+    with _lock:
+        if _executor is None or _owner_pid != os.getpid() or not _free_slots:
+            return None
+        index = _free_slots.pop()
+        base = index * _SLOT_WIDTH
+        _progress_counters[base:base + _SLOT_WIDTH] = [0] * _SLOT_WIDTH
+    return ProgressSlot(index)
+
+@contextlib.contextmanager
+def worker_progress(index: Optional[int]) -> Iterator[None]:
+    """작업자 프로세스 안에서 report_progress()로 보고되는 처리량을 진행률 슬롯에 기록합니다. (index가 None이면 아무것도 하지 않음)
+
+    부모가 슬롯에 취소를 알렸으면 다음 보고 시점에 JobCancelled로 처리를 중단합니다.
+    """
+    if index is None:
+        yield
+        return
+    base = index * _SLOT_WIDTH
+    offsets = {kind: base + i for i, kind in enumerate(_PROGRESS_KINDS)}
+
+    def record(kind: str, nbytes: int):
+        if _progress_counters[base + len(_PROGRESS_KINDS)]:
+            raise JobCancelled(index)
+        offset = offsets.get(kind)
+        if offset is not None:
+            _progress_counters[offset] += nbytes
+
+    with progress_scope(record):
+        yield
@@ -0,0 +1,64 @@
+# frida_asset_suite/benchmarks/bench_character_matcher.py
+"""_filter_and_structure_paths의 캐릭터 분류 단계를 기존 이중 루프와 사전 컴파일 매처로 비교합니다.
+
+사용법: python benchmarks/bench_character_matcher.py [--paths 200000] [--seed 0]
+"""
+import argparse
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.data_models import CharacterManager
+from backend.analysis import AssetComparer
+from benchmarks.synthetic import make_synthetic_paths
+
+
+def legacy_classify(char_manager, paths):
+    """기존 _filter_and_structure_paths의 경로 × 캐릭터 이중 루프 (필터 없음)."""
+    report_data = defaultdict(lambda: defaultdict(list))
+    for path in sorted(paths):
+        found_char = False
+        for code, info in char_manager.char_data.items():
+            if f"_{code.lower()}_" in path.lower() or f"/{code.lower()}/" in path.lower():
+                report_data[info['squad']][info['name']].append(path)
+                found_char = True
+                break
+        if not found_char:
+            report_data["기타"]["공용/미분류 에셋"].append(path)
+    return report_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paths", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    char_manager = CharacterManager(str(PROJECT_ROOT / "data" / "character_info.csv"))
+    comparer = AssetComparer(char_manager)
+    paths = make_synthetic_paths(list(char_manager.char_data), args.paths, args.seed)
+
+    start = time.perf_counter()
+    legacy = legacy_classify(char_manager, paths)
+    legacy_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    current = comparer._filter_and_structure_paths(paths, None, None, None)
+    current_sec = time.perf_counter() - start
+
+    if legacy != current:
+        print("❌ 분류 결과가 기존 구현과 다릅니다.")
+        return 1
+    print(f"경로 수: {len(paths):,}")
+    print(f"기존 이중 루프   : {legacy_sec:8.3f}s")
+    print(f"사전 컴파일 매처 : {current_sec:8.3f}s")
+    print(f"속도 향상        : {legacy_sec / current_sec:8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+# frida_asset_suite/benchmarks/bench_extraction.py
+"""복호화된 바이너리에서의 경로 추출을 기존 방식(전체 read + findall + 매치마다 디코딩)과 mmap 구간 병렬 방식으로 비교합니다.
+
+사용법: python benchmarks/bench_extraction.py [--size-mb 256] [--workers 1,2,4] [--seed 0]
+
+시간은 추적 없이 측정하고, Python 할당 최대량은 tracemalloc으로 따로 측정합니다. (mmap 영역은 할당에 포함되지 않습니다)
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.decryption import CatalogDecryptor
+from backend.extraction import PathExtractor
+from benchmarks.synthetic import estimate_path_count, load_character_codes, write_encrypted_catalog
+
+
+def legacy_extract(binary_path: Path) -> set:
+    """기존 extract_from_binary: 파일 전체를 읽어 한 스레드에서 findall 후 매치마다 디코딩."""
+    with open(binary_path, 'rb') as f:
+        content = f.read()
+    return {m.decode('utf-8') for m in PathExtractor._ASSET_PATH_PATTERN.findall(content)}
+
+
+def prepare_binary(work_dir: Path, size_mb: int, seed: int) -> Path:
+    binary_path = work_dir / f"bench_{size_mb}mb_s{seed}.bin"
+    if binary_path.exists():
+        return binary_path
+    codes = load_character_codes(PROJECT_ROOT / "data" / "character_info.csv")
+    key, iv = os.urandom(16), os.urandom(16)
+    encrypted = work_dir / "bench_extraction.enc"
+    write_encrypted_catalog(encrypted, codes, estimate_path_count(codes, size_mb << 20, seed), key, iv, seed=seed)
+    if not CatalogDecryptor(key.hex(), iv.hex()).decrypt_file(str(encrypted), str(binary_path)):
+        raise RuntimeError("합성 카탈로그 복호화 실패")
+    encrypted.unlink()
+    return binary_path
+
+
+def measure(func) -> tuple:
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 2**20
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=256, help="복호화된 바이너리 크기 (MB)")
+    parser.add_argument("--workers", default=f"1,{os.cpu_count() or 1}", help="작업자 수 목록, 쉼표 구분")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--work-dir", type=Path, default=Path(tempfile.gettempdir()) / "frida_bench_catalogs")
+    args = parser.parse_args()
+    args.work_dir.mkdir(parents=True, exist_ok=True)
+
+    binary_path = prepare_binary(args.work_dir, args.size_mb, args.seed)
+    print(f"바이너리: {binary_path.stat().st_size / 2**20:.1f} MiB, CPU {os.cpu_count()}개")
+
+    reference, legacy_sec, legacy_peak = measure(lambda: legacy_extract(binary_path))
+    print(f"기존 방식         : {legacy_sec:8.3f}s  할당 최대 {legacy_peak:8.1f} MiB  ({len(reference):,}개 경로)")
+    for workers in sorted({int(w) for w in args.workers.split(",") if w}):
+        extractor = PathExtractor(workers=workers)
+        paths, sec, peak = measure(lambda: extractor.extract_from_binary(str(binary_path)))
+        if paths != reference:
+            print(f"❌ 작업자 {workers}개: 추출 결과가 기존 방식과 다릅니다.")
+            return 1
+        print(f"mmap 구간 (작업자 {workers:>2}): {sec:8.3f}s  할당 최대 {peak:8.1f} MiB  속도 {legacy_sec / sec:5.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
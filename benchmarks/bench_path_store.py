@@ -0,0 +1,69 @@
+# frida_asset_suite/benchmarks/bench_path_store.py
+"""경로 Set(str)과 CompactPathSet의 메모리 사용량과 차집합 속도를 비교합니다.
+
+사용법: python benchmarks/bench_path_store.py [--paths 200000] [--seed 0]
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.data_models import CharacterManager
+from backend.path_store import CompactPathSet
+from benchmarks.synthetic import make_synthetic_paths
+
+
+def measure(build):
+    """build()가 만든 객체와 그 객체가 차지하는 메모리(바이트)를 반환합니다."""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paths", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    char_manager = CharacterManager(str(PROJECT_ROOT / "data" / "character_info.csv"))
+    codes = list(char_manager.char_data)
+    # 실제 업데이트처럼 과거 버전은 신규 버전의 약 97%를 공유하도록 만듭니다.
+    new_paths = sorted(make_synthetic_paths(codes, args.paths, args.seed))
+    old_paths = set(new_paths[::33]) ^ set(new_paths) | set(list(make_synthetic_paths(codes, args.paths // 50, args.seed + 1)))
+    # 문자열 객체까지 측정하도록 blob에서 새로 만듭니다.
+    new_blob = b'\n'.join(p.encode('utf-8') for p in new_paths)
+    old_blob = b'\n'.join(sorted(p.encode('utf-8') for p in old_paths))
+    del new_paths, old_paths
+
+    new_set, set_bytes = measure(lambda: set(new_blob.decode('utf-8').split('\n')))
+    old_set = set(old_blob.decode('utf-8').split('\n'))
+    new_compact, compact_bytes = measure(lambda: CompactPathSet.from_sorted_blob(new_blob))
+    old_compact = CompactPathSet.from_sorted_blob(old_blob)
+
+    start = time.perf_counter()
+    set_added = new_set - old_set
+    set_sec = time.perf_counter() - start
+    start = time.perf_counter()
+    compact_added = new_compact - old_compact
+    compact_sec = time.perf_counter() - start
+
+    if set(compact_added) != set_added:
+        print("❌ 차집합 결과가 Set과 다릅니다.")
+        return 1
+    print(f"경로 수: {len(new_set):,} (추가된 경로 {len(set_added):,}개)")
+    print(f"Set[str] 메모리       : {set_bytes / 2**20:8.1f} MiB")
+    print(f"CompactPathSet 메모리 : {compact_bytes / 2**20:8.1f} MiB ({set_bytes / compact_bytes:.1f}x 절감)")
+    print(f"Set 차집합            : {set_sec:8.3f}s")
+    print(f"병합 차집합           : {compact_sec:8.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+# frida_asset_suite/benchmarks/bench_search_index.py
+"""키워드 필터링을 트라이그램 색인과 전체 경로 선형 검사로 비교합니다. (넓은/좁은 검색어)
+
+사용법: python benchmarks/bench_search_index.py [--paths 200000] [--seed 0] [--repeat 3]
+
+- search: TrigramIndex.search와 경로마다 소문자 부분 문자열 검사
+- filter: 분석 보고서의 _filter_and_structure_paths (색인 사용/미사용, 캐릭터 분류 포함)
+색인이 선형 검사보다 느린 검색어가 있거나 결과가 다르면 1을 반환합니다.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.data_models import CharacterManager
+from backend.analysis import AssetComparer
+from backend.path_store import CompactPathSet
+from backend.search_index import TrigramIndex
+from benchmarks.synthetic import make_synthetic_paths
+
+
+def best_of(repeat: int, func):
+    """func를 repeat번 실행한 최소 시간(초)과 마지막 결과를 반환합니다."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def scan(paths, keyword: str) -> list:
+    keyword_lower = keyword.lower()
+    return [p for p in paths if keyword_lower in p.lower()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paths", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    char_manager = CharacterManager(str(PROJECT_ROOT / "data" / "character_info.csv"))
+    comparer = AssetComparer(char_manager)
+    codes = list(char_manager.char_data)
+    paths = CompactPathSet.from_paths(make_synthetic_paths(codes, args.paths, args.seed))
+    build_sec, index = best_of(1, lambda: TrigramIndex(paths))
+    # 넓은 검색어(폴더 이름, 경로의 약 1/7)와 좁은 검색어(캐릭터 코드, 파일 이름 일부)
+    keywords = [("넓은", "voice"), ("넓은", "Spine/"), ("좁은", codes[0]), ("좁은", "_07.ogg")]
+
+    print(f"경로 수: {len(paths):,}, 색인 생성 {build_sec:.3f}s")
+    failed = False
+    for kind, keyword in keywords:
+        index_sec, found = best_of(args.repeat, lambda: index.search(keyword))
+        scan_sec, expected = best_of(args.repeat, lambda: scan(paths, keyword))
+        filter_index_sec, with_index = best_of(
+            args.repeat, lambda: comparer._filter_and_structure_paths(paths, None, None, keyword, index))
+        filter_scan_sec, without_index = best_of(
+            args.repeat, lambda: comparer._filter_and_structure_paths(paths, None, None, keyword))
+        if found != expected or with_index != without_index:
+            print(f"❌ '{keyword}' 검색 결과가 선형 검사와 다릅니다.")
+            return 1
+        ok = index_sec < scan_sec and filter_index_sec < filter_scan_sec
+        failed |= not ok
+        print(f"{kind} '{keyword}' ({len(found):,}개) {'✅' if ok else '❌'}")
+        print(f"  search : 색인 {index_sec * 1000:8.1f}ms / 선형 검사 {scan_sec * 1000:8.1f}ms")
+        print(f"  filter : 색인 {filter_index_sec * 1000:8.1f}ms / 선형 검사 {filter_scan_sec * 1000:8.1f}ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+# frida_asset_suite/benchmarks/bench_startup.py
+"""백엔드 모듈과 웹 UI의 콜드 스타트 시간을 새 인터프리터에서 측정하고 목표 시간과 비교합니다.
+
+사용법: python benchmarks/bench_startup.py [--repeat 5] [--backend-target 0.25] [--ui-target 4.0]
+
+- backend: CLI/앱이 시작할 때 불러오는 백엔드 모듈 import + CharacterManager/파이프라인 생성
+- ui: frontend/app.py import (백엔드 초기화 + Gradio Blocks 구성) + launch()가 서버 실행 전에 하는 프로세스 풀 작업자 fork.
+  서버 실행은 제외하며, 작업자 fork 시간은 따로 표시합니다. gradio가 없으면 건너뜁니다.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# 측정 대상 코드는 인터프리터 시작 이후부터 잽니다. (python 자체 시작 시간은 환경마다 달라 제외)
+_BACKEND_SNIPPET = """
+import time
+t0 = time.perf_counter()
+import config
+from backend.decryption import CatalogDecryptor, CatalogKeyRing
+from backend.extraction import PathExtractor
+from backend.data_models import CharacterManager
+from backend.analysis import AssetComparer
+from backend.pipeline import CatalogPipeline
+from backend.cache import ProcessedCatalogCache
+from backend.catalog_parser import CatalogParser
+from backend.report import StructuredReport
+from backend.taxonomy import AssetTaxonomy
+from backend.history_store import CatalogHistoryStore
+from backend.jobs import JobManager
+char_manager = CharacterManager(str(config.CHARACTER_INFO_CSV))
+comparer = AssetComparer(char_manager)
+pipeline = CatalogPipeline(CatalogDecryptor("00" * 16, "00" * 16), PathExtractor(), parser=CatalogParser())
+elapsed = time.perf_counter() - t0
+import sys
+print("STARTUP", elapsed, "pandas" in sys.modules, "Crypto.Cipher.AES" in sys.modules)
+"""
+
+_UI_SNIPPET = """
+import time
+t0 = time.perf_counter()
+import frontend.app
+t1 = time.perf_counter()
+from backend.worker_pool import start_worker_pool
+start_worker_pool()
+t2 = time.perf_counter()
+print("POOL", t2 - t1)
+print("STARTUP", t2 - t0, False, False)
+"""
+
+
+def measure(snippet: str, repeat: int, env: dict) -> dict:
+    """snippet을 새 프로세스에서 repeat번 실행하여 측정값(초)의 중앙값/최솟값을 반환합니다."""
+    samples, pool_samples, lazy = [], [], None
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, "-c", snippet], cwd=PROJECT_ROOT, env=env,
+                              capture_output=True, text=True)
+        line = next((l for l in proc.stdout.splitlines() if l.startswith("STARTUP")), None)
+        if proc.returncode != 0 or line is None:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "측정 실패")
+        _, seconds, pandas_loaded, crypto_loaded = line.split()
+        samples.append(float(seconds))
+        pool_samples += [float(l.split()[1]) for l in proc.stdout.splitlines() if l.startswith("POOL")]
+        lazy = {"pandas_loaded": pandas_loaded == "True", "crypto_loaded": crypto_loaded == "True"}
+    result = {"median_s": round(statistics.median(samples), 4), "min_s": round(min(samples), 4), **lazy}
+    if pool_samples:
+        result["pool_median_s"] = round(statistics.median(pool_samples), 4)
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--backend-target", type=float, default=0.25, help="백엔드 콜드 스타트 목표 (초, 중앙값)")
+    parser.add_argument("--ui-target", type=float, default=4.0, help="웹 UI 콜드 스타트 목표 (초, 중앙값)")
+    parser.add_argument("--output", type=Path, default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.setdefault("AES_KEY_HEX", "00" * 16)
+    env.setdefault("AES_IV_HEX", "00" * 16)
+
+    results, failed = {}, False
+    for name, snippet, target in (("backend", _BACKEND_SNIPPET, args.backend_target), ("ui", _UI_SNIPPET, args.ui_target)):
+        if name == "ui":
+            try:
+                import gradio  # noqa: F401
+            except ImportError:
+                print("ui      : gradio가 설치되어 있지 않아 건너뜁니다.")
+                continue
+        result = {**measure(snippet, args.repeat, env), "target_s": target}
+        result["ok"] = result["median_s"] <= target
+        failed |= not result["ok"]
+        results[name] = result
+        print(f"{name:<8}: 중앙값 {result['median_s']:.3f}s (최소 {result['min_s']:.3f}s) / 목표 {target:.2f}s "
+              f"{'✅' if result['ok'] else '❌'}")
+        if "pool_median_s" in result:
+            print(f"          그중 프로세스 풀 작업자 fork: 중앙값 {result['pool_median_s']:.3f}s")
+        if name == "backend":
+            print(f"          시작 시 불러온 무거운 모듈: pandas={result['pandas_loaded']}, pycryptodome={result['crypto_loaded']}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+# frida_asset_suite/benchmarks/run_benchmarks.py
+"""합성 암호화 카탈로그로 백엔드 단계별 처리량/최대 메모리와 단일·비교 보고서 전체 시간을 측정합니다.
+
+사용법:
+    python benchmarks/run_benchmarks.py --sizes 1,16,64             # 해제 기준 MB 크기
+    python benchmarks/run_benchmarks.py --sizes 1024 --cases single-regex
+    python benchmarks/run_benchmarks.py --save-baseline              # 현재 결과를 기준선으로 저장
+결과는 --output(JSON)에 기록되며, 기준선(--baseline)이 있으면 허용 오차를 넘게 느려진 항목을 표시하고 종료 코드 1을 반환합니다.
+각 측정은 별도 프로세스에서 실행하여 최대 RSS가 다른 측정의 영향을 받지 않도록 합니다.
+작업자 프로세스(비교 측정의 프로세스 풀)의 최대 RSS는 workers_peak_rss_mb로 따로 기록합니다. (작업자 중 가장 큰 값)
+기준선은 측정하는 컴퓨터에서 --save-baseline으로 만들어 두는 파일이며(저장소에는 포함하지 않음),
+기준선의 측정 환경(environment: Python, 플랫폼, CPU 수)이 이번 측정과 다르면 비교 결과만 표시하고 실패로 처리하지 않습니다.
+"""
+import argparse
+import hashlib
+import json
+import multiprocessing
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import estimate_path_count, load_character_codes, write_encrypted_catalog
+
+CHARACTER_CSV = PROJECT_ROOT / "data" / "character_info.csv"
+DEFAULT_OUTPUT = PROJECT_ROOT / "benchmarks" / "results" / "latest.json"
+DEFAULT_BASELINE = PROJECT_ROOT / "benchmarks" / "baseline.json"
+CASES = ["single-regex", "single-structured", "comparison"]
+# 이보다 짧은 측정은 잡음이 커서 시간 저하 판정에서 제외합니다. (메모리는 항상 비교)
+MIN_COMPARABLE_WALL_S = 0.25
+
+
+def _bench_key(seed: int):
+    """재현 가능한 일회용 Key/IV (실제 게임 키와 무관)."""
+    digest = hashlib.sha256(f"frida-bench-{seed}".encode()).digest()
+    return digest[:16], digest[16:]
+
+
+def prepare_catalog(work_dir: Path, size_mb: int, seed: int, variant: int = 0) -> Path:
+    """크기/시드/버전별 합성 카탈로그를 만들고, 이미 있으면 재사용합니다."""
+    output_path = work_dir / f"synthetic_{size_mb}mb_s{seed}_v{variant}.bin"
+    if output_path.exists():
+        return output_path
+    codes = load_character_codes(CHARACTER_CSV)
+    count = estimate_path_count(codes, size_mb * 1024 * 1024, seed)
+    key, iv = _bench_key(seed)
+    start = time.perf_counter()
+    tmp_path = output_path.with_suffix(".tmp")
+    plain, encrypted = write_encrypted_catalog(tmp_path, codes, count, key, iv, seed=seed, variant=variant)
+    tmp_path.replace(output_path)
+    print(f"  합성 카탈로그 생성: {output_path.name} (해제 {plain / 1e6:.1f} MB, 암호문 {encrypted / 1e6:.1f} MB, "
+          f"{time.perf_counter() - start:.1f}s)")
+    return output_path
+
+
+def _run_case(case: str, catalogs: list, seed: int) -> dict:
+    """자식 프로세스에서 한 가지 측정을 수행합니다."""
+    import resource
+    from backend.analysis import AssetComparer
+    from backend.catalog_parser import CatalogParser
+    from backend.data_models import CharacterManager
+    from backend.decryption import CatalogDecryptor
+    from backend.extraction import PathExtractor
+    from backend.instrumentation import RunProfile
+    from backend.pipeline import CatalogPipeline
+    from backend.worker_pool import shutdown_worker_pool
+
+    key, iv = _bench_key(seed)
+    decryptor = CatalogDecryptor(key.hex(), iv.hex())
+    parser = CatalogParser() if case == "single-structured" else None
+    pipeline = CatalogPipeline(decryptor, PathExtractor(), parser=parser)
+    comparer = AssetComparer(CharacterManager(str(CHARACTER_CSV)))
+
+    with RunProfile(case) as profile:
+        if case == "comparison":
+            new_paths, old_paths = pipeline.extract_paths_many(catalogs)
+            report = comparer.build_comparison_report_from_paths(new_paths, old_paths, "new", "old", [], [], "")
+        else:
+            paths = pipeline.extract_paths(catalogs[0])
+            report = comparer.build_single_report_from_paths(paths, "catalog", [], [], "")
+        report.summary_markdown()
+    # 작업자를 종료해야 RUSAGE_CHILDREN에 작업자의 최대 RSS가 집계됩니다.
+    shutdown_worker_pool()
+
+    plain_bytes = sum(r["bytes_out"] for name, r in profile.stages.items() if name.endswith("gunzip"))
+    stages = {}
+    for name, r in profile.stages.items():
+        processed = r["bytes_in"] or r["bytes_out"]
+        stages[name] = {**r, "throughput_mb_s": round(processed / 1e6 / r["wall_s"], 2) if processed and r["wall_s"] else None}
+    return {
+        "wall_s": round(profile.wall_s, 4),
+        "cpu_s": round(profile.cpu_s, 4),
+        "plain_mb": round(plain_bytes / 1e6, 2),
+        "throughput_mb_s": round(plain_bytes / 1e6 / profile.wall_s, 2) if profile.wall_s else None,
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "workers_peak_rss_mb": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1),
+        "stages": stages,
+    }
+
+
+def run_isolated(case: str, catalogs: list, seed: int) -> dict:
+    # spawn으로 매번 새 프로세스를 띄워 최대 RSS를 측정 단위별로 분리합니다.
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(_run_case, case, [str(c) for c in catalogs], seed).result()
+
+
+def check_regressions(results: list, baseline: dict, tolerance: float) -> list:
+    """기준선보다 (1 + tolerance)배 넘게 느려졌거나 메모리를 더 쓴 항목을 반환합니다."""
+    base = {(r["case"], r["size_mb"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for r in results:
+        b = base.get((r["case"], r["size_mb"]))
+        if not b:
+            continue
+        for metric in ("wall_s", "peak_rss_mb", "workers_peak_rss_mb"):
+            if metric == "wall_s" and (b.get(metric) or 0) < MIN_COMPARABLE_WALL_S:
+                continue
+            if b.get(metric) and r.get(metric, 0) > b[metric] * (1 + tolerance):
+                regressions.append(f"{r['case']} @ {r['size_mb']} MB: {metric} {b[metric]} → {r[metric]}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1,16,64", help="해제 기준 카탈로그 크기(MB), 쉼표 구분 (예: 1,16,64,256,1024)")
+    parser.add_argument("--cases", default=",".join(CASES), help=f"측정 항목, 쉼표 구분 ({', '.join(CASES)})")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--work-dir", type=Path, default=Path(tempfile.gettempdir()) / "frida_bench_catalogs")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.2, help="기준선 대비 허용 비율 (기본 20%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준선 파일로 저장")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    cases = [c for c in args.cases.split(",") if c]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"알 수 없는 측정 항목: {', '.join(sorted(unknown))}")
+    args.work_dir.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    for size_mb in sizes:
+        print(f"[{size_mb} MB]")
+        new_catalog = prepare_catalog(args.work_dir, size_mb, args.seed)
+        for case in cases:
+            catalogs = [new_catalog]
+            if case == "comparison":
+                catalogs.append(prepare_catalog(args.work_dir, size_mb, args.seed, variant=1))
+            result = {"case": case, "size_mb": size_mb, **run_isolated(case, catalogs, args.seed)}
+            results.append(result)
+            print(f"  {case:<18} {result['wall_s']:8.3f}s  {result['throughput_mb_s'] or 0:8.1f} MB/s  "
+                  f"최대 RSS {result['peak_rss_mb']:8.1f} MB (작업자 {result['workers_peak_rss_mb']:.1f} MB)")
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": {"python": platform.python_version(), "platform": platform.platform(),
+                        "cpu_count": multiprocessing.cpu_count()},
+        "seed": args.seed,
+        "results": results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"결과 저장: {args.output}")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"기준선 저장: {args.baseline}")
+        return 0
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        same_environment = baseline.get("environment") == report["environment"]
+        if not same_environment:
+            print(f"ℹ️ 기준선과 측정 환경이 다릅니다. (기준선: {baseline.get('environment')}) 비교 결과는 참고용이며 실패로 처리하지 않습니다.")
+        regressions = check_regressions(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"{'⚠️ 성능 저하' if same_environment else 'ℹ️ 기준선보다 느림'}: {line}")
+        if regressions and same_environment:
+            return 1
+        if not regressions:
+            print("✅ 기준선 대비 성능 저하 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+# frida_asset_suite/benchmarks/synthetic.py
+"""벤치마크용 합성 카탈로그 생성기.
+
+실제 게임 데이터 없이, character_info.csv의 캐릭터 코드가 섞인 'Assets/...' 경로로
+Addressables 형식의 카탈로그 JSON을 만들고 GZip 압축 + 일회용 키로 AES-CBC 암호화합니다.
+큰 카탈로그(1 GB 이상)도 메모리에 한 번에 올리지 않도록 모든 단계를 스트리밍으로 씁니다.
+"""
+import base64
+import csv
+import gzip
+import io
+import json
+import os
+import random
+import struct
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad
+
+_FOLDERS = ["Voice", "Spine", "Texture", "Scenario", "Sound", "Prefab", "UI"]
+_EXTS = [".png", ".asset", ".prefab", ".ogg", ".json", ".atlas"]
+_PROVIDERS = [
+    "UnityEngine.ResourceManagement.ResourceProviders.AssetBundleProvider",
+    "UnityEngine.ResourceManagement.ResourceProviders.BundledAssetProvider",
+]
+# 버전 간 비교용: variant가 다르면 이 비율(1/N)의 경로가 바뀝니다.
+_VARIANT_EVERY = 20
+
+
+def load_character_codes(csv_path: Path) -> List[str]:
+    with open(csv_path, encoding='utf-8-sig', newline='') as f:
+        return [row['게임코드'] for row in csv.DictReader(f) if row.get('게임코드')]
+
+
+def iter_paths(codes: List[str], count: int, seed: int = 0, variant: int = 0) -> Iterator[str]:
+    """결정적인 합성 경로를 count개 생성합니다. 같은 인자로 다시 호출하면 같은 순서로 생성됩니다."""
+    rng = random.Random(seed)
+    for i in range(count):
+        folder = rng.choice(_FOLDERS)
+        name = f"asset_{rng.randrange(10 ** 7)}"
+        roll = rng.random()
+        code = rng.choice(codes)
+        if roll < 0.4:
+            name = f"{folder.lower()}_{code}_{rng.randrange(100):02d}"
+        elif roll < 0.6:
+            folder = f"{folder}/{code}"
+        if variant and i % _VARIANT_EVERY == 0:
+            name = f"{name}_v{variant}"
+        yield f"Assets/AddressableAssets/{folder}/{name}{rng.choice(_EXTS)}"
+
+
+def make_synthetic_paths(codes: List[str], count: int, seed: int = 0) -> set:
+    """고유한 합성 경로 count개를 Set으로 반환합니다."""
+    paths = set()
+    source = iter_paths(codes, count * 2, seed)
+    for path in source:
+        paths.add(path)
+        if len(paths) >= count:
+            break
+    return paths
+
+
+class _CbcEncryptingWriter(io.RawIOBase):
+    """쓰는 데이터를 블록 단위로 AES-CBC 암호화하여 파일에 기록하고, close 시 PKCS7 패딩을 붙입니다."""
+    def __init__(self, raw, key: bytes, iv: bytes):
+        self._raw = raw
+        self._cipher = AES.new(key, AES.MODE_CBC, iv)
+        self._pending = b""
+
+    def writable(self):
+        return True
+
+    def write(self, data) -> int:
+        size = len(data)
+        data = self._pending + bytes(data)
+        usable = len(data) - len(data) % AES.block_size
+        if usable:
+            self._raw.write(self._cipher.encrypt(data[:usable]))
+        self._pending = data[usable:]
+        return size
+
+    def close(self):
+        if not self.closed:
+            self._raw.write(self._cipher.encrypt(pad(self._pending, AES.block_size)))
+            self._raw.close()
+        super().close()
+
+
+class _Base64StreamWriter:
+    """3바이트 단위로 끊어가며 base64로 인코딩해 텍스트 스트림에 씁니다."""
+    def __init__(self, out):
+        self._out = out
+        self._pending = b""
+
+    def write(self, data: bytes):
+        data = self._pending + data
+        usable = len(data) - len(data) % 3
+        if usable:
+            self._out.write(base64.b64encode(data[:usable]))
+        self._pending = data[usable:]
+
+    def flush(self):
+        if self._pending:
+            self._out.write(base64.b64encode(self._pending))
+            self._pending = b""
+
+
+def estimate_path_count(codes: List[str], target_bytes: int, seed: int = 0) -> int:
+    """해제된 카탈로그 크기가 target_bytes 근처가 되는 경로 수를 추정합니다."""
+    sample = list(iter_paths(codes, 1000, seed))
+    avg_path = sum(len(p) for p in sample) / len(sample)
+    # 경로 문자열 + JSON 구분자 + 키(base64) + 버킷/엔트리 테이블(base64)
+    per_entry = (avg_path + 4) + (avg_path + 5) * 4 / 3 + 12 * 4 / 3 + 28 * 4 / 3
+    return max(1, int(target_bytes / per_entry))
+
+
+def write_encrypted_catalog(output_path: Path, codes: List[str], count: int, key: bytes, iv: bytes,
+                            seed: int = 0, variant: int = 0, compresslevel: int = 6) -> Tuple[int, int]:
+    """합성 카탈로그를 JSON → GZip → AES-CBC 순서로 스트리밍 기록하고 (해제 크기, 암호문 크기)를 반환합니다."""
+    raw = open(output_path, 'wb')
+    encryptor = _CbcEncryptingWriter(raw, key, iv)
+    with encryptor, gzip.GzipFile(fileobj=encryptor, mode='wb', compresslevel=compresslevel, mtime=0) as gz:
+        written = 0
+
+        def emit(data: bytes):
+            nonlocal written
+            gz.write(data)
+            written += len(data)
+
+        class _Counter:
+            write = staticmethod(emit)
+
+        emit(b'{"m_LocatorId":"AddressablesMainContentCatalog","m_InternalIds":[')
+        emit(json.dumps("{UnityEngine.AddressableAssets.Addressables.RuntimePath}/synthetic.bundle").encode())
+        for path in iter_paths(codes, count, seed, variant):
+            emit(b',' + json.dumps(path).encode())
+        emit(b'],"m_ProviderIds":' + json.dumps(_PROVIDERS).encode())
+
+        # 키: 0번은 번들, 1..count는 각 경로(ASCII 문자열 키)
+        emit(b',"m_KeyDataString":"')
+        b64 = _Base64StreamWriter(_Counter)
+        b64.write(struct.pack('<i', count + 1))
+        key_offsets = []
+        offset = 4
+        for key_text in _iter_keys(codes, count, seed, variant):
+            data = key_text.encode()
+            key_offsets.append(offset)
+            record = b'\x00' + struct.pack('<i', len(data)) + data
+            b64.write(record)
+            offset += len(record)
+        b64.flush()
+
+        # 버킷: 키 i → 엔트리 i. 경로 키(1..count)의 의존성은 0번 키(번들)입니다.
+        emit(b'","m_BucketDataString":"')
+        b64 = _Base64StreamWriter(_Counter)
+        b64.write(struct.pack('<i', count + 1))
+        for i, key_offset in enumerate(key_offsets):
+            b64.write(struct.pack('<iii', key_offset, 1, i))
+        b64.flush()
+
+        # 엔트리: internalId, provider, dependencyKey, depHash, dataIndex, primaryKey, resourceType
+        emit(b'","m_EntryDataString":"')
+        b64 = _Base64StreamWriter(_Counter)
+        b64.write(struct.pack('<i', count + 1))
+        b64.write(struct.pack('<7i', 0, 0, -1, 0, -1, 0, 0))
+        for i in range(1, count + 1):
+            b64.write(struct.pack('<7i', i, 1, 0, 0, -1, i, 0))
+        b64.flush()
+        emit(b'"}')
+    return written, os.path.getsize(output_path)
+
+
+def _iter_keys(codes: List[str], count: int, seed: int, variant: int) -> Iterator[str]:
+    yield "synthetic_bundle"
+    yield from iter_paths(codes, count, seed, variant)
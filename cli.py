@@ -0,0 +1,234 @@
+# frida_asset_suite/cli.py
+"""카탈로그 폴더 전체를 일괄 처리하는 헤드리스 CLI (gradio 불필요, cron 실행용).
+
+사용 예:
+    python cli.py                                   # UPLOADED_CATALOGS_DIR의 *.json 처리
+    python cli.py --drive --compare --workers 4     # Drive 카탈로그 폴더, 인접 버전 비교 보고서 포함
+    python cli.py --input-dir ./catalogs --squads 31A --format jsonl
+
+종료 코드: 0 = 성공(건너뛴 파일 포함), 1 = 일부 카탈로그 처리 실패, 2 = 설정/인자 오류
+"""
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import config
+from backend.logger import setup_logger
+from backend.decryption import CatalogKeyRing, parse_keyring
+from backend.extraction import PathExtractor
+from backend.data_models import CharacterManager
+from backend.analysis import AssetComparer
+from backend.pipeline import CatalogPipeline
+from backend.cache import ProcessedCatalogCache
+from backend.catalog_parser import CatalogParser
+from backend.report import StructuredReport
+from backend.history_store import CatalogHistoryStore
+from backend.taxonomy import AssetTaxonomy
+from backend.drive_staging import DriveCatalogStager
+from backend.worker_pool import start_worker_pool
+
+EXIT_OK, EXIT_FAILED, EXIT_CONFIG = 0, 1, 2
+MANIFEST_NAME = "batch_manifest.json"
+
+
+def _file_fingerprint(path: Path) -> str:
+    stat = path.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _options_fingerprint(args) -> str:
+    options = [args.squads, args.characters, args.keyword, args.format, args.structured]
+    return hashlib.sha256(json.dumps(options, ensure_ascii=False).encode()).hexdigest()[:12]
+
+
+def _load_manifest(output_dir: Path) -> Dict:
+    manifest_path = output_dir / MANIFEST_NAME
+    if manifest_path.exists():
+        try:
+            return json.loads(manifest_path.read_text(encoding='utf-8'))
+        except ValueError:
+            pass
+    return {"single": {}, "comparison": {}}
+
+
+def _save_manifest(output_dir: Path, manifest: Dict):
+    tmp = output_dir / (MANIFEST_NAME + ".tmp")
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding='utf-8')
+    tmp.replace(output_dir / MANIFEST_NAME)
+
+
+def _write_report(report: StructuredReport, output_dir: Path, stem: str, fmt: str) -> List[str]:
+    """보고서 본문(CSV/JSONL)과 부대/캐릭터·패싯별 요약(JSON)을 저장하고 파일 이름 목록을 반환합니다."""
+    body_path = output_dir / f"{stem}.{fmt}"
+    if fmt == "csv":
+        report.export_csv(body_path)
+    else:
+        report.export_jsonl(body_path)
+    summary_path = output_dir / f"{stem}.summary.json"
+    summary = {"title": report.title, "total": report.total,
+               "squads": report.squad_counts(), "characters": report.character_counts(),
+               "facets": {facet: report.facet_counts(facet) for facet in AssetTaxonomy.FACETS} if report.total else {}}
+    summary_path.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding='utf-8')
+    return [body_path.name, summary_path.name]
+
+
+def _outputs_exist(output_dir: Path, entry: Optional[Dict]) -> bool:
+    return bool(entry) and all((output_dir / name).exists() for name in entry.get("outputs", []))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="카탈로그 폴더 일괄 분석 CLI")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--input-dir", type=Path, help=f"카탈로그 폴더 (기본: {config.UPLOADED_CATALOGS_DIR})")
+    source.add_argument("--drive", action="store_true", help=f"Drive 카탈로그 폴더 사용 ({config.DRIVE_CATALOG_DIR})")
+    parser.add_argument("--pattern", default="*.json", help="처리할 파일 glob 패턴 (기본: *.json)")
+    parser.add_argument("--output-dir", type=Path, default=config.BATCH_REPORTS_DIR)
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2), help="동시 처리 프로세스 수")
+    parser.add_argument("--compare", action="store_true", help="파일 이름 순으로 인접한 버전 간 비교 보고서도 생성")
+    parser.add_argument("--squads", nargs="*", default=[], help="소속 부대 필터")
+    parser.add_argument("--characters", nargs="*", default=[], help="캐릭터명 필터")
+    parser.add_argument("--keyword", default="", help="경로 키워드 필터")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+    parser.add_argument("--structured", action=argparse.BooleanOptionalAction,
+                        default=config.USE_STRUCTURED_CATALOG_PARSER, help="Addressables 구조 파서 사용 여부")
+    parser.add_argument("--force", action="store_true", help="이미 처리한 파일도 다시 처리")
+    parser.add_argument("--debug", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    # 배치가 끝날 때 Drive 사본 고정(pinned)을 풀고 미리 복사 스레드를 멈추기 위해 사용합니다.
+    with contextlib.ExitStack() as pins:
+        return _run(args, pins)
+
+
+def _run(args, pins: contextlib.ExitStack) -> int:
+    config.ensure_data_dirs()
+    logger = setup_logger(debug=args.debug, metrics_log_path=config.DATA_DIR / "run_metrics.jsonl")
+
+    try:
+        key_pairs = [(os.environ['AES_KEY_HEX'], os.environ['AES_IV_HEX'])]
+        key_pairs += parse_keyring(os.environ.get('AES_KEYRING', ''))
+        keyring = CatalogKeyRing.from_pairs(key_pairs)
+    except KeyError:
+        logger.critical("환경 변수 AES_KEY_HEX와 AES_IV_HEX를 설정해야 합니다.")
+        return EXIT_CONFIG
+    except ValueError as e:
+        logger.critical(f"AES 키 설정 오류: {e}")
+        return EXIT_CONFIG
+
+    input_dir = config.DRIVE_CATALOG_DIR if args.drive else (args.input_dir or config.UPLOADED_CATALOGS_DIR)
+    if not input_dir.is_dir():
+        logger.critical(f"카탈로그 폴더를 찾을 수 없습니다: {input_dir}")
+        return EXIT_CONFIG
+    # Drive 복사 스레드가 생기기 전에 프로세스 풀 작업자를 미리 fork해 둡니다.
+    start_worker_pool(args.workers)
+    stager: Optional[DriveCatalogStager] = None
+    if args.drive:
+        # Drive 원본 대신 로컬 사본을 처리합니다. 목록을 읽는 순간 백그라운드 복사가 시작됩니다.
+        stager = DriveCatalogStager(input_dir, config.DRIVE_STAGING_DIR, config.DRIVE_STAGING_MAX_BYTES)
+        pins.callback(stager.shutdown)
+        names = stager.list_catalogs(args.pattern)
+        # 뒤쪽 파일을 복사하면서 용량 정리로 앞쪽 사본이 지워지지 않도록 배치가 끝날 때까지 고정합니다.
+        pins.enter_context(stager.pinned(names))
+        # 로컬 사본은 원본의 크기/수정 시각을 그대로 가지므로, 건너뛰기 판단과 보고서 이름은 복사 없이 원본으로 합니다.
+        catalogs = [input_dir / name for name in names]
+    else:
+        catalogs = sorted(p for p in input_dir.glob(args.pattern) if p.is_file())
+    if not catalogs:
+        logger.warning(f"처리할 카탈로그가 없습니다: {input_dir / args.pattern}")
+        return EXIT_OK
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+
+    char_manager = CharacterManager(str(config.CHARACTER_INFO_CSV))
+    comparer = AssetComparer(char_manager)
+    cache = ProcessedCatalogCache(config.PROCESSED_CATALOGS_DIR, config.PROCESSED_CACHE_MAX_BYTES)
+    parser = CatalogParser() if args.structured else None
+    pipeline = CatalogPipeline(keyring.decryptors[0], PathExtractor(), cache=cache, parser=parser, keyring=keyring)
+    history_store = CatalogHistoryStore(config.HISTORY_DB_PATH, char_manager)
+
+    def local(catalog: Path) -> str:
+        """처리에 사용할 경로. Drive 카탈로그는 필요할 때 로컬 사본을 준비합니다. (이미 미리 복사되었으면 바로 반환)"""
+        return str(stager.local_path(catalog.name)) if stager is not None else str(catalog)
+
+    def version_id(catalog: Path, paths: Optional[Set[str]] = None) -> Optional[int]:
+        """카탈로그의 이력 저장소 버전 ID. 기록되어 있지 않으면 (캐시에서) 경로를 읽어 기록합니다."""
+        source_key = pipeline.source_key(local(catalog))
+        if source_key is None:
+            return None
+        found = history_store.find_version(source_key)
+        if found is not None:
+            return found
+        paths = paths or pipeline.extract_paths(local(catalog))
+        return history_store.record_version(catalog.name, source_key, paths) if paths else None
+
+    manifest = _load_manifest(args.output_dir)
+    options = _options_fingerprint(args)
+    failed: List[str] = []
+    started = time.perf_counter()
+
+    # 1단계: 단일 보고서. 이미 같은 옵션으로 처리한 파일은 건너뛰고, 나머지는 프로세스 풀에 workers 개씩 맡겨
+    # 끝나는 순서대로 보고서를 씁니다. (느린 파일 하나가 다른 파일의 처리를 막지 않습니다)
+    todo = [p for p in catalogs if args.force or not (
+        _outputs_exist(args.output_dir, manifest["single"].get(p.name))
+        and manifest["single"][p.name].get("source") == _file_fingerprint(p)
+        and manifest["single"][p.name].get("options") == options)]
+    logger.info(f"카탈로그 {len(catalogs)}개 중 {len(todo)}개 처리, {len(catalogs) - len(todo)}개 건너뜀")
+    if stager is not None:
+        # 목록 단계에서 예약되지 않은 처리 대상도 미리 복사합니다. 사본은 작업자 자리가 날 때 하나씩 꺼내므로
+        # 앞쪽 카탈로그를 처리하는 동안 뒤쪽 카탈로그가 복사됩니다.
+        stager.prefetch([p.name for p in todo])
+    for i, _, paths in pipeline.iter_extract_paths((local(p) for p in todo), max_workers=max(1, args.workers)):
+        catalog = todo[i]
+        if not paths:
+            logger.error(f"[배치] 처리 실패: {catalog.name}")
+            failed.append(catalog.name)
+            continue
+        version_id(catalog, paths)
+        report = comparer.build_single_report_from_paths(paths, catalog.name, args.squads, args.characters, args.keyword)
+        outputs = _write_report(report, args.output_dir, catalog.stem, args.format)
+        manifest["single"][catalog.name] = {"source": _file_fingerprint(catalog), "options": options,
+                                            "outputs": outputs, "total": len(paths)}
+        _save_manifest(args.output_dir, manifest)
+
+    # 2단계: 인접 버전 비교. 1단계에서 기록한 이력 저장소의 경로 ID 배열끼리 비교하므로 복호화가 반복되지 않습니다.
+    if args.compare:
+        for old, new in zip(catalogs, catalogs[1:]):
+            if old.name in failed or new.name in failed:
+                continue
+            pair = f"{new.name}|{old.name}"
+            pair_source = f"{_file_fingerprint(new)}|{_file_fingerprint(old)}"
+            entry = manifest["comparison"].get(pair)
+            if not args.force and _outputs_exist(args.output_dir, entry) \
+                    and entry.get("source") == pair_source and entry.get("options") == options:
+                continue
+            new_id, old_id = version_id(new), version_id(old)
+            if new_id is None or old_id is None:
+                failed.append(pair)
+                continue
+            report = history_store.build_comparison_report(new_id, old_id, args.squads, args.characters, args.keyword)
+            outputs = _write_report(report, args.output_dir, f"{new.stem}__vs__{old.stem}", args.format)
+            manifest["comparison"][pair] = {"source": pair_source, "options": options, "outputs": outputs,
+                                            "added": report.total}
+        _save_manifest(args.output_dir, manifest)
+
+    elapsed = time.perf_counter() - started
+    summary = {"input_dir": str(input_dir), "catalogs": len(catalogs), "processed": len(todo),
+               "failed": failed, "elapsed_sec": round(elapsed, 3)}
+    (args.output_dir / "batch_summary.json").write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding='utf-8')
+    logger.info(f"배치 처리 완료: {elapsed:.1f}s, 실패 {len(failed)}건")
+    return EXIT_FAILED if failed else EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
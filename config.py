@@ -1,5 +1,6 @@
 # frida_asset_suite/config.py (Google Drive 연동 버전)
 from pathlib import Path
+import functools
 import os
 
 # --- Google Drive 연동 설정 ---
@@ -8,23 +9,61 @@ DRIVE_MOUNT_PATH = Path("/content/drive")
 BASE_DATA_DIR_NAME = "hbr_asset_analyzer_data" # Drive에 생성할 폴더 이름
 PROJECT_ROOT = Path(__file__).parent.resolve()
 
-# Google Drive가 연결되어 있고, 데이터 폴더가 존재하면 Drive 경로를 사용합니다.
-if (DRIVE_MOUNT_PATH / "MyDrive").exists():
-    DRIVE_DATA_DIR = DRIVE_MOUNT_PATH / "MyDrive" / BASE_DATA_DIR_NAME
-    DATA_DIR = DRIVE_DATA_DIR
-    print(f"✅ Google Drive가 연결되었습니다. 데이터 경로: '{DATA_DIR}'")
-else:
+@functools.lru_cache(maxsize=None)
+def _data_dir() -> Path:
+    """Google Drive가 연결되어 있으면 Drive 경로를 사용합니다. (config를 import할 때가 아니라 처음 사용할 때 확인)"""
+    if (DRIVE_MOUNT_PATH / "MyDrive").exists():
+        data_dir = DRIVE_MOUNT_PATH / "MyDrive" / BASE_DATA_DIR_NAME
+        print(f"✅ Google Drive가 연결되었습니다. 데이터 경로: '{data_dir}'")
+        return data_dir
     # 그렇지 않으면, Colab의 임시 로컬 저장소를 사용합니다.
-    DATA_DIR = PROJECT_ROOT / "data"
     print("ℹ️ Google Drive가 연결되지 않았습니다. 임시 로컬 저장소를 사용합니다.")
+    return PROJECT_ROOT / "data"
 
 # --- 데이터 폴더 경로 ---
-UPLOADED_CATALOGS_DIR = DATA_DIR / "uploaded_catalogs"
-PROCESSED_CATALOGS_DIR = DATA_DIR / "processed_catalogs"
+# DATA_DIR 아래의 경로들은 모듈 속성(config.DATA_DIR 등)으로 처음 접근할 때 계산됩니다.
+_DATA_PATHS = {
+    "DATA_DIR": "",
+    "UPLOADED_CATALOGS_DIR": "uploaded_catalogs",
+    "PROCESSED_CATALOGS_DIR": "processed_catalogs",
+    "BATCH_REPORTS_DIR": "batch_reports", # 배치 CLI(cli.py) 보고서 출력 폴더
+    "HISTORY_DB_PATH": "catalog_history.sqlite3", # 버전별 경로 이력 저장소 (경로 ID interning)
+}
+
+def __getattr__(name: str):
+    if name in _DATA_PATHS:
+        return _data_dir() / _DATA_PATHS[name]
+    raise AttributeError(f"module 'config' has no attribute '{name}'")
+
+# Drive 카탈로그의 로컬 사본 폴더. DATA_DIR은 Drive 위에 있을 수 있으므로 프로젝트(로컬 디스크) 아래에 둡니다.
+DRIVE_STAGING_DIR = PROJECT_ROOT / ".drive_staging"
+DRIVE_STAGING_MAX_BYTES = 20 * 1024 ** 3
+DRIVE_CATALOG_DIR = DRIVE_MOUNT_PATH / "MyDrive" / "hbr_asset_catalogs" # Drive에 업로드한 카탈로그 폴더
 CHARACTER_INFO_CSV = PROJECT_ROOT / "data" / "character_info.csv" # 캐릭터 정보는 프로젝트 내부에 유지
 
+# --- 처리 결과 캐시 설정 ---
+# PROCESSED_CATALOGS_DIR에 저장되는 추출 경로 캐시의 최대 용량 (초과 시 오래 사용하지 않은 항목부터 삭제)
+PROCESSED_CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+# --- 키워드 검색 색인 설정 ---
+# 카탈로그 하나의 트라이그램 색인이 차지할 수 있는 최대 메모리 (넘으면 색인 없이 전체 경로를 검사)
+SEARCH_INDEX_MAX_BYTES = 64 * 1024 ** 2
+
+# --- 웹 앱 작업 큐 설정 ---
+# 카탈로그 처리(복호화/추출)를 동시에 실행할 최대 작업 수와, 실행을 기다릴 수 있는 최대 작업 수
+JOB_MAX_WORKERS = 2
+JOB_MAX_QUEUED = 8
+
+# --- 카탈로그 추출 방식 ---
+# True: Addressables 카탈로그 구조(m_InternalIds, 엔트리 테이블)를 파싱, 실패 시 정규표현식으로 대체
+#       (해제된 카탈로그 전체와 JSON 파싱 결과를 한 번에 메모리에 올리므로 큰 카탈로그에서는 메모리 사용량이 큼)
+# False: 정규표현식 스트리밍 추출만 사용 (메모리 사용량 최소, 기본값)
+USE_STRUCTURED_CATALOG_PARSER = False
+
 # --- 폴더 생성 ---
-# 프로젝트 실행 시 필요한 폴더들이 없다면 자동으로 생성합니다.
-DATA_DIR.mkdir(exist_ok=True)
-UPLOADED_CATALOGS_DIR.mkdir(exist_ok=True)
-PROCESSED_CATALOGS_DIR.mkdir(exist_ok=True)
\ No newline at end of file
+def ensure_data_dirs():
+    """프로젝트 실행 시 필요한 폴더들이 없다면 생성합니다. (앱/CLI 시작 시 호출)"""
+    data_dir = _data_dir()
+    data_dir.mkdir(exist_ok=True)
+    for name in ("UPLOADED_CATALOGS_DIR", "PROCESSED_CATALOGS_DIR"):
+        (data_dir / _DATA_PATHS[name]).mkdir(exist_ok=True)
\ No newline at end of file
@@ -4,25 +4,66 @@ import os
 import shutil
 from pathlib import Path
 import sys
-from typing import Tuple
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
 import uuid
 import tempfile
+import threading
+import time
+import contextlib
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # --- 프로젝트 경로 설정 및 모듈 임포트 ---
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT))
 
+import config
 from backend.logger import setup_logger
-from backend.decryption import CatalogDecryptor
+from backend.decryption import CatalogDecryptor, CatalogKeyRing, file_probe_key, parse_keyring
 from backend.extraction import PathExtractor
 from backend.data_models import CharacterManager
 from backend.analysis import AssetComparer
+from backend.pipeline import CatalogPipeline
+from backend.cache import ProcessedCatalogCache
+from backend.catalog_parser import CatalogParser
+from backend.search_index import TrigramIndex
+from backend.path_store import CompactPathSet
+from backend.report import StructuredReport
+from backend.taxonomy import AssetTaxonomy
+from backend.history_store import CatalogHistoryStore
+from backend.drive_staging import DriveCatalogStager
+from backend.instrumentation import RunProfile, current_profile, stage
+from backend.jobs import Job, JobManager, JobQueueFull
+from backend.worker_pool import start_worker_pool
 
 # --- Google Drive 경로 설정 ---
-DRIVE_CATALOG_DIR = Path("/content/drive/MyDrive/hbr_asset_catalogs")
+DRIVE_CATALOG_DIR = config.DRIVE_CATALOG_DIR
+
+# --- 처리된 카탈로그 메모리 보관 설정 ---
+# 최근 처리한 카탈로그의 경로 Set과 트라이그램 색인을 보관하여 키워드 입력 시 즉시 재필터링합니다.
+# 경로 Set은 압축된 CompactPathSet이며, 색인도 같은 객체를 참조하므로 경로 문자열을 따로 복사해 두지 않습니다.
+# 색인은 카탈로그 처리 작업 안에서 만들고, 크기는 카탈로그마다 config.SEARCH_INDEX_MAX_BYTES로 제한합니다.
+LOADED_CATALOG_LIMIT = 4
+_loaded_catalogs: "OrderedDict[Tuple[str, int, int], Tuple[CompactPathSet, TrigramIndex]]" = OrderedDict()
+_loaded_catalogs_lock = threading.Lock() # 여러 세션의 요청과 작업 스레드가 함께 사용합니다.
+# 최근 비교한 (신규, 과거) 카탈로그 쌍의 추가 경로(CompactPathSet). 필터만 바뀐 재비교에서는 차집합을 다시 계산하지 않습니다.
+COMPARISON_MEMO_LIMIT = 2
+_comparison_added: "OrderedDict[Tuple[Tuple[str, int, int], Tuple[str, int, int]], CompactPathSet]" = OrderedDict()
+# 이력 저장소에 기록 중인 카탈로그 (source_key -> 기록 Future). 같은 카탈로그의 기록을 중복으로 요청하지 않습니다.
+_pending_versions: Dict[str, Future] = {}
+_pending_versions_lock = threading.Lock()
+
+# --- 보고서 표시 설정 ---
+REPORT_PAGE_SIZE = 200 # 한 페이지에 표시할 에셋 수
+# 내보낸 보고서 파일은 전용 임시 폴더에 두고, 보관 시간이 지난 파일은 다음 내보내기 때 삭제합니다.
+EXPORT_DIR = Path(tempfile.gettempdir()) / "frida_report_exports"
+EXPORT_MAX_AGE_SEC = 60 * 60
+REPORT_GROUPINGS = [("부대 / 캐릭터", "squad")] + [(title, facet) for facet, title in AssetTaxonomy.FACETS.items()]
 
 # --- 전역 객체 초기화 ---
-logger = setup_logger(debug=True)
+config.ensure_data_dirs()
+logger = setup_logger(debug=True, metrics_log_path=config.DATA_DIR / "run_metrics.jsonl")
 
 try:
     AES_KEY_HEX = os.environ['AES_KEY_HEX']
@@ -30,12 +71,22 @@ try:
 except KeyError:
     print("🔴 [치명적 오류] Colab 보안 노트(🔑)에서 AES_KEY_HEX와 AES_IV_HEX를 설정해야 합니다.")
     exit()
+# 선택: 버전별로 바뀐 키 후보들 ('KEY_HEX:IV_HEX'를 쉼표/줄바꿈으로 구분). 파일마다 맞는 키를 자동으로 고릅니다.
+AES_KEYRING = os.environ.get('AES_KEYRING', '')
 
 try:
     decryptor = CatalogDecryptor(AES_KEY_HEX, AES_IV_HEX)
+    keyring = CatalogKeyRing([decryptor] + CatalogKeyRing.from_pairs(parse_keyring(AES_KEYRING)).decryptors)
     extractor = PathExtractor()
     char_manager = CharacterManager(str(PROJECT_ROOT / "data" / "character_info.csv"))
     comparer = AssetComparer(char_manager)
+    catalog_cache = ProcessedCatalogCache(config.PROCESSED_CATALOGS_DIR, config.PROCESSED_CACHE_MAX_BYTES)
+    catalog_parser = CatalogParser() if config.USE_STRUCTURED_CATALOG_PARSER else None
+    pipeline = CatalogPipeline(decryptor, extractor, cache=catalog_cache, parser=catalog_parser, keyring=keyring)
+    history_store = CatalogHistoryStore(config.HISTORY_DB_PATH, char_manager)
+    history_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-write") # 이력 기록을 요청 처리와 분리
+    drive_stager = DriveCatalogStager(DRIVE_CATALOG_DIR, config.DRIVE_STAGING_DIR, config.DRIVE_STAGING_MAX_BYTES)
+    job_manager = JobManager(config.JOB_MAX_WORKERS, config.JOB_MAX_QUEUED)
     logger.info("웹 애플리케이션 백엔드 모듈 초기화 완료.")
 except Exception as e:
     logger.critical(f"백엔드 모듈 초기화 실패! 오류: {e}")
@@ -44,59 +95,342 @@ except Exception as e:
 # --- Gradio UI 로직 함수들 ---
 
 def get_drive_catalogs():
-    if not DRIVE_CATALOG_DIR.exists(): return []
-    return sorted([f.name for f in DRIVE_CATALOG_DIR.glob("*.json")])
+    # 폴더 목록은 캐시되며, 새로 보이는 파일은 백그라운드에서 로컬 디스크로 미리 복사됩니다.
+    return drive_stager.list_catalogs()
+
+def refresh_drive_dropdowns():
+    choices = get_drive_catalogs()
+    return [gr.Dropdown(choices=choices)] * 4
+
+def refresh_squad_dropdowns():
+    # character_info.csv가 바뀌었으면 CharacterManager가 다시 읽은 부대 목록이 반영됩니다.
+    return [gr.Dropdown(choices=char_manager.get_squad_list())] * 3
+
+def _drive_input(drive_file: str) -> str:
+    """Drive 카탈로그의 로컬 사본 경로. 처리 결과 캐시가 사본을 다시 해싱하지 않도록 복사 시 계산한 해시를 넘겨줍니다."""
+    local_path = drive_stager.local_path(drive_file)
+    digest = drive_stager.digest(drive_file)
+    if digest: catalog_cache.remember_file_hash(str(local_path), digest)
+    return str(local_path)
 
-def _process_file_to_txt(input_path: str) -> Tuple[Path, str]:
+def _check_extracted(input_path: str, logical_paths: Optional[Set[str]]) -> Optional[str]:
+    if logical_paths is None:
+        return f"'{Path(input_path).name}' 복호화 실패"
+    if not logical_paths:
+        return f"'{Path(input_path).name}' 경로 추출 실패"
+    return None
+
+def _process_file(input_path: str, with_index: bool = False):
+    """카탈로그를 처리하여 (경로 Set, 오류)를 반환합니다. with_index=True이면 경로 Set 대신 (경로 Set, 트라이그램 색인)을 반환합니다."""
     if not Path(input_path).exists():
         return None, f"입력 파일 '{input_path}'를 찾을 수 없습니다."
-    unique_id = uuid.uuid4().hex
-    temp_dir = Path(tempfile.gettempdir())
-    decrypted_bin_path = temp_dir / f"{unique_id}_decrypted.bin"
-    extracted_txt_path = temp_dir / f"{unique_id}_extracted.txt"
-    if not decryptor.decrypt_file(input_path, str(decrypted_bin_path)):
-        return None, f"'{Path(input_path).name}' 복호화 실패"
-    logical_paths = extractor.extract_from_binary(str(decrypted_bin_path))
-    decrypted_bin_path.unlink()
-    if not logical_paths:
-        return None, f"'{Path(input_path).name}' 경로 추출 실패"
-    with open(extracted_txt_path, 'w', encoding='utf-8') as f:
-        f.writelines(f"{path}\n" for path in sorted(list(logical_paths)))
-    return extracted_txt_path, None
+    # 정규표현식 검사가 작업 스레드끼리 GIL을 나눠 쓰지 않도록 공유 프로세스 풀의 작업자에서 처리합니다.
+    logical_paths = pipeline.extract_paths_in_worker(input_path)
+    error = _check_extracted(input_path, logical_paths)
+    if error: return None, error
+    if with_index:
+        # 키워드 검색 색인도 작업 스레드에서 만들어 요청 처리 스레드를 막지 않습니다.
+        return (logical_paths, TrigramIndex(logical_paths, config.SEARCH_INDEX_MAX_BYTES)), None
+    return logical_paths, None
 
-def run_analysis(source: str, local_file, drive_file: str, squads, chars, keyword, progress=gr.Progress(track_tqdm=True)):
-    input_path = local_file.name if source == "로컬 업로드" and local_file else str(DRIVE_CATALOG_DIR / drive_file) if source == "Google Drive" and drive_file else None
-    if not input_path: return "분석할 파일을 선택하거나 업로드해주세요."
-    txt_path = None
+def _confirm_or_process(input_path: str, source_path: str, result, with_index: bool = False):
+    """다른 파일(source_path)의 작업 결과를 함께 받은 경우, 두 파일의 전체 해시가 같으면 그 결과를 쓰고 다르면 따로 처리합니다."""
+    if Path(source_path).exists() and catalog_cache.file_hash(input_path) == catalog_cache.file_hash(source_path):
+        return result, None
+    return _process_file(input_path, with_index)
+
+def _catalog_memo_key(input_path: str) -> Tuple[str, int, int]:
+    stat = Path(input_path).stat()
+    return (str(Path(input_path).resolve()), stat.st_size, stat.st_mtime_ns)
+
+def _peek_catalog(input_path: str) -> Optional[Tuple[Set[str], TrigramIndex]]:
+    """이미 처리되어 메모리에 있는 카탈로그만 반환합니다. (새로 처리하지 않음)"""
+    if not input_path or not Path(input_path).exists(): return None
+    memo_key = _catalog_memo_key(input_path)
+    with _loaded_catalogs_lock:
+        loaded = _loaded_catalogs.get(memo_key)
+        if loaded: _loaded_catalogs.move_to_end(memo_key)
+        return loaded
+
+def _remember_catalog(input_path: str, loaded: Tuple[Set[str], TrigramIndex]) -> Tuple[Set[str], TrigramIndex]:
+    with _loaded_catalogs_lock:
+        _loaded_catalogs[_catalog_memo_key(input_path)] = loaded
+        while len(_loaded_catalogs) > LOADED_CATALOG_LIMIT:
+            _loaded_catalogs.popitem(last=False)
+    return loaded
+
+def _submit_catalog(input_path: str, owner: Optional[str], with_index: bool = False) -> Job:
+    """카탈로그 처리 작업을 작업 큐에 넣습니다. 같은 카탈로그를 처리 중인 작업이 있으면 그 작업을 함께 기다립니다.
+
+    요청 처리 중에는 파일 전체를 해싱하지 않고 크기와 앞/끝 블록(file_probe_key)으로만 같은 카탈로그인지 판단합니다.
+    (세션마다 업로드 임시 경로가 달라도 같은 파일이면 작업 하나를 함께 기다리며, 전체 해시 확인은 _extract_catalogs가 작업 안에서 합니다)
+    """
+    return job_manager.submit(("catalog", with_index) + file_probe_key(input_path), Path(input_path).name,
+                              functools.partial(_process_file, input_path, with_index), [input_path], owner=owner)
+
+def _await_jobs(jobs: list, progress, start: float = 0.0, end: float = 0.9) -> Tuple[Optional[list], Optional[str]]:
+    """작업이 모두 끝날 때까지 실제 처리 바이트 기준 진행률을 표시하며 기다리고, 결과 목록을 반환합니다."""
+    while not all(job.finished for job in jobs):
+        running = [job for job in jobs if not job.finished]
+        done = sum(job.fraction for job in jobs) / len(jobs)
+        progress(start + (end - start) * done, desc=" · ".join(job.describe() for job in running))
+        running[0].wait(0.25)
+    profile = current_profile()
+    results = []
+    for job in jobs:
+        if profile is not None: profile.merge(job.stages, prefix="job ")
+        if job.state == Job.CANCELLED: return None, f"'{job.title}' 처리가 취소되었습니다."
+        if job.state == Job.FAILED: return None, f"'{job.title}' 처리 중 오류: {job.error}"
+        paths, error = job.result
+        if error: return None, error
+        results.append(paths)
+    return results, None
+
+def _extract_catalogs(input_paths: list, owner: Optional[str], progress, start: float = 0.0, end: float = 0.9,
+                      with_index: bool = False) -> Tuple[Optional[list], Optional[str]]:
+    """카탈로그들의 경로 Set을 작업 큐에서 (동시 실행 한도 안에서) 추출하여 입력 순서대로 반환합니다.
+
+    with_index=True이면 작업 안에서 트라이그램 색인도 만들어 (경로 Set, 색인) 목록을 반환합니다.
+    """
+    for input_path in input_paths:
+        if not Path(input_path).exists():
+            return None, f"입력 파일 '{input_path}'를 찾을 수 없습니다."
     try:
-        progress(0.2, desc="파일 처리 중...")
-        txt_path, error = _process_file_to_txt(input_path)
-        if error: return f"[오류] {error}"
-        progress(0.7, desc="보고서 생성 중...")
-        report = comparer.generate_single_report(txt_path, squads, chars, keyword)
-        return report
+        jobs = [_submit_catalog(p, owner, with_index) for p in input_paths]
+    except JobQueueFull as e:
+        return None, str(e)
+    results, error = _await_jobs(jobs, progress, start, end)
+    if error: return None, error
+    # 다른 경로의 파일을 처리한 작업을 함께 기다렸으면, 전체 해시로 같은 내용인지 작업 큐에서 확인합니다.
+    shared = [i for i, (p, job) in enumerate(zip(input_paths, jobs)) if job.input_paths != [p]]
+    if not shared:
+        return results, None
+    try:
+        checks = [job_manager.submit(("confirm", input_paths[i]), Path(input_paths[i]).name,
+                                     functools.partial(_confirm_or_process, input_paths[i], jobs[i].input_paths[0], results[i], with_index),
+                                     [input_paths[i]], owner=owner) for i in shared]
+    except JobQueueFull as e:
+        return None, str(e)
+    confirmed, error = _await_jobs(checks, progress, start, end)
+    if error: return None, error
+    for i, paths in zip(shared, confirmed):
+        results[i] = paths
+    return results, None
+
+def _load_catalogs(input_paths: list, owner: Optional[str], progress) -> Tuple[Optional[list], Optional[str]]:
+    """메모리에 없는 카탈로그만 처리하고, (경로 Set, 트라이그램 색인) 목록을 입력 순서대로 반환합니다."""
+    loaded = [_peek_catalog(p) for p in input_paths]
+    missing = [p for p, item in zip(input_paths, loaded) if item is None]
+    extracted, error = _extract_catalogs(missing, owner, progress, with_index=True) if missing else ([], None)
+    if error: return None, error
+    # 같은 작업을 기다린 다른 세션이 먼저 보관했으면 그것을 사용합니다.
+    fresh = {p: _peek_catalog(p) or _remember_catalog(p, item) for p, item in zip(missing, extracted)}
+    return [item if item is not None else fresh[p] for p, item in zip(input_paths, loaded)], None
+
+def _session(request: Optional[gr.Request]) -> Optional[str]:
+    return request.session_hash if request is not None else None
+
+def cancel_jobs(request: gr.Request):
+    """이 세션이 기다리는 작업을 취소합니다. 다른 세션도 기다리는 작업은 계속 실행됩니다."""
+    cancelled = job_manager.cancel_owner(_session(request))
+    return f"작업 {cancelled}개를 취소했습니다." if cancelled else "취소할 작업이 없습니다. (다른 사용자와 함께 기다리던 작업은 계속 실행됩니다)"
+
+def _write_version(name: str, source_key: str, paths: Set[str]):
+    """history_writer 스레드에서 실행됩니다. 실패해도 요청 처리에는 영향을 주지 않도록 로그만 남깁니다."""
+    try:
+        history_store.record_version(name, source_key, paths)
+    except Exception as e:
+        logger.error(f"이력 기록 실패: '{name}': {e}", exc_info=True)
     finally:
-        if txt_path and txt_path.exists(): txt_path.unlink()
+        with _pending_versions_lock:
+            _pending_versions.pop(source_key, None)
+
+def _record_version(input_path: str, paths: Set[str]) -> Optional[Future]:
+    """처리한 카탈로그를 백그라운드 스레드(history_writer)에서 이력 저장소에 기록합니다.
+
+    같은 내용·Key/IV·추출기 버전으로 이미 기록되었거나 기록 중인 카탈로그는 다시 쓰지 않습니다.
+    기록 중이면 그 기록의 Future를, 기록할 필요가 없으면 None을 반환합니다. 보고서는 기록을 기다리지 않고 메모리의 경로로 만듭니다.
+    """
+    source_key = pipeline.source_key(input_path)
+    if source_key is None: return None
+    with _pending_versions_lock:
+        pending = _pending_versions.get(source_key)
+        if pending is not None: return pending
+        if history_store.find_version(source_key) is not None: return None
+        future = history_writer.submit(_write_version, Path(input_path).name, source_key, paths)
+        _pending_versions[source_key] = future
+        return future
+
+def _added_paths(new_path: str, old_path: str, new_paths: CompactPathSet, old_paths: CompactPathSet) -> CompactPathSet:
+    """두 카탈로그의 추가 경로. 최근 비교한 쌍이면 기억해 둔 결과를 사용합니다."""
+    memo_key = (_catalog_memo_key(new_path), _catalog_memo_key(old_path))
+    with _loaded_catalogs_lock:
+        added = _comparison_added.get(memo_key)
+        if added is not None:
+            _comparison_added.move_to_end(memo_key)
+            return added
+    added = comparer.compare_path_sets(new_paths, old_paths)
+    with _loaded_catalogs_lock:
+        _comparison_added[memo_key] = added
+        while len(_comparison_added) > COMPARISON_MEMO_LIMIT:
+            _comparison_added.popitem(last=False)
+    return added
+
+def _resolve_input(source: str, local_file, drive_file: str, stage_drive: bool = True) -> Optional[str]:
+    """선택한 입력 파일의 로컬 경로. stage_drive=False이면 Drive 카탈로그를 복사하지 않고 이미 준비된 사본만 사용합니다."""
+    if source == "로컬 업로드":
+        return local_file.name if local_file else None
+    if source != "Google Drive" or not drive_file:
+        return None
+    if not stage_drive:
+        staged = drive_stager.staged_path(drive_file)
+        return str(staged) if staged else None
+    return _drive_input(drive_file)
+
+def _pin_drive(source: str, drive_files):
+    """Google Drive 소스이면 처리하는 동안 선택한 카탈로그의 로컬 사본이 용량 정리로 삭제되지 않게 합니다."""
+    return drive_stager.pinned(drive_files or []) if source == "Google Drive" else contextlib.nullcontext()
+
+def _report_outputs(result):
+    """보고서(또는 안내/오류 메시지)를 [요약, 묶어 보기 기준, 패싯 요약, 그룹 선택, 페이지 번호, 페이지 내용, 보고서 상태] 출력으로 변환합니다."""
+    if isinstance(result, str):
+        return result, "squad", "", gr.Dropdown(choices=[], value=None), 1, "", None
+    labels = result.group_labels()
+    first = labels[0] if labels else None
+    return result.summary_markdown(), "squad", "", gr.Dropdown(choices=labels, value=first), 1, result.page_markdown(first, 1, REPORT_PAGE_SIZE), result
+
+def switch_report_grouping(report: Optional[StructuredReport], grouping: str):
+    """묶어 보기 기준(부대/캐릭터 또는 패싯)에 맞게 그룹 목록과 패싯 요약을 바꿉니다."""
+    if report is None: return "", gr.Dropdown(choices=[], value=None), 1, ""
+    facet = None if grouping == "squad" else grouping
+    labels = report.group_labels(facet)
+    first = labels[0] if labels else None
+    facet_summary = report.facet_markdown(facet) if facet else ""
+    return facet_summary, gr.Dropdown(choices=labels, value=first), 1, report.page_markdown(first, 1, REPORT_PAGE_SIZE)
+
+def show_report_page(report: Optional[StructuredReport], label: str, page):
+    if report is None: return ""
+    return report.page_markdown(label, int(page or 1), REPORT_PAGE_SIZE)
+
+def _cleanup_exports():
+    """보관 시간이 지난 내보내기 파일을 삭제합니다."""
+    cutoff = time.time() - EXPORT_MAX_AGE_SEC
+    for old_path in EXPORT_DIR.glob("report_*"):
+        try:
+            if old_path.stat().st_mtime < cutoff:
+                old_path.unlink()
+        except OSError:
+            pass # 다른 요청이 먼저 지운 경우 등
+
+def export_report(report: Optional[StructuredReport], fmt: str):
+    if report is None: return None
+    EXPORT_DIR.mkdir(exist_ok=True)
+    _cleanup_exports()
+    output_path = EXPORT_DIR / f"report_{uuid.uuid4().hex[:8]}.{fmt.lower()}"
+    return str(report.export_csv(output_path) if fmt == "CSV" else report.export_jsonl(output_path))
 
-def run_comparison(source: str, local_new, local_old, drive_new: str, drive_old: str, squads, chars, keyword, progress=gr.Progress(track_tqdm=True)):
-    new_path = local_new.name if source == "로컬 업로드" and local_new else str(DRIVE_CATALOG_DIR / drive_new) if source == "Google Drive" and drive_new else None
-    old_path = local_old.name if source == "로컬 업로드" and local_old else str(DRIVE_CATALOG_DIR / drive_old) if source == "Google Drive" and drive_old else None
+def _analysis_result(source: str, local_file, drive_file: str, squads, chars, keyword, owner, progress, stage_drive: bool = True):
+    input_path = _resolve_input(source, local_file, drive_file, stage_drive)
+    if not input_path: return "분석할 파일을 선택하거나 업로드해주세요."
+    loaded, error = _load_catalogs([input_path], owner, progress)
+    if error: return f"[오류] {error}"
+    progress(0.9, desc="보고서 생성 중...")
+    (paths, index), = loaded
+    _record_version(input_path, paths)
+    return comparer.build_single_report_from_paths(paths, Path(input_path).name, squads, chars, keyword, index)
+
+def _comparison_result(source: str, local_new, local_old, drive_new: str, drive_old: str, squads, chars, keyword, owner, progress, stage_drive: bool = True):
+    new_path = _resolve_input(source, local_new, drive_new, stage_drive)
+    old_path = _resolve_input(source, local_old, drive_old, stage_drive)
     if not new_path or not old_path: return "신규 버전과 과거 버전을 모두 선택하거나 업로드해주세요."
     if new_path == old_path: return "서로 다른 파일을 선택해야 합니다."
-    new_txt_path, old_txt_path = None, None
-    try:
-        progress(0.1, desc="신규 버전 처리 중...")
-        new_txt_path, error = _process_file_to_txt(new_path)
-        if error: return f"[오류] {error}"
-        progress(0.5, desc="과거 버전 처리 중...")
-        old_txt_path, error = _process_file_to_txt(old_path)
-        if error: return f"[오류] {error}"
-        progress(0.9, desc="비교 및 보고서 생성 중...")
-        report = comparer.generate_comparison_report(new_txt_path, old_txt_path, squads, chars, keyword)
-        return report
-    finally:
-        if new_txt_path and new_txt_path.exists(): new_txt_path.unlink()
-        if old_txt_path and old_txt_path.exists(): old_txt_path.unlink()
+    loaded, error = _load_catalogs([new_path, old_path], owner, progress)
+    if error: return f"[오류] {error}"
+    progress(0.9, desc="비교 및 보고서 생성 중...")
+    (new_paths, new_index), (old_paths, _) = loaded
+    _record_version(new_path, new_paths)
+    _record_version(old_path, old_paths)
+    added = _added_paths(new_path, old_path, new_paths, old_paths)
+    return comparer.build_added_report(added, Path(new_path).name, Path(old_path).name, squads, chars, keyword, new_index)
+
+def _no_progress(*args, **kwargs):
+    pass
+
+def run_analysis(source: str, local_file, drive_file: str, squads, chars, keyword, request: gr.Request = None, progress=gr.Progress(track_tqdm=True), stage_drive: bool = True):
+    with RunProfile("분석") as profile, _pin_drive(source, [drive_file]):
+        outputs = _report_outputs(_analysis_result(source, local_file, drive_file, squads, chars, keyword, _session(request), progress, stage_drive))
+    return outputs + (profile.to_markdown(),)
+
+def run_comparison(source: str, local_new, local_old, drive_new: str, drive_old: str, squads, chars, keyword, request: gr.Request = None, progress=gr.Progress(track_tqdm=True), stage_drive: bool = True):
+    with RunProfile("비교") as profile, _pin_drive(source, [drive_new, drive_old]):
+        outputs = _report_outputs(_comparison_result(source, local_new, local_old, drive_new, drive_old, squads, chars, keyword, _session(request), progress, stage_drive))
+    return outputs + (profile.to_markdown(),)
+
+def _timeline_outputs(result):
+    """타임라인 보고서(또는 안내/오류 메시지)를 [요약, 구간 선택, 페이지 번호, 페이지 내용, 보고서 상태] 출력으로 변환합니다."""
+    if isinstance(result, str):
+        return result, gr.Dropdown(choices=[], value=None), 1, "", None
+    labels = result.group_labels()
+    first = labels[0] if labels else None
+    return result.summary_markdown(), gr.Dropdown(choices=labels, value=first), 1, result.page_markdown(first, 1, REPORT_PAGE_SIZE), result
+
+def run_timeline(source: str, local_files, drive_files, squads, chars, keyword, request: gr.Request = None, progress=gr.Progress(track_tqdm=True)):
+    with RunProfile("타임라인") as profile, _pin_drive(source, drive_files):
+        outputs = _timeline_outputs(_timeline_result(source, local_files, drive_files, squads, chars, keyword, _session(request), progress))
+    return outputs + (profile.to_markdown(),)
+
+def _timeline_result(source: str, local_files, drive_files, squads, chars, keyword, owner, progress):
+    if source == "로컬 업로드":
+        input_paths = [f if isinstance(f, str) else f.name for f in (local_files or [])]
+    else:
+        input_paths = [_drive_input(f) for f in (drive_files or [])]
+    if len(input_paths) < 2: return "타임라인을 만들려면 2개 이상의 카탈로그를 오래된 순서대로 선택해주세요."
+    errors = []
+
+    def iter_catalogs():
+        # 카탈로그를 하나씩 처리하여 넘겨주므로 메모리에는 인접한 두 버전만 유지됩니다.
+        # 이력 기록도 이전 버전의 기록이 끝난 뒤에 요청하여, 기록 대기열이 버전의 경로 Set을 쌓아 두지 않게 합니다.
+        # (이전 버전의 기록은 다음 카탈로그를 처리하는 동안 진행됩니다)
+        recording = None
+        for i, input_path in enumerate(input_paths):
+            extracted, error = _extract_catalogs([input_path], owner, progress, 0.9 * i / len(input_paths), 0.9 * (i + 1) / len(input_paths))
+            if error:
+                errors.append(error)
+                return
+            paths, = extracted
+            if recording is not None:
+                with stage("history wait"):
+                    recording.result()
+            recording = _record_version(input_path, paths)
+            yield Path(input_path).name, paths
+
+    timeline = comparer.build_timeline(iter_catalogs())
+    if errors: return f"[오류] {errors[0]}"
+    progress(0.9, desc="타임라인 보고서 생성 중...")
+    return comparer.build_timeline_report(timeline, squads, chars, keyword)
+
+def lookup_path_history(path: str) -> str:
+    """이력 저장소에 기록된 버전 중 경로가 포함된 버전을 보여줍니다."""
+    path = (path or "").strip()
+    versions = history_store.list_versions()
+    if not versions: return "### 아직 기록된 버전이 없습니다. 분석/비교/타임라인을 실행하면 자동으로 기록됩니다."
+    if not path: return f"### 기록된 버전 {len(versions)}개\n" + "\n".join(f"- {v['name']} ({v['path_count']:,}개 경로)" for v in versions)
+    found = history_store.versions_containing(path)
+    if not found: return f"### `{path}`\n기록된 {len(versions)}개 버전 어디에도 없는 경로입니다."
+    return f"### `{path}`\n{len(versions)}개 버전 중 {len(found)}개에 포함 (최초: {found[0]}, 최종: {found[-1]})\n" + "\n".join(f"- {name}" for name in found)
+
+def live_filter_analysis(source: str, local_file, drive_file: str, squads, chars, keyword):
+    """키워드 입력 중에는 이미 처리된 카탈로그만 색인으로 즉시 재필터링합니다. (Drive 카탈로그는 준비된 로컬 사본만 사용)"""
+    input_path = _resolve_input(source, local_file, drive_file, stage_drive=False)
+    if not _peek_catalog(input_path): return (gr.update(),) * 8
+    return run_analysis(source, local_file, drive_file, squads, chars, keyword, progress=_no_progress, stage_drive=False)
+
+def live_filter_comparison(source: str, local_new, local_old, drive_new: str, drive_old: str, squads, chars, keyword):
+    """키워드 입력 중에는 두 카탈로그가 모두 처리되어 있을 때만 즉시 재필터링합니다."""
+    new_path = _resolve_input(source, local_new, drive_new, stage_drive=False)
+    old_path = _resolve_input(source, local_old, drive_old, stage_drive=False)
+    if new_path == old_path or not _peek_catalog(new_path) or not _peek_catalog(old_path): return (gr.update(),) * 8
+    return run_comparison(source, local_new, local_old, drive_new, drive_old, squads, chars, keyword, progress=_no_progress, stage_drive=False)
 
 def update_character_dropdown(squads: list):
     return gr.Dropdown(choices=char_manager.get_characters_by_squad(squads), value=[])
@@ -108,6 +442,44 @@ def switch_source_ui(choice: str):
     else: # Google Drive
         return gr.Group(visible=False), gr.Group(visible=True)
 
+def build_report_view():
+    """요약 + 묶어 보기 기준/그룹/페이지 선택 + 페이지 내용 + 내보내기로 구성된 보고서 영역을 만듭니다."""
+    summary = gr.Markdown()
+    grouping = gr.Radio(REPORT_GROUPINGS, label="묶어 보기", value="squad")
+    facet_summary = gr.Markdown()
+    with gr.Row():
+        group_dd = gr.Dropdown(label="에셋 목록", choices=[], scale=3)
+        page_num = gr.Number(label="페이지", value=1, minimum=1, precision=0, scale=1)
+    page_output = gr.Markdown()
+    report_state = gr.State(None)
+    with gr.Row():
+        export_fmt = gr.Radio(["JSONL", "CSV"], label="내보내기 형식", value="CSV")
+        export_btn = gr.Button("보고서 파일로 내보내기")
+    export_file = gr.File(label="다운로드", interactive=False)
+    with gr.Accordion("⏱️ 단계별 처리 시간", open=False):
+        timing = gr.Markdown()
+
+    grouping.input(fn=switch_report_grouping, inputs=[report_state, grouping], outputs=[facet_summary, group_dd, page_num, page_output], show_progress="hidden")
+    group_dd.change(fn=lambda report, label: (1, show_report_page(report, label, 1)), inputs=[report_state, group_dd], outputs=[page_num, page_output], show_progress="hidden")
+    page_num.change(fn=show_report_page, inputs=[report_state, group_dd, page_num], outputs=[page_output], show_progress="hidden")
+    export_btn.click(fn=export_report, inputs=[report_state, export_fmt], outputs=[export_file])
+    return [summary, grouping, facet_summary, group_dd, page_num, page_output, report_state, timing]
+
+def build_timeline_view():
+    """버전별 총계 요약 + 구간/페이지 선택 + 페이지 내용으로 구성된 타임라인 보고서 영역을 만듭니다."""
+    summary = gr.Markdown()
+    with gr.Row():
+        section_dd = gr.Dropdown(label="구간", choices=[], scale=3)
+        page_num = gr.Number(label="페이지", value=1, minimum=1, precision=0, scale=1)
+    page_output = gr.Markdown()
+    report_state = gr.State(None)
+    with gr.Accordion("⏱️ 단계별 처리 시간", open=False):
+        timing = gr.Markdown()
+
+    section_dd.change(fn=lambda report, label: (1, show_report_page(report, label, 1)), inputs=[report_state, section_dd], outputs=[page_num, page_output], show_progress="hidden")
+    page_num.change(fn=show_report_page, inputs=[report_state, section_dd, page_num], outputs=[page_output], show_progress="hidden")
+    return [summary, section_dd, page_num, page_output, report_state, timing]
+
 # --- Gradio 웹 UI 구성 ---
 with gr.Blocks(theme=gr.themes.Soft(primary_hue="blue")) as demo:
     gr.Markdown("# 🎮 Unity Addressable 에셋 분석기")
@@ -120,14 +492,17 @@ with gr.Blocks(theme=gr.themes.Soft(primary_hue="blue")) as demo:
             with gr.Group(visible=True) as local_group_a:
                 analyze_local_file = gr.File(label="분석할 catalog.json 파일", type="filepath")
             with gr.Group(visible=False) as drive_group_a:
-                analyze_drive_dd = gr.Dropdown(label="Google Drive에서 파일 선택", choices=get_drive_catalogs())
+                analyze_drive_dd = gr.Dropdown(label="Google Drive에서 파일 선택", choices=[])
 
             with gr.Row():
                 squad_dd_a = gr.Dropdown(label="소속 부대", choices=char_manager.get_squad_list(), multiselect=True)
                 char_dd_a = gr.Dropdown(label="캐릭터", multiselect=True, max_choices=5)
             keyword_a = gr.Textbox(label="키워드로 경로 필터링")
-            analyze_btn = gr.Button("분석 실행", variant="primary")
-            report_output_a = gr.Markdown()
+            with gr.Row():
+                analyze_btn = gr.Button("분석 실행", variant="primary", scale=3)
+                cancel_btn_a = gr.Button("취소", variant="stop", scale=1)
+            job_notice_a = gr.Markdown()
+            report_output_a = build_report_view()
 
         with gr.TabItem("비교 (파일 2개)"):
             gr.Markdown("두 개의 카탈로그 파일을 비교하여 추가된 에셋만 확인합니다.")
@@ -139,25 +514,85 @@ with gr.Blocks(theme=gr.themes.Soft(primary_hue="blue")) as demo:
                     compare_local_old = gr.File(label="과거 버전 (비교 대상)", type="filepath")
             with gr.Group(visible=False) as drive_group_c:
                 with gr.Row():
-                    compare_drive_new = gr.Dropdown(label="신규 버전 (기준)", choices=get_drive_catalogs())
-                    compare_drive_old = gr.Dropdown(label="과거 버전 (비교 대상)", choices=get_drive_catalogs())
+                    compare_drive_new = gr.Dropdown(label="신규 버전 (기준)", choices=[])
+                    compare_drive_old = gr.Dropdown(label="과거 버전 (비교 대상)", choices=[])
             
             with gr.Row():
                 squad_dd_c = gr.Dropdown(label="소속 부대", choices=char_manager.get_squad_list(), multiselect=True)
                 char_dd_c = gr.Dropdown(label="캐릭터", multiselect=True, max_choices=5)
             keyword_c = gr.Textbox(label="키워드로 경로 필터링")
-            compare_btn = gr.Button("비교 실행", variant="primary")
-            report_output_c = gr.Markdown()
+            with gr.Row():
+                compare_btn = gr.Button("비교 실행", variant="primary", scale=3)
+                cancel_btn_c = gr.Button("취소", variant="stop", scale=1)
+            job_notice_c = gr.Markdown()
+            report_output_c = build_report_view()
+
+        with gr.TabItem("타임라인 (파일 N개)"):
+            gr.Markdown("여러 버전의 카탈로그를 **오래된 순서대로** 선택하여 버전별 추가/삭제 에셋과 최초/최종 등장 버전을 확인합니다.")
+            source_radio_t = gr.Radio(["로컬 업로드", "Google Drive"], label="파일 소스 선택", value="로컬 업로드")
+
+            with gr.Group(visible=True) as local_group_t:
+                timeline_local_files = gr.File(label="catalog.json 파일들 (오래된 순서)", type="filepath", file_count="multiple")
+            with gr.Group(visible=False) as drive_group_t:
+                timeline_drive_dd = gr.Dropdown(label="Google Drive에서 파일 선택 (오래된 순서)", choices=[], multiselect=True)
+
+            with gr.Row():
+                squad_dd_t = gr.Dropdown(label="소속 부대", choices=char_manager.get_squad_list(), multiselect=True)
+                char_dd_t = gr.Dropdown(label="캐릭터", multiselect=True, max_choices=5)
+            keyword_t = gr.Textbox(label="키워드로 경로 필터링")
+            with gr.Row():
+                timeline_btn = gr.Button("타임라인 실행", variant="primary", scale=3)
+                cancel_btn_t = gr.Button("취소", variant="stop", scale=1)
+            job_notice_t = gr.Markdown()
+            report_output_t = build_timeline_view()
+
+        with gr.TabItem("경로 이력"):
+            gr.Markdown("지금까지 처리한 모든 버전에서 특정 에셋 경로가 포함된 버전을 조회합니다.")
+            history_path = gr.Textbox(label="에셋 경로 (비워두면 기록된 버전 목록 표시)")
+            history_btn = gr.Button("이력 조회", variant="primary")
+            history_output = gr.Markdown()
+
+        with gr.TabItem("작업 현황"):
+            gr.Markdown("모든 사용자의 카탈로그 처리 작업(대기/실행 중, 최근 완료)을 확인합니다. 같은 파일을 동시에 요청하면 작업 하나를 함께 기다립니다.")
+            jobs_btn = gr.Button("새로고침")
+            jobs_output = gr.Markdown()
 
     # --- UI 이벤트 리스너 연결 ---
     source_radio_a.change(fn=switch_source_ui, inputs=source_radio_a, outputs=[local_group_a, drive_group_a])
     source_radio_c.change(fn=switch_source_ui, inputs=source_radio_c, outputs=[local_group_c, drive_group_c])
+    source_radio_t.change(fn=switch_source_ui, inputs=source_radio_t, outputs=[local_group_t, drive_group_t])
     
     squad_dd_a.change(fn=update_character_dropdown, inputs=[squad_dd_a], outputs=[char_dd_a])
     squad_dd_c.change(fn=update_character_dropdown, inputs=[squad_dd_c], outputs=[char_dd_c])
+    squad_dd_t.change(fn=update_character_dropdown, inputs=[squad_dd_t], outputs=[char_dd_t])
     
-    analyze_btn.click(fn=run_analysis, inputs=[source_radio_a, analyze_local_file, analyze_drive_dd, squad_dd_a, char_dd_a, keyword_a], outputs=[report_output_a], show_progress="full")
-    compare_btn.click(fn=run_comparison, inputs=[source_radio_c, compare_local_new, compare_local_old, compare_drive_new, compare_drive_old, squad_dd_c, char_dd_c, keyword_c], outputs=[report_output_c], show_progress="full")
+    analyze_event = analyze_btn.click(fn=run_analysis, inputs=[source_radio_a, analyze_local_file, analyze_drive_dd, squad_dd_a, char_dd_a, keyword_a], outputs=report_output_a, show_progress="full")
+    compare_event = compare_btn.click(fn=run_comparison, inputs=[source_radio_c, compare_local_new, compare_local_old, compare_drive_new, compare_drive_old, squad_dd_c, char_dd_c, keyword_c], outputs=report_output_c, show_progress="full")
+    history_btn.click(fn=lookup_path_history, inputs=[history_path], outputs=[history_output])
+    timeline_event = timeline_btn.click(fn=run_timeline, inputs=[source_radio_t, timeline_local_files, timeline_drive_dd, squad_dd_t, char_dd_t, keyword_t], outputs=report_output_t, show_progress="full")
+    # 취소: 이 세션의 작업 스레드 처리를 다음 청크에서 중단시키고, 대기 중인 이벤트도 함께 취소합니다.
+    cancel_btn_a.click(fn=cancel_jobs, outputs=[job_notice_a], cancels=[analyze_event])
+    cancel_btn_c.click(fn=cancel_jobs, outputs=[job_notice_c], cancels=[compare_event])
+    cancel_btn_t.click(fn=cancel_jobs, outputs=[job_notice_t], cancels=[timeline_event])
+    jobs_btn.click(fn=job_manager.status_markdown, outputs=[jobs_output])
+
+    # 페이지를 열 때마다 Drive 카탈로그 목록을 갱신합니다. (폴더가 바뀌지 않았으면 캐시된 목록 사용)
+    # UI를 만드는 동안에는 Drive 폴더를 읽지 않으므로 앱 시작이 Drive(FUSE) 응답 속도에 좌우되지 않습니다.
+    demo.load(fn=refresh_drive_dropdowns, outputs=[analyze_drive_dd, compare_drive_new, compare_drive_old, timeline_drive_dd])
+    demo.load(fn=refresh_squad_dropdowns, outputs=[squad_dd_a, squad_dd_c, squad_dd_t])
+
+    # 검색어 입력 시 즉시 필터링 (카탈로그를 한 번 처리한 뒤부터 동작)
+    keyword_a.change(fn=live_filter_analysis, inputs=[source_radio_a, analyze_local_file, analyze_drive_dd, squad_dd_a, char_dd_a, keyword_a], outputs=report_output_a, show_progress="hidden", trigger_mode="always_last")
+    keyword_c.change(fn=live_filter_comparison, inputs=[source_radio_c, compare_local_new, compare_local_old, compare_drive_new, compare_drive_old, squad_dd_c, char_dd_c, keyword_c], outputs=report_output_c, show_progress="hidden", trigger_mode="always_last")
+
+def launch(**kwargs):
+    """웹 UI를 실행합니다.
+
+    프로세스 풀 작업자는 import할 때가 아니라 여기서, Gradio 서버·작업 큐·Drive 복사 스레드가 생기기 전에 fork합니다.
+    (demo.launch()를 직접 호출하면 풀 없이 현재 프로세스에서 처리합니다)
+    """
+    start_worker_pool()
+    demo.launch(**kwargs)
 
 if __name__ == "__main__":
-    demo.launch()
\ No newline at end of file
+    launch()
\ No newline at end of file
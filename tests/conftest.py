@@ -0,0 +1,40 @@
+# frida_asset_suite/tests/conftest.py
+import gzip
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+KEY = b'k' * 16
+IV = b'i' * 16
+
+
+def cbc_encrypt(data: bytes, key: bytes = KEY, iv: bytes = IV) -> bytes:
+    """데이터를 그대로 AES-CBC(PKCS7)로 암호화합니다."""
+    from Crypto.Cipher import AES
+    from Crypto.Util.Padding import pad
+    return AES.new(key, AES.MODE_CBC, iv).encrypt(pad(data, 16))
+
+
+def encrypt_bytes(plain: bytes, key: bytes = KEY, iv: bytes = IV) -> bytes:
+    """평문을 GZip 압축 후 AES-CBC로 암호화합니다. (실제 카탈로그 파일과 같은 형식)"""
+    return cbc_encrypt(gzip.compress(plain, mtime=0), key, iv)
+
+
+@pytest.fixture
+def write_encrypted(tmp_path):
+    """평문을 암호화한 카탈로그 파일을 tmp_path에 만들고 경로(str)를 반환하는 함수."""
+    def write(name: str, plain: bytes, key: bytes = KEY, iv: bytes = IV) -> str:
+        path = tmp_path / name
+        path.write_bytes(encrypt_bytes(plain, key, iv))
+        return str(path)
+    return write
+
+
+@pytest.fixture
+def char_manager():
+    from backend.data_models import CharacterManager
+    return CharacterManager(str(PROJECT_ROOT / "data" / "character_info.csv"))
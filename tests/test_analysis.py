@@ -0,0 +1,66 @@
+# frida_asset_suite/tests/test_analysis.py
+import pytest
+
+from backend.analysis import AssetComparer
+from backend.path_store import CompactPathSet
+from backend.search_index import TrigramIndex
+
+
+@pytest.fixture
+def comparer(char_manager):
+    return AssetComparer(char_manager)
+
+
+VERSIONS = [
+    ("v1", {"Assets/a.png", "Assets/b.png", "Assets/c.png"}),
+    ("v2", {"Assets/a.png", "Assets/c.png", "Assets/d.png"}),  # b 삭제, d 추가
+    ("v3", {"Assets/a.png", "Assets/b.png", "Assets/d.png"}),  # b 다시 추가, c 삭제
+]
+
+
+def test_timeline_deltas_and_counts(comparer):
+    timeline = comparer.build_timeline(iter(VERSIONS))
+    assert timeline.versions == ["v1", "v2", "v3"]
+    assert timeline.totals == [3, 3, 3]
+    assert timeline.delta_counts == [(3, 0), (1, 1), (1, 1)]
+    # 첫 버전의 전체 경로는 구간 변화로 보관하지 않습니다.
+    assert timeline.deltas == [
+        {"added": {"Assets/d.png"}, "removed": {"Assets/b.png"}},
+        {"added": {"Assets/b.png"}, "removed": {"Assets/c.png"}},
+    ]
+
+
+def test_timeline_first_and_last_seen(comparer):
+    timeline = comparer.build_timeline(iter(VERSIONS))
+    assert timeline.history("Assets/a.png") == ("v1", "v3")
+    assert timeline.history("Assets/c.png") == ("v1", "v2")
+    assert timeline.history("Assets/d.png") == ("v2", "v3")
+    # 삭제 후 다시 추가된 경로는 최초 등장 버전을 유지하고 최종 버전만 갱신됩니다.
+    assert timeline.history("Assets/b.png") == ("v1", "v3")
+    assert timeline.history("Assets/missing.png") is None
+
+
+def test_timeline_report_sections(comparer):
+    report = comparer.build_timeline_report(comparer.build_timeline(iter(VERSIONS)), [], [], "")
+    assert report.delta_counts == [(3, 0), (1, 1), (1, 1)]
+    assert report.group_labels() == ["v1 → v2 ➕ 추가", "v1 → v2 ➖ 삭제", "v2 → v3 ➕ 추가", "v2 → v3 ➖ 삭제"]
+    assert "Assets/b.png (최초: v1, 최종: v3)" in report.page_markdown("v2 → v3 ➕ 추가", 1, 10)
+
+
+def test_timeline_with_single_version(comparer):
+    timeline = comparer.build_timeline(iter(VERSIONS[:1]))
+    assert timeline.deltas == [] and timeline.delta_counts == [(3, 0)]
+    assert comparer.build_timeline_report(timeline, [], [], "").group_labels() == []
+
+
+@pytest.mark.parametrize("keyword", ["png", "Ab", "voice", "RKayamori", "zzz"])
+def test_keyword_filter_with_index_matches_scan(comparer, keyword):
+    paths = CompactPathSet.from_paths(
+        {f"Assets/{folder}/{name}_{i}.png" for folder in ("Voice", "UI") for name in ("RKayamori", "abc") for i in range(40)})
+    index = TrigramIndex(paths)
+    expected = comparer._filter_and_structure_paths(paths, None, None, keyword)
+    assert comparer._filter_and_structure_paths(paths, None, None, keyword, index) == expected
+    # 색인한 카탈로그의 일부만 거를 때(비교의 추가 경로)는 그 안의 경로만 남습니다.
+    subset = CompactPathSet.from_paths(list(paths)[::3])
+    assert (comparer._filter_and_structure_paths(subset, None, None, keyword, index)
+            == comparer._filter_and_structure_paths(subset, None, None, keyword))
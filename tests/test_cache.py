@@ -0,0 +1,77 @@
+# frida_asset_suite/tests/test_cache.py
+import os
+
+import pytest
+
+from backend.cache import ProcessedCatalogCache
+from backend.decryption import CatalogDecryptor
+from backend.extraction import PathExtractor
+from backend.pipeline import CatalogPipeline
+from conftest import IV, KEY
+
+
+def _paths(tag: str, n: int = 50) -> set:
+    return {f"Assets/{tag}/{i:03d}.png" for i in range(n)}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ProcessedCatalogCache(tmp_path / "cache", max_bytes=1 << 30)
+
+
+def test_round_trip(cache):
+    cache.put("a", _paths("a"))
+    assert set(cache.get("a")) == _paths("a")
+    assert cache.get("missing") is None
+
+
+@pytest.mark.parametrize("offset", [0, 20, -1])
+def test_corrupted_entry_is_rejected_and_removed(cache, offset):
+    cache.put("a", _paths("a"))
+    entry = cache._entry_path("a")
+    data = bytearray(entry.read_bytes())
+    data[offset] ^= 0xFF  # 헤더(magic/다이제스트) 또는 blob의 한 바이트를 바꿉니다.
+    entry.write_bytes(bytes(data))
+    assert cache.get("a") is None
+    assert not entry.exists()
+
+
+def test_truncated_entry_is_rejected(cache):
+    cache.put("a", _paths("a"))
+    entry = cache._entry_path("a")
+    entry.write_bytes(entry.read_bytes()[:-10])
+    assert cache.get("a") is None
+
+
+def test_pipeline_recomputes_corrupted_entry(tmp_path, write_encrypted, cache):
+    plain = b"".join(f"Assets/x/{i}.png\x00".encode() for i in range(100))
+    path = write_encrypted("catalog.bin", plain)
+    pipeline = CatalogPipeline(CatalogDecryptor(KEY.hex(), IV.hex()), PathExtractor(workers=1), cache=cache)
+    expected = set(pipeline.extract_paths(path))
+    entry = cache._entry_path(pipeline.source_key(path))
+    data = bytearray(entry.read_bytes())
+    data[-2] ^= 0xFF
+    entry.write_bytes(bytes(data))
+
+    assert set(pipeline.extract_paths(path)) == expected
+    # 다시 계산한 결과가 온전한 항목으로 저장됩니다.
+    assert set(cache.get(pipeline.source_key(path))) == expected
+
+
+def test_evict_removes_least_recently_used(cache):
+    for key in "abc":
+        cache.put(key, _paths(key))
+    entries = {key: cache._entry_path(key) for key in "abc"}
+    for age, key in enumerate("abc"):
+        os.utime(entries[key], (1000 + age, 1000 + age))
+    assert cache.get("a") is not None  # 'a'가 가장 최근에 사용한 항목이 됩니다.
+
+    entry_size = entries["a"].stat().st_size
+    cache.max_bytes = entry_size * 3  # 새 항목 하나를 더하면 가장 오래된 'b'만 삭제되어야 합니다.
+    cache.put("d", _paths("d"))
+    assert not entries["b"].exists()
+    assert all(entries[key].exists() for key in "ac") and cache._entry_path("d").exists()
+
+    cache.max_bytes = entry_size
+    cache._evict()
+    assert [p.stem for p in cache.cache_dir.glob("*.paths")] == ["d"]
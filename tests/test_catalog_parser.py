@@ -0,0 +1,117 @@
+# frida_asset_suite/tests/test_catalog_parser.py
+import base64
+import json
+import random
+import struct
+
+import pytest
+
+from backend.catalog_parser import CatalogParser
+
+_PROVIDERS = ["UnityEngine.ResourceManagement.ResourceProviders.AssetBundleProvider",
+              "UnityEngine.ResourceManagement.ResourceProviders.BundledAssetProvider"]
+_INTERNAL_IDS = ["0#/b1.bundle", "0#/b2.bundle", "Assets/a/x.png", "Assets/a/y.png", "Prefabs/z"]
+_KEYS = [b"b1key", b"b2key", b"Assets/a/x.png", b"deps_x"]
+# 키 3(deps_x)의 버킷이 두 번들 엔트리를 가리키며, 에셋 엔트리 2·3의 의존성 키입니다.
+_BUCKETS = [[0], [1], [2], [0, 1]]
+# (내부 ID, 제공자, 의존성 키, 의존성 해시, 데이터 번호, 기본 키, 리소스 타입)
+_ENTRIES = [(0, 0, -1, 0, -1, 0, 0), (1, 0, -1, 0, -1, 1, 0), (2, 1, 3, 0, -1, 2, 0),
+            (3, 1, 3, 0, -1, 2, 0), (4, 1, -1, 0, -1, 2, 0)]
+
+
+def build_catalog(entries=_ENTRIES, buckets=_BUCKETS, internal_ids=_INTERNAL_IDS, bucket_data=None) -> bytes:
+    """Addressables content catalog JSON을 만듭니다. (키는 ASCII 문자열 형식 0)"""
+    key_data, offsets = struct.pack('<i', len(_KEYS)), []
+    for key in _KEYS:
+        offsets.append(len(key_data))
+        key_data += bytes([0]) + struct.pack('<i', len(key)) + key
+    if bucket_data is None:
+        bucket_data = struct.pack('<i', len(buckets))
+        for offset, bucket in zip(offsets, buckets):
+            bucket_data += struct.pack('<ii', offset, len(bucket)) + struct.pack(f'<{len(bucket)}i', *bucket)
+    entry_data = struct.pack('<i', len(entries)) + b''.join(struct.pack('<7i', *e) for e in entries)
+    return json.dumps({
+        "m_InternalIdPrefixes": ["{Runtime}/Android"],
+        "m_InternalIds": internal_ids,
+        "m_ProviderIds": _PROVIDERS,
+        "m_KeyDataString": base64.b64encode(key_data).decode(),
+        "m_BucketDataString": base64.b64encode(bucket_data).decode(),
+        "m_EntryDataString": base64.b64encode(entry_data).decode(),
+    }).encode()
+
+
+def test_parse_valid_catalog():
+    catalog = CatalogParser().parse(build_catalog())
+    assert len(catalog) == 5
+    assert catalog.internal_ids[:2] == ["{Runtime}/Android/b1.bundle", "{Runtime}/Android/b2.bundle"]
+    assert [catalog.key(i) for i in range(4)] == ["b1key", "b2key", "Assets/a/x.png", "deps_x"]
+    assert catalog.entry_dependencies().tolist() == [[2, 0], [2, 1], [3, 0], [3, 1]]
+    assert catalog.bundle_names(2) == ["{Runtime}/Android/b1.bundle", "{Runtime}/Android/b2.bundle"]
+    assert catalog.bundle_names(4) == []
+    assert catalog.asset_internal_ids() == {"Assets/a/x.png", "Assets/a/y.png", "Prefabs/z"}
+
+
+def test_empty_entry_table():
+    catalog = CatalogParser().parse(build_catalog(entries=[], buckets=[[], [], [], []]))
+    assert len(catalog) == 0
+    assert catalog.entry_dependencies().shape == (0, 2)
+    assert catalog.asset_internal_ids() == set()
+
+
+@pytest.mark.parametrize("content", [b"not json", b"{}", b'{"m_InternalIds": []}', b"[1, 2]"])
+def test_not_a_catalog(content):
+    assert CatalogParser().parse(content) is None
+
+
+def _with_entry(index: int, field: int, value: int):
+    entries = [list(e) for e in _ENTRIES]
+    entries[index][field] = value
+    return entries
+
+
+@pytest.mark.parametrize("entries", [
+    _with_entry(2, 0, 5),        # 내부 ID 범위 초과
+    _with_entry(2, 0, -1),       # 음수 내부 ID
+    _with_entry(2, 1, 2),        # 제공자 범위 초과
+    _with_entry(2, 1, -1),       # 음수 제공자
+    _with_entry(2, 2, 4),        # 의존성 키가 버킷 수 이상
+], ids=["id-high", "id-negative", "provider-high", "provider-negative", "dep-key-high"])
+def test_malformed_entries_are_rejected(entries):
+    assert CatalogParser().parse(build_catalog(entries=entries)) is None
+
+
+def test_truncated_entry_table_is_rejected():
+    # 엔트리 수는 6개로 기록되어 있지만 마지막 레코드는 일부만 있습니다.
+    content = json.loads(build_catalog())
+    data = base64.b64decode(content["m_EntryDataString"])
+    content["m_EntryDataString"] = base64.b64encode(struct.pack('<i', 6) + data[4:] + struct.pack('<2i', 0, 0)).decode()
+    assert CatalogParser().parse(json.dumps(content).encode()) is None
+
+
+@pytest.mark.parametrize("buckets", [[[0], [1], [5], [0, 1]], [[0], [1], [-1], [0, 1]]], ids=["high", "negative"])
+def test_bucket_entries_out_of_range_are_rejected(buckets):
+    assert CatalogParser().parse(build_catalog(buckets=buckets)) is None
+
+
+def test_truncated_bucket_table_is_rejected():
+    # 버킷 하나가 엔트리 100개를 가진다고 기록되어 있지만 데이터가 없습니다.
+    assert CatalogParser().parse(build_catalog(bucket_data=struct.pack('<iii', 1, 0, 100))) is None
+
+
+def test_negative_bucket_entry_count_is_rejected():
+    bucket_data = struct.pack('<i', 2) + struct.pack('<iii', 0, 1, 0) + struct.pack('<ii', 0, -1)
+    assert CatalogParser().parse(build_catalog(bucket_data=bucket_data)) is None
+
+
+@pytest.mark.parametrize("bucket_count", [1, 2, 3, 1000])
+def test_parse_buckets_matches_sequential_read(bucket_count):
+    rng = random.Random(bucket_count)
+    buckets = [[rng.randrange(5000) for _ in range(rng.choice([0, 1, 1, 2, 7]))] for _ in range(bucket_count)]
+    bucket_data = struct.pack('<i', bucket_count)
+    for i, bucket in enumerate(buckets):
+        bucket_data += struct.pack('<ii', i * 9, len(bucket)) + struct.pack(f'<{len(bucket)}i', *bucket)
+    data_offsets, bucket_starts, bucket_entries = CatalogParser()._parse_buckets(bucket_data)
+    assert data_offsets.tolist() == [i * 9 for i in range(bucket_count)]
+    assert [bucket_entries[bucket_starts[i]:bucket_starts[i + 1]].tolist() for i in range(bucket_count)] == buckets
+    with pytest.raises(ValueError):
+        CatalogParser()._parse_buckets(bucket_data[:-4] if buckets[-1] else bucket_data[:-8])
@@ -0,0 +1,112 @@
+# frida_asset_suite/tests/test_cli.py
+import json
+import os
+
+import pytest
+
+import cli
+import config
+from backend import worker_pool
+from backend.drive_staging import DriveCatalogStager
+from conftest import IV, KEY, encrypt_bytes
+
+
+def _catalog(tag: str) -> bytes:
+    return b"".join(f"Assets/{tag}/RKayamori_{i}.png\x00".encode() for i in range(20))
+
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    """데이터 폴더와 키를 tmp_path로 돌리고, 카탈로그 폴더(input)와 보고서 폴더(output)를 반환합니다."""
+    monkeypatch.setattr(config, "_data_dir", lambda: tmp_path / "data")
+    monkeypatch.setenv("AES_KEY_HEX", KEY.hex())
+    monkeypatch.setenv("AES_IV_HEX", IV.hex())
+    monkeypatch.delenv("AES_KEYRING", raising=False)
+    (tmp_path / "data").mkdir()
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    for i, tag in enumerate(("a", "b")):
+        (input_dir / f"v{i}.json").write_bytes(encrypt_bytes(_catalog(tag)))
+    yield input_dir, tmp_path / "out"
+    worker_pool.shutdown_worker_pool()
+
+
+def _run(input_dir, output_dir, *extra) -> int:
+    return cli.main(["--input-dir", str(input_dir), "--output-dir", str(output_dir), "--workers", "1", *extra])
+
+
+def _summary(output_dir) -> dict:
+    return json.loads((output_dir / "batch_summary.json").read_text(encoding="utf-8"))
+
+
+def test_success_writes_reports(env):
+    input_dir, output_dir = env
+    assert _run(input_dir, output_dir, "--compare") == cli.EXIT_OK
+    assert _summary(output_dir)["processed"] == 2
+    assert (output_dir / "v0.csv").exists() and (output_dir / "v1__vs__v0.summary.json").exists()
+    added = json.loads((output_dir / "v1__vs__v0.summary.json").read_text(encoding="utf-8"))["total"]
+    assert added == 20
+
+
+def test_missing_keys_and_input_dir_are_config_errors(env, monkeypatch, tmp_path):
+    input_dir, output_dir = env
+    assert _run(tmp_path / "missing", output_dir) == cli.EXIT_CONFIG
+    monkeypatch.setenv("AES_KEYRING", "not-a-pair")
+    assert _run(input_dir, output_dir) == cli.EXIT_CONFIG
+    monkeypatch.delenv("AES_KEYRING")
+    monkeypatch.delenv("AES_KEY_HEX")
+    assert _run(input_dir, output_dir) == cli.EXIT_CONFIG
+
+
+def test_undecryptable_catalog_fails_batch(env):
+    input_dir, output_dir = env
+    (input_dir / "v2.json").write_bytes(encrypt_bytes(_catalog("c"), key=b"x" * 16))
+    assert _run(input_dir, output_dir) == cli.EXIT_FAILED
+    assert _summary(output_dir)["failed"] == ["v2.json"]
+    assert (output_dir / "v0.csv").exists()
+
+
+def test_skip_uses_file_and_options_fingerprints(env):
+    input_dir, output_dir = env
+    assert _run(input_dir, output_dir) == cli.EXIT_OK
+    assert _run(input_dir, output_dir) == cli.EXIT_OK
+    assert _summary(output_dir)["processed"] == 0
+
+    # 수정 시각이 바뀐 파일만 다시 처리합니다.
+    stat = os.stat(input_dir / "v0.json")
+    os.utime(input_dir / "v0.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert _run(input_dir, output_dir) == cli.EXIT_OK
+    assert _summary(output_dir)["processed"] == 1
+
+    # 보고서 옵션이 바뀌면 모두 다시 처리합니다.
+    assert _run(input_dir, output_dir, "--keyword", "RKayamori") == cli.EXIT_OK
+    assert _summary(output_dir)["processed"] == 2
+    assert _run(input_dir, output_dir, "--keyword", "RKayamori", "--force") == cli.EXIT_OK
+    assert _summary(output_dir)["processed"] == 2
+
+    # 출력 파일이 없어졌으면 다시 만듭니다.
+    (output_dir / "v1.csv").unlink()
+    assert _run(input_dir, output_dir, "--keyword", "RKayamori") == cli.EXIT_OK
+    assert _summary(output_dir)["processed"] == 1
+
+
+def test_drive_mode_stages_only_what_it_processes(env, monkeypatch, tmp_path):
+    input_dir, output_dir = env
+    monkeypatch.setattr(config, "DRIVE_CATALOG_DIR", input_dir)
+    monkeypatch.setattr(config, "DRIVE_STAGING_DIR", tmp_path / "staging")
+    staged = []
+    local_path = DriveCatalogStager.local_path
+
+    def record(self, name):
+        staged.append(name)
+        return local_path(self, name)
+    monkeypatch.setattr(DriveCatalogStager, "local_path", record)
+
+    args = ["--drive", "--output-dir", str(output_dir), "--workers", "1"]
+    assert cli.main(args) == cli.EXIT_OK
+    assert set(staged) == {"v0.json", "v1.json"} and _summary(output_dir)["processed"] == 2
+
+    staged.clear()
+    assert cli.main(args) == cli.EXIT_OK
+    # 건너뛴 카탈로그는 로컬 사본을 준비하지 않습니다.
+    assert staged == [] and _summary(output_dir)["processed"] == 0
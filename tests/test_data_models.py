@@ -0,0 +1,77 @@
+# frida_asset_suite/tests/test_data_models.py
+import os
+
+import pytest
+
+from backend import data_models
+from backend.data_models import CharacterManager
+
+HEADER = "캐릭터명(K),캐릭터명(J),성우,소속 부대,게임코드\n"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(data_models.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _write_csv(path, rows, mtime_ns: int, header: str = HEADER):
+    path.write_text(header + "".join(f"{name},,,{squad},{code}\n" for code, name, squad in rows), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "character_info.csv"
+    _write_csv(path, [("RKayamori", "루카", "31A")], 1_000_000_000)
+    return path
+
+
+def test_reload_after_interval(csv_path, clock):
+    manager = CharacterManager(str(csv_path), reload_interval=2.0)
+    assert manager.version == 1
+    assert manager.match_character("Assets/x_YIzumi_y.png") is None
+
+    _write_csv(csv_path, [("RKayamori", "루카", "31A"), ("YIzumi", "유키", "31A")], 2_000_000_000)
+    clock[0] += 1.0  # 간격 안에서는 파일을 확인하지 않습니다.
+    assert manager.allowed_codes(["31A"], None) == {"RKayamori"}
+    assert manager.version == 1
+
+    clock[0] += 1.5
+    assert manager.allowed_codes(["31A"], None) == {"RKayamori", "YIzumi"}
+    assert manager.version == 2
+    assert manager.match_character("Assets/x_YIzumi_y.png") == "YIzumi"
+    assert manager.get_characters_by_squad(["31A"]) == ["루카", "유키"]
+
+
+def test_unchanged_stamp_does_not_reload(csv_path, clock):
+    manager = CharacterManager(str(csv_path), reload_interval=0)
+    os.utime(csv_path, ns=(1_000_000_000, 1_000_000_000))
+    assert manager.refresh() is False and manager.version == 1
+    # 수정 시각이 같아도 크기가 바뀌면 다시 읽습니다.
+    _write_csv(csv_path, [("RKayamori", "루카", "31A"), ("YIzumi", "유키", "31B")], 1_000_000_000)
+    assert manager.refresh() is True and manager.version == 2
+    assert manager.get_squad_list() == ["31A", "31B"]
+
+
+def test_bad_csv_keeps_previous_data(csv_path, clock):
+    manager = CharacterManager(str(csv_path), reload_interval=0)
+    _write_csv(csv_path, [("YIzumi", "유키", "31A")], 2_000_000_000, header="이름,부대,코드\n")
+    assert manager.refresh() is False
+    assert manager.version == 1
+    assert manager.allowed_codes(["31A"], None) == {"RKayamori"}
+    assert manager.match_character("Assets/x_RKayamori_y.png") == "RKayamori"
+
+    # 고친 파일은 다음 확인에서 반영됩니다.
+    _write_csv(csv_path, [("YIzumi", "유키", "31A")], 3_000_000_000)
+    assert manager.refresh() is True and manager.version == 2
+    assert manager.allowed_codes(["31A"], None) == {"YIzumi"}
+    assert manager.match_character("Assets/x_RKayamori_y.png") is None
+
+
+def test_missing_file_keeps_previous_data(csv_path, clock):
+    manager = CharacterManager(str(csv_path), reload_interval=0)
+    csv_path.unlink()
+    assert manager.refresh() is False
+    assert manager.char_data == {"RKayamori": {"name": "루카", "squad": "31A"}}
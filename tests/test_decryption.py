@@ -0,0 +1,87 @@
+# frida_asset_suite/tests/test_decryption.py
+import gzip
+import os
+import zlib
+
+import pytest
+
+from backend.decryption import CatalogDecryptor, CatalogKeyRing
+from conftest import IV, KEY, cbc_encrypt, encrypt_bytes
+
+
+@pytest.fixture
+def decryptor():
+    return CatalogDecryptor(KEY.hex(), IV.hex())
+
+
+@pytest.mark.parametrize("size", [0, 1, 15, 16, 17, 4095, 4096, 100_000])
+@pytest.mark.parametrize("chunk_size", [16, 17, 1000, 1 << 20])
+def test_streaming_matches_one_shot(decryptor, write_encrypted, size, chunk_size):
+    plain = os.urandom(size // 2) + b"Assets/x/y.png\x00" * (size // 32)
+    path = write_encrypted("catalog.bin", plain)
+    assert b"".join(decryptor.iter_decompressed_chunks(path, chunk_size)) == plain
+
+
+@pytest.mark.parametrize("chunk_size", [16, 48, 1 << 20])
+def test_unpad_strips_only_last_block(decryptor, tmp_path, chunk_size):
+    # GZip 데이터 길이가 블록 크기의 배수이면 패딩 블록이 통째로 붙습니다.
+    compressed = gzip.compress(b"a" * 5000, mtime=0)
+    path = tmp_path / "catalog.bin"
+    path.write_bytes(cbc_encrypt(compressed))
+    assert b"".join(decryptor.iter_decrypted_blocks(str(path), chunk_size)) == compressed
+
+
+def test_multi_member_gzip(decryptor, tmp_path):
+    data = gzip.compress(b"first,", mtime=0) + gzip.compress(b"second", mtime=0)
+    path = tmp_path / "catalog.bin"
+    path.write_bytes(cbc_encrypt(data))
+    assert b"".join(decryptor.iter_decompressed_chunks(str(path), 16)) == b"first,second"
+
+
+def test_truncated_ciphertext_raises(decryptor, tmp_path):
+    path = tmp_path / "catalog.bin"
+    path.write_bytes(encrypt_bytes(b"x" * 1000)[:-5])
+    with pytest.raises(ValueError):
+        b"".join(decryptor.iter_decompressed_chunks(str(path)))
+
+
+def test_wrong_key_fails_padding_or_gzip(write_encrypted):
+    path = write_encrypted("catalog.bin", b"x" * 1000)
+    wrong = CatalogDecryptor((b'z' * 16).hex(), IV.hex())
+    with pytest.raises((ValueError, zlib.error)):
+        b"".join(wrong.iter_decompressed_chunks(path))
+
+
+def test_truncated_gzip_raises(decryptor, tmp_path):
+    path = tmp_path / "catalog.bin"
+    path.write_bytes(cbc_encrypt(gzip.compress(b"x" * 1000)[:-8]))
+    with pytest.raises(zlib.error):
+        b"".join(decryptor.iter_decompressed_chunks(str(path)))
+
+
+def test_decrypt_file_removes_output_on_failure(decryptor, tmp_path):
+    src, out = tmp_path / "catalog.bin", tmp_path / "out.bin"
+    src.write_bytes(b"not a multiple of sixteen")
+    assert decryptor.decrypt_file(str(src), str(out)) is False
+    assert not out.exists()
+
+
+def test_keyring_selects_matching_key(write_encrypted):
+    path = write_encrypted("catalog.bin", b"payload")
+    wrong = CatalogDecryptor((b'z' * 16).hex(), (b'y' * 16).hex())
+    right = CatalogDecryptor(KEY.hex(), IV.hex())
+    assert CatalogKeyRing([wrong, right]).select(path) is right
+    assert CatalogKeyRing([wrong]).select(path) is None
+
+
+def test_file_probe_key_depends_on_last_block(tmp_path):
+    from backend.decryption import file_probe_key
+    a = tmp_path / "a.bin"
+    b = tmp_path / "b.bin"
+    # 같은 크기, 같은 앞부분(64 KiB 이상)이지만 끝의 평문이 다르면 CBC 마지막 블록이 달라집니다.
+    prefix = os.urandom(200_000)
+    a.write_bytes(encrypt_bytes(prefix + b"aaaa"))
+    b.write_bytes(encrypt_bytes(prefix + b"aaab"))
+    assert a.read_bytes()[:65536] == b.read_bytes()[:65536]
+    assert a.stat().st_size == b.stat().st_size
+    assert file_probe_key(str(a))[1] != file_probe_key(str(b))[1]
@@ -0,0 +1,93 @@
+# frida_asset_suite/tests/test_drive_staging.py
+import os
+import threading
+import time
+
+import pytest
+
+from backend.drive_staging import DriveCatalogStager
+
+
+@pytest.fixture
+def drive(tmp_path):
+    source = tmp_path / "drive"
+    source.mkdir()
+    return source
+
+
+def _write(source, name: str, size: int, fill: bytes = b"x", mtime: int = 0) -> bytes:
+    data = (fill * size)[:size]
+    (source / name).write_bytes(data)
+    if mtime:
+        os.utime(source / name, (mtime, mtime))
+    return data
+
+
+def _stager(drive, tmp_path, max_bytes: int = 1 << 30) -> DriveCatalogStager:
+    return DriveCatalogStager(drive, tmp_path / "staging", max_bytes)
+
+
+def test_stage_copies_and_records_digest(drive, tmp_path):
+    data = _write(drive, "a.json", 1000)
+    stager = _stager(drive, tmp_path)
+    local = stager.stage("a.json")
+    assert local.read_bytes() == data and local.parent == tmp_path / "staging"
+    assert stager.digest("a.json") is not None
+    assert stager.staged_path("a.json") == local
+
+
+def test_corrupted_staged_copy_is_refetched(drive, tmp_path):
+    data = _write(drive, "a.json", 1000)
+    local = _stager(drive, tmp_path).stage("a.json")
+    # 크기는 그대로 두고 내용만 손상시킵니다. (이전 세션의 사본)
+    local.write_bytes(b"y" * 1000)
+    os.utime(local, ns=(os.stat(drive / "a.json").st_atime_ns, os.stat(drive / "a.json").st_mtime_ns))
+
+    restarted = _stager(drive, tmp_path)
+    assert restarted.staged_path("a.json") is None  # 이번 프로세스에서 검증되기 전에는 사용하지 않습니다.
+    assert restarted.stage("a.json").read_bytes() == data
+
+
+def test_changed_source_is_refetched(drive, tmp_path):
+    _write(drive, "a.json", 1000, mtime=1_000_000)
+    stager = _stager(drive, tmp_path)
+    stager.stage("a.json")
+    data = _write(drive, "a.json", 1000, fill=b"z", mtime=2_000_000)
+    assert stager.stage("a.json").read_bytes() == data
+
+
+def test_pinned_copy_survives_eviction(drive, tmp_path):
+    for name in ("a.json", "b.json", "c.json"):
+        _write(drive, name, 1000)
+    stager = _stager(drive, tmp_path, max_bytes=2000)
+    with stager.pinned(["a.json"]):
+        stager.stage("a.json")
+        stager.stage("b.json")
+        stager.stage("c.json")  # 'a'가 가장 오래되었지만 고정되어 있으므로 'b'를 삭제합니다.
+        assert stager.staged_path("a.json") is not None
+        assert stager.staged_path("b.json") is None
+    stager.stage("b.json")  # 고정이 풀리면 가장 오래된 'a'가 삭제됩니다.
+    assert stager.staged_path("a.json") is None
+    assert stager.status()["bytes"] <= 2000
+
+
+def test_prefetch_and_shutdown(drive, tmp_path):
+    for name in ("a.json", "b.json"):
+        _write(drive, name, 1000)
+    stager = _stager(drive, tmp_path)
+    assert stager.list_catalogs() == ["a.json", "b.json"]
+    deadline = time.monotonic() + 5
+    while stager.status()["pending"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert stager.status() == {"staged": 2, "bytes": 2000, "pending": 0}
+
+    worker = stager._worker
+    stager.shutdown(timeout=5)
+    assert not worker.is_alive()
+    stager.prefetch(["c.json"])  # 종료 후에는 새 복사를 예약하지 않습니다.
+    assert stager.status()["pending"] == 0
+    assert not any(t.name == "drive-prefetch" and t.is_alive() for t in threading.enumerate())
+
+
+def test_shutdown_without_worker(drive, tmp_path):
+    _stager(drive, tmp_path).shutdown(timeout=1)
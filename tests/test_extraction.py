@@ -0,0 +1,227 @@
+# frida_asset_suite/tests/test_extraction.py
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from backend import instrumentation, pipeline as pipeline_module, worker_pool
+from backend.decryption import CatalogDecryptor
+from backend.extraction import PathExtractor
+from backend.pipeline import CatalogPipeline
+from conftest import IV, KEY
+
+
+def _random_binary(seed: int, size: int = 20_000) -> bytes:
+    """경로, 경로 문자만 이어진 긴 구간, 잘린 'Assets' 접두사, 제어 문자가 섞인 바이너리."""
+    rng = random.Random(seed)
+    parts = []
+    while sum(map(len, parts)) < size:
+        roll = rng.random()
+        if roll < 0.4:
+            parts.append(f"Assets/{rng.choice('abc')}/{rng.randrange(50)}.png".encode())
+        elif roll < 0.5:
+            parts.append(b"x" * rng.randrange(100))
+        elif roll < 0.6:
+            parts.append(b"Asse"[:rng.randrange(1, 5)])
+        else:
+            parts.append(bytes(rng.randrange(256) for _ in range(rng.randrange(1, 8))))
+    return b"".join(parts)
+
+
+def _expected(data: bytes) -> set:
+    return {m.decode('utf-8') for m in PathExtractor._ASSET_PATH_PATTERN.findall(data)}
+
+
+@pytest.fixture
+def small_segments(monkeypatch):
+    monkeypatch.setattr(PathExtractor, "_SEGMENT_SIZE", 97)
+
+
+@pytest.fixture
+def pool():
+    """작업자 2개짜리 공유 프로세스 풀. CPU 수와 관계없이 병렬 경로를 검사합니다."""
+    worker_pool.shutdown_worker_pool()
+    if not worker_pool.start_worker_pool(2):
+        pytest.skip("fork 방식 프로세스 풀을 사용할 수 없습니다.")
+    yield worker_pool.get_worker_pool()
+    worker_pool.shutdown_worker_pool()
+
+
+def test_segment_bounds_fall_on_non_path_bytes(small_segments):
+    data = _random_binary(0)
+    bounds = PathExtractor._segment_bounds(data, len(data))
+    assert bounds[0] == 0 and bounds[-1] == len(data) and bounds == sorted(bounds)
+    for pos in bounds[1:-1]:
+        assert PathExtractor._PATH_BOUNDARY.match(data, pos)
+
+
+def test_segment_bounds_without_boundary_byte(small_segments):
+    data = b"Assets/" + b"a" * 1000
+    assert PathExtractor._segment_bounds(data, len(data)) == [0, len(data)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_binary_scan_matches_findall(tmp_path, small_segments, seed):
+    data = _random_binary(seed)
+    path = tmp_path / "catalog.bin"
+    path.write_bytes(data)
+    assert PathExtractor(workers=1).extract_from_binary(str(path)) == _expected(data)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_parallel_scan_matches_findall(tmp_path, small_segments, pool, seed):
+    data = _random_binary(seed)
+    path = tmp_path / "catalog.bin"
+    path.write_bytes(data)
+    assert PathExtractor(workers=2).extract_from_binary(str(path)) == _expected(data)
+
+
+def test_empty_and_missing_binary(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    assert PathExtractor(workers=1).extract_from_binary(str(path)) == set()
+    assert PathExtractor(workers=1).extract_from_binary(str(tmp_path / "missing.bin")) == set()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 8, 64, 1000])
+def test_stream_scan_matches_findall(chunk_size):
+    data = _random_binary(1, 5000)
+    chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+    assert PathExtractor().extract_from_stream(chunks) == _expected(data)
+
+
+def test_streaming_profile_reads_rss_only_at_run_boundaries(write_encrypted, monkeypatch):
+    reads = []
+    monkeypatch.setattr(instrumentation, "_current_rss_mb", lambda: reads.append(1) or 100.0)
+    path = write_encrypted("catalog.bin", _random_binary(3))
+    pipeline = CatalogPipeline(CatalogDecryptor(KEY.hex(), IV.hex()), PathExtractor(workers=1), chunk_size=64)
+    with instrumentation.RunProfile("stream") as profile:
+        pipeline.extract_paths(path)
+    # 청크마다 열리는 단계는 RSS를 읽지 않고, 실행과 파일당 한 번 열리는 단계(키 확인, unpad)의 시작/끝에서만 읽습니다.
+    assert profile.stages["regex scan"]["calls"] > 10 and profile.stages["gunzip"]["calls"] > 10
+    assert all(profile.stages[name]["rss_delta_mb"] is None
+               for name in ("read", "decrypt", "gunzip", "regex scan", "set build"))
+    sampled = sum(r["calls"] for r in profile.stages.values() if r["rss_delta_mb"] is not None)
+    assert len(reads) == 2 + 2 * sampled and sampled <= 2 and profile.rss_delta_mb == 0.0
+
+
+def test_stage_cpu_excludes_other_threads():
+    stop = threading.Event()
+    busy = threading.Thread(target=lambda: [None for _ in iter(stop.is_set, True)])
+    busy.start()
+    try:
+        with instrumentation.RunProfile("idle") as profile, instrumentation.stage("sleep"):
+            time.sleep(0.3)
+    finally:
+        stop.set()
+        busy.join()
+    # 다른 스레드가 CPU를 계속 쓰고 있어도 잠자는 동안의 CPU 시간은 거의 0입니다.
+    assert profile.stages["sleep"]["cpu_s"] < 0.1 and profile.cpu_s < 0.1
+
+
+def test_worker_stages_are_shown_as_per_process_totals():
+    record = {"calls": 2, "wall_s": 1.0, "cpu_s": 1.0, "bytes_in": 0, "bytes_out": 0}
+    job = instrumentation.RunProfile("job")
+    job.merge({"decrypt": record}, prefix="worker ", per_process=True)
+    job.add("index build", 0.1, 0.1)
+    # 작업 큐 스레드의 기록을 요청 쪽으로 합쳐도 작업자 프로세스 합계인지가 유지됩니다.
+    run = instrumentation.RunProfile("run")
+    run.merge(job.stages, prefix="job ")
+    assert run.stages["job worker decrypt"]["per_process"] and not run.stages["job index build"]["per_process"]
+    text = run.to_markdown()
+    assert text.index("job index build") < text.index("작업자 프로세스 합계") < text.index("job worker decrypt")
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_parallel_stream_scan_matches_findall(small_segments, pool, seed):
+    data = _random_binary(seed)
+    chunks = [data[i:i + 50] for i in range(0, len(data), 50)]
+    assert PathExtractor(workers=2).extract_from_stream_parallel(chunks) == _expected(data)
+
+
+def test_iter_segments_cut_on_non_path_bytes(small_segments):
+    data = _random_binary(3)
+    segments = list(PathExtractor._iter_segments(data[i:i + 31] for i in range(0, len(data), 31)))
+    assert b"".join(segments) == data and len(segments) > 1
+    for segment in segments[1:]:
+        assert PathExtractor._PATH_BOUNDARY.match(segment)
+
+
+def test_parallel_scan_falls_back_on_worker_error(tmp_path, small_segments, pool, monkeypatch):
+    def fail(*args, **kwargs):
+        raise OSError("mmap failed")
+
+    def submit_failing(*args, **kwargs):
+        future = Future()
+        future.set_exception(OSError("mmap failed"))
+        return future
+    monkeypatch.setattr(pool, "map", fail)
+    monkeypatch.setattr(pool, "submit", submit_failing)
+    data = _random_binary(4)
+    path = tmp_path / "catalog.bin"
+    path.write_bytes(data)
+    assert PathExtractor(workers=2).extract_from_binary(str(path)) == _expected(data)
+    assert PathExtractor(workers=2).extract_from_stream_parallel([data]) == _expected(data)
+
+
+def test_pipeline_scans_in_memory(tmp_path, write_encrypted, small_segments, pool, monkeypatch):
+    import tempfile
+    monkeypatch.setattr(tempfile, "mkstemp", None)  # 해제된 데이터를 디스크에 기록하지 않아야 합니다.
+    data = _random_binary(2)
+    path = write_encrypted("catalog.bin", data)
+    decryptor = CatalogDecryptor(KEY.hex(), IV.hex())
+    parallel = CatalogPipeline(decryptor, PathExtractor(workers=2), chunk_size=64)
+    streamed = CatalogPipeline(decryptor, PathExtractor(workers=1), chunk_size=64)
+    assert set(parallel.extract_paths(path)) == set(streamed.extract_paths(path)) == _expected(data)
+
+
+def test_iter_extract_paths_pulls_inputs_lazily(write_encrypted, pool):
+    datas = [_random_binary(seed, 2000) for seed in range(5)]
+    paths = [write_encrypted(f"catalog{i}.bin", data) for i, data in enumerate(datas)]
+    pulled = []
+
+    def inputs():
+        for path in paths:
+            pulled.append(path)
+            yield path
+    pipeline = CatalogPipeline(CatalogDecryptor(KEY.hex(), IV.hex()), PathExtractor(workers=1), chunk_size=64)
+    results = {}
+    for i, input_path, extracted in pipeline.iter_extract_paths(inputs(), max_workers=2):
+        if not results:
+            # 첫 결과가 나올 때까지는 작업자 수만큼(과 다음 항목 하나)만 꺼냅니다.
+            assert len(pulled) <= 3
+        results[i] = set(extracted)
+    assert results == {i: _expected(data) for i, data in enumerate(datas)}
+
+
+def test_iter_extract_paths_single_catalog_runs_here(write_encrypted, pool, monkeypatch):
+    path = write_encrypted("catalog.bin", _random_binary(0, 2000))
+    monkeypatch.setattr(pool, "submit", None)  # 하나뿐인 카탈로그는 작업자에 보내지 않습니다.
+    pipeline = CatalogPipeline(CatalogDecryptor(KEY.hex(), IV.hex()), PathExtractor(workers=1), chunk_size=64)
+    assert [(i, set(p)) for i, _, p in pipeline.iter_extract_paths(iter([path]))] == [(0, _expected(_random_binary(0, 2000)))]
+
+
+_real_extract_paths_compact = pipeline_module._extract_paths_compact
+
+
+def _dying_extract(*args):
+    """'dies'가 들어간 카탈로그를 맡은 작업자는 종료되고, 다른 작업자는 그동안 처리 중에 머뭅니다."""
+    if "dies" in args[4]:
+        time.sleep(0.2)
+        os._exit(1)
+    time.sleep(1.0)
+    return _real_extract_paths_compact(*args)
+
+
+def test_iter_extract_paths_retries_in_flight_catalogs_after_worker_dies(write_encrypted, pool, monkeypatch):
+    datas = [_random_binary(seed, 2000) for seed in range(4)]
+    paths = [write_encrypted(f"catalog{i}{'dies' if i == 0 else ''}.bin", data) for i, data in enumerate(datas)]
+    monkeypatch.setattr(pipeline_module, "_extract_paths_compact", _dying_extract)
+    pipeline = CatalogPipeline(CatalogDecryptor(KEY.hex(), IV.hex()), PathExtractor(workers=1), chunk_size=64)
+    results = {i: extracted for i, _, extracted in pipeline.iter_extract_paths(paths, max_workers=2)}
+    # 종료된 작업자의 카탈로그와 같은 풀에서 처리 중이던 카탈로그 모두 현재 프로세스에서 다시 처리됩니다.
+    assert {i: set(p) for i, p in results.items() if p is not None} == {i: _expected(data) for i, data in enumerate(datas)}
+    assert worker_pool.get_worker_pool() is None
@@ -0,0 +1,115 @@
+# frida_asset_suite/tests/test_history_store.py
+import sqlite3
+
+import pytest
+
+from backend.analysis import AssetComparer
+from backend.history_store import CatalogHistoryStore
+from benchmarks.synthetic import iter_paths, load_character_codes
+from conftest import PROJECT_ROOT
+
+
+def _report(report) -> dict:
+    return {squad: dict(chars) for squad, chars in report.report_data.items()}
+
+
+@pytest.fixture
+def versions(char_manager):
+    """합성 경로로 만든 버전 3개. 버전마다 일부 경로가 바뀝니다."""
+    codes = load_character_codes(PROJECT_ROOT / "data" / "character_info.csv")
+    return [set(iter_paths(codes, 2000, seed=1, variant=v)) for v in range(3)]
+
+
+@pytest.fixture
+def store(tmp_path, char_manager, versions):
+    store = CatalogHistoryStore(tmp_path / "history.sqlite3", char_manager)
+    for v, paths in enumerate(versions):
+        store.record_version(f"v{v}", f"key{v}", paths)
+    yield store
+    store.close()
+
+
+def test_record_is_idempotent_by_source_key(store, versions):
+    assert store.find_version("key0") == 1
+    assert store.find_version("missing") is None
+    assert store.record_version("renamed", "key0", versions[0]) == 1
+    assert [v["name"] for v in store.list_versions()] == ["v0", "v1", "v2"]
+
+
+def test_paths_and_diff(store, versions):
+    assert store.paths_for(3) == versions[2]
+    added, removed = store.diff(3, 1)
+    assert len(added) == len(versions[2] - versions[0])
+    assert len(removed) == len(versions[0] - versions[2])
+
+
+def test_versions_containing(store, versions):
+    common = next(iter(versions[0] & versions[1] & versions[2]))
+    assert store.versions_containing(common) == ["v0", "v1", "v2"]
+    only_new = next(iter(versions[2] - versions[0] - versions[1]))
+    assert store.versions_containing(only_new) == ["v2"]
+
+
+def _filters(char_manager):
+    squads = list(char_manager.squad_data)
+    character = char_manager.squad_data[squads[2]][0]
+    return [([], [], ""), (squads[:1], [], ""), ([], [character], ""), (squads[:1], [character], "a"), ([], [], "voice")]
+
+
+def test_comparison_report_matches_set_comparison(store, versions, char_manager):
+    comparer = AssetComparer(char_manager)
+    for squads, chars, keyword in _filters(char_manager):
+        stored = store.build_comparison_report(3, 1, squads, chars, keyword)
+        expected = comparer.build_comparison_report_from_paths(versions[2], versions[0], "v2", "v0",
+                                                               squads, chars, keyword)
+        assert _report(stored) == _report(expected), (squads, chars, keyword)
+
+
+def test_version_report_matches_set_report(store, versions, char_manager):
+    comparer = AssetComparer(char_manager)
+    for squads, chars, keyword in _filters(char_manager):
+        stored = store.build_version_report(2, squads, chars, keyword)
+        expected = comparer.build_single_report_from_paths(versions[1], "v1", squads, chars, keyword)
+        assert _report(stored) == _report(expected), (squads, chars, keyword)
+
+
+def test_reopen_keeps_versions(tmp_path, char_manager, versions):
+    store = CatalogHistoryStore(tmp_path / "history.sqlite3", char_manager)
+    store.record_version("v0", "key0", versions[0])
+    store.close()
+    store = CatalogHistoryStore(tmp_path / "history.sqlite3", char_manager)
+    try:
+        assert store.find_version("key0") == 1
+        assert store.paths_for(1) == versions[0]
+    finally:
+        store.close()
+
+
+def test_old_schema_with_member_blobs_is_migrated(tmp_path, char_manager, versions):
+    db_path = tmp_path / "history.sqlite3"
+    store = CatalogHistoryStore(db_path, char_manager)
+    for v, paths in enumerate(versions[:2]):
+        store.record_version(f"v{v}", f"key{v}", paths)
+    store.close()
+    # 이전 형식: 버전마다 members BLOB을 두고, version_paths는 (경로 ID, 버전 ID) 순서의 기본 키를 사용합니다.
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("ALTER TABLE versions ADD COLUMN members BLOB NOT NULL DEFAULT x''")
+        conn.execute("CREATE TABLE old_version_paths (path_id INTEGER NOT NULL, version_id INTEGER NOT NULL, "
+                     "PRIMARY KEY (path_id, version_id)) WITHOUT ROWID")
+        conn.execute("INSERT INTO old_version_paths SELECT path_id, version_id FROM version_paths")
+        conn.execute("DROP TABLE version_paths")
+        conn.execute("ALTER TABLE old_version_paths RENAME TO version_paths")
+    conn.close()
+
+    store = CatalogHistoryStore(db_path, char_manager)
+    try:
+        columns = [row[1] for row in store._conn.execute("PRAGMA table_info(versions)")]
+        assert "members" not in columns
+        assert store.paths_for(2) == versions[1]
+        common = next(iter(versions[0] & versions[1]))
+        assert store.versions_containing(common) == ["v0", "v1"]
+        assert store.record_version("v2", "key2", versions[2]) == 3
+        assert store.paths_for(3) == versions[2]
+    finally:
+        store.close()
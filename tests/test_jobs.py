@@ -0,0 +1,145 @@
+# frida_asset_suite/tests/test_jobs.py
+import threading
+import time
+
+import pytest
+
+from backend.instrumentation import report_progress
+from backend.jobs import Job, JobManager, JobQueueFull
+
+
+@pytest.fixture
+def manager():
+    manager = JobManager(max_workers=1, max_queued=2)
+    yield manager
+    manager.shutdown()
+
+
+def _chunked_task(started: threading.Event, release: threading.Event, chunks: int = 1000):
+    """청크마다 진행률을 보고하는 작업. release가 설정될 때까지 청크 사이에서 기다립니다."""
+    def run():
+        started.set()
+        for _ in range(chunks):
+            release.wait(0.01)
+            report_progress("decrypt", 1)
+        return "done"
+    return run
+
+
+def test_job_completes_with_result(manager):
+    release = threading.Event()
+    release.set()
+    job = manager.submit("a", "a", _chunked_task(threading.Event(), release, chunks=10))
+    assert job.wait(5)
+    assert job.state == Job.DONE and job.result == "done" and job.fraction == 1.0
+
+
+def test_cancel_stops_running_job_at_next_chunk(manager):
+    started, release = threading.Event(), threading.Event()
+    job = manager.submit("a", "a", _chunked_task(started, release), owner="s1")
+    assert started.wait(5)
+    assert manager.cancel(job, "s1") is True
+    assert job.wait(5)
+    assert job.state == Job.CANCELLED and job.result is None
+
+
+def test_cancel_waits_for_all_owners(manager):
+    started, release = threading.Event(), threading.Event()
+    job = manager.submit("a", "a", _chunked_task(started, release), owner="s1")
+    assert manager.submit("a", "a", _chunked_task(started, release), owner="s2") is job
+    assert manager.cancel(job, "s1") is False
+    assert not job.cancel_requested
+    assert manager.cancel_owner("s2") == 1
+    assert job.wait(5) and job.state == Job.CANCELLED
+
+
+def test_queued_job_cancelled_before_start(manager):
+    started, release = threading.Event(), threading.Event()
+    running = manager.submit("a", "a", _chunked_task(started, release), owner="s1")
+    assert started.wait(5)
+    ran = threading.Event()
+    queued = manager.submit("b", "b", lambda: ran.set(), owner="s1")
+    assert queued.state == Job.QUEUED
+    assert manager.cancel_owner("s1") == 2
+    assert queued.wait(5) and running.wait(5)
+    assert queued.state == Job.CANCELLED and not ran.is_set()
+
+
+def test_cancelled_key_can_be_resubmitted(manager):
+    started, release = threading.Event(), threading.Event()
+    job = manager.submit("a", "a", _chunked_task(started, release))
+    job.cancel()
+    release.set()
+    retry = manager.submit("a", "a", lambda: "again")
+    assert retry is not job
+    assert retry.wait(5) and retry.result == "again"
+
+
+def test_queue_limit(manager):
+    started, release = threading.Event(), threading.Event()
+    manager.submit("running", "running", _chunked_task(started, release))
+    assert started.wait(5)
+    manager.submit("q1", "q1", lambda: None)
+    manager.submit("q2", "q2", lambda: None)
+    with pytest.raises(JobQueueFull):
+        manager.submit("q3", "q3", lambda: None)
+    release.set()
+
+
+def test_fraction_is_monotonic_across_phases():
+    job = Job("a", "a", total_bytes=100)
+    seen = []
+    for kind, nbytes in [("hash", 50), ("hash", 50), ("decrypt", 10), ("gunzip", 500), ("decrypt", 90)]:
+        job._on_progress(kind, nbytes)
+        seen.append(job.fraction)
+    assert seen == sorted(seen)
+    assert seen[1] == pytest.approx(0.1) and seen[-1] == pytest.approx(1.0)
+
+
+@pytest.fixture
+def pool():
+    from backend import worker_pool
+    worker_pool.shutdown_worker_pool()
+    if not worker_pool.start_worker_pool(2):
+        pytest.skip("fork 방식 프로세스 풀을 사용할 수 없습니다.")
+    yield
+    worker_pool.shutdown_worker_pool()
+
+
+def _worker_pipeline(chunk_size: int = 64):
+    from backend.decryption import CatalogDecryptor
+    from backend.extraction import PathExtractor
+    from backend.pipeline import CatalogPipeline
+    from conftest import IV, KEY
+    return CatalogPipeline(CatalogDecryptor(KEY.hex(), IV.hex()), PathExtractor(), chunk_size)
+
+
+def test_worker_job_reports_progress_from_pool(manager, pool, write_encrypted):
+    import os
+    plain = b"".join(f"Assets/x/{i}.png\x00".encode() for i in range(2000))
+    path = write_encrypted("catalog.bin", plain)
+    job = manager.submit("a", "a", lambda: _worker_pipeline().extract_paths_in_worker(path), [path])
+    assert job.wait(10) and job.state == Job.DONE
+    assert len(job.result) == 2000
+    assert job.phase_bytes == os.path.getsize(path) and job.decompressed_bytes == len(plain)
+    assert job.fraction == 1.0
+
+
+def test_cancel_stops_worker_job(manager, pool, write_encrypted):
+    from backend import worker_pool
+    path = write_encrypted("catalog.bin", b"Assets/x/y.png\x00" * 50_000)
+    started = threading.Event()
+
+    def run():
+        started.set()
+        return _worker_pipeline(chunk_size=16).extract_paths_in_worker(path)
+    job = manager.submit("a", "a", run, [path], owner="s1")
+    assert started.wait(5)
+    assert manager.cancel(job, "s1")
+    assert job.wait(10) and job.state == Job.CANCELLED
+    # 작업자가 멈추면 진행률 슬롯이 모두 반환됩니다.
+    for _ in range(100):
+        if len(worker_pool._free_slots) == worker_pool.PROGRESS_SLOTS:
+            break
+        time.sleep(0.05)
+    assert len(worker_pool._free_slots) == worker_pool.PROGRESS_SLOTS
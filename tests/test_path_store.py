@@ -0,0 +1,78 @@
+# frida_asset_suite/tests/test_path_store.py
+import pickle
+import random
+
+import pytest
+
+from backend.cache import ProcessedCatalogCache
+from backend.path_store import CompactPathSet
+
+
+def _ordered(paths):
+    return sorted(paths, key=lambda p: p.encode('utf-8'))
+
+
+def _random_sets(trials: int = 200):
+    """빈 문자열, 공통 접두사, 비ASCII 문자가 섞인 임의 경로 Set 쌍을 만듭니다."""
+    rng = random.Random(1)
+    alphabet = 'ab/_é가'
+    for _ in range(trials):
+        yield tuple({''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+                     for _ in range(rng.randint(0, 60))} for _ in range(2))
+
+
+def test_algebra_matches_builtin_set():
+    for s, t in _random_sets():
+        a, b = CompactPathSet.from_paths(s), CompactPathSet.from_paths(t)
+        assert list(a) == _ordered(s) and len(a) == len(s)
+        assert set(a - b) == s - t
+        assert set(a & b) == s & t
+        assert set(a | b) == s | t
+        assert s - a == set()
+        assert set(a.difference(t)) == s - t
+        for query in list(s | t) + ['zz']:
+            assert (query in a) == (query in s)
+        for i, path in enumerate(_ordered(s)):
+            assert a[i] == path
+
+
+@pytest.mark.parametrize("prefix", ['', 'a', 'ab/', '가'])
+def test_iter_prefix(prefix):
+    for s, _ in _random_sets(50):
+        a = CompactPathSet.from_paths(s)
+        expected = _ordered(p for p in s if p.startswith(prefix))
+        assert list(a.iter_prefix(prefix)) == expected
+        assert a.count_prefix(prefix) == len(expected)
+
+
+def test_long_shared_prefixes_across_blocks():
+    paths = {f"Assets/AddressableAssets/Voice/{'x' * 300}/{i:05d}.ogg" for i in range(100)}
+    a = CompactPathSet.from_paths(paths)
+    assert list(a) == _ordered(paths)
+    assert a.nbytes < sum(len(p) for p in paths)
+
+
+@pytest.mark.parametrize("paths", [set(), {''}, {'', 'a'}, {'', 'Assets/x'}])
+def test_empty_string_round_trip(paths):
+    a = CompactPathSet.from_paths(paths)
+    assert len(a) == len(paths) and set(a) == paths
+    assert bool(a) == bool(paths)
+    assert ('' in a) == ('' in paths)
+    assert pickle.loads(pickle.dumps(a)) == paths
+    assert CompactPathSet.from_sorted_blob(b'\n'.join(a.iter_bytes()), len(a)) == paths
+
+
+def test_empty_string_set_algebra():
+    only_empty, empty = CompactPathSet.from_paths({''}), CompactPathSet.from_paths(set())
+    assert only_empty - empty == {''}
+    assert empty - only_empty == set()
+    assert only_empty & CompactPathSet.from_paths({'', 'a'}) == {''}
+    assert CompactPathSet.from_paths({'', 'a'}) - only_empty == {'a'}
+
+
+@pytest.mark.parametrize("paths", [{''}, {'', 'Assets/a.png'}, {'Assets/a.png', 'Assets/b.png'}])
+def test_cache_round_trip(tmp_path, paths):
+    cache = ProcessedCatalogCache(tmp_path / "cache", max_bytes=1 << 20)
+    cache.put("key", CompactPathSet.from_paths(paths))
+    assert cache.get("key") == paths
+    assert list(cache.get("key")) == _ordered(paths)
@@ -0,0 +1,73 @@
+# frida_asset_suite/tests/test_search_index.py
+import random
+
+import numpy as np
+import pytest
+
+from backend.path_store import CompactPathSet
+from backend.search_index import TrigramIndex
+
+
+def _scan(paths, keyword: str) -> list:
+    keyword_lower = keyword.lower()
+    return sorted(p for p in paths if keyword_lower in p.lower())
+
+
+def _random_paths(seed: int, count: int = 300) -> set:
+    """대소문자, 공통 접두사, 비ASCII 문자(한글, 악센트, 소문자 변환 시 길이가 바뀌는 'İ')가 섞인 경로."""
+    rng = random.Random(seed)
+    alphabet = 'abAB/_.é가나İ'
+    return {"Assets/" + ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))) for _ in range(count)}
+
+
+QUERIES = ["", "a", "A", "/", "가", "ab", "é", "İ", "i̇", "Ab/", "assets/", "가나", "é가", "a_b", "xyz", "Assets/aB"]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_search_matches_substring_scan(seed):
+    paths = _random_paths(seed)
+    index = TrigramIndex(paths)
+    rng = random.Random(seed)
+    # 실제 경로에서 잘라낸 검색어도 함께 확인합니다.
+    sampled = [p[i:i + n] for p in rng.sample(sorted(paths), 30) for i, n in [(rng.randrange(len(p)), rng.randint(1, 6))]]
+    for keyword in QUERIES + sampled:
+        assert index.search(keyword) == _scan(paths, keyword), keyword
+
+
+def test_search_over_compact_path_set():
+    paths = _random_paths(5)
+    index = TrigramIndex(CompactPathSet.from_paths(paths))
+    for keyword in QUERIES:
+        assert sorted(index.search(keyword)) == _scan(paths, keyword), keyword
+
+
+def test_empty_and_tiny_index():
+    assert TrigramIndex([]).search("abc") == []
+    assert TrigramIndex(["a"]).search("a") == ["a"]
+    assert TrigramIndex(["ab", "AB"]).search("b") == ["AB", "ab"]
+    assert TrigramIndex(["abc"]).narrows("aBc") and not TrigramIndex(["abc"]).narrows("ab")
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(TrigramIndex, "_CHUNK_BLOCKS", 3)
+
+
+def test_search_across_build_chunks(small_chunks):
+    paths = _random_paths(7, 2000)
+    index = TrigramIndex(paths)
+    assert index._postings.dtype == np.uint16
+    # 블록 단위 posting은 경로 단위 (트라이그램, 경로) 쌍보다 적습니다.
+    pairs = sum(len({p.lower().encode()[i:i + 3] for i in range(len(p.lower().encode()) - 2)}) for p in paths)
+    assert len(index._postings) < pairs
+    for keyword in QUERIES + ["ab/a", "Assets/é"]:
+        assert index.search(keyword) == _scan(paths, keyword), keyword
+
+
+def test_index_over_size_limit_falls_back_to_scan(small_chunks):
+    paths = _random_paths(8, 2000)
+    index = TrigramIndex(paths, max_bytes=1000)
+    assert index._grams is None and index.nbytes < 1000
+    assert not index.narrows("assets/")
+    for keyword in QUERIES:
+        assert index.search(keyword) == _scan(paths, keyword), keyword
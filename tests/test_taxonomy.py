@@ -0,0 +1,70 @@
+# frida_asset_suite/tests/test_taxonomy.py
+import re
+
+import pytest
+
+from backend.taxonomy import AssetTaxonomy
+from benchmarks.synthetic import iter_paths, load_character_codes
+from conftest import PROJECT_ROOT
+
+
+def _classify_one(path: str):
+    """경로 하나씩 규칙을 순서대로 적용하는 기준 구현. (분류, 최상위 폴더, 확장자, 깊이)"""
+    lowered = path.lower()
+    directory, _, name = lowered.rpartition("/")
+    segments = set(directory.split("/")) if directory else set()
+    extension = re.search(r"(\.[0-9a-z]+)$", name)
+    extension = extension.group(1) if extension else AssetTaxonomy.NONE
+    category = AssetTaxonomy.OTHER
+    for label, keywords, folders, extensions in AssetTaxonomy.CATEGORY_RULES:
+        if any(k in lowered for k in keywords) or segments.intersection(folders) or extension in extensions:
+            category = label
+            break
+    relative = path
+    for prefix in AssetTaxonomy._ROOT_PREFIXES:
+        if relative.startswith(prefix):
+            relative = relative[len(prefix):]
+    folder = (relative.split("/", 1)[0] if "/" in relative else "") or AssetTaxonomy.ROOT
+    return category, folder, extension, path.count("/") + 1
+
+
+EDGE_PATHS = [
+    "catalog.json", "README", "Assets", "Assets/", "Assets/logo.PNG", "Assets/AddressableAssets/x.prefab",
+    "AddressableAssets/ui/button.png", "Assets/AddressableAssets/Spine/RKayamori/a.skel.bytes",
+    "Assets/Sound/VO/RKayamori_vo_001.acb", "Assets/adv/story_01.txt", "Assets/Movie/op.usm",
+    "Assets/UI/Texture/icon.png", "Assets/Data/bgm_list.csv", "Assets/Model/body.FBX", "Assets/x/.hidden",
+    "Assets/x/noext", "Assets/x/name.", "Assets/se/click.wav", "Assets/Shader/toon.shader", "Assets//double.png",
+    "Assets/voice.png", "Assets/textures/voice_line.mat",
+]
+
+
+@pytest.fixture(scope="module")
+def paths():
+    codes = load_character_codes(PROJECT_ROOT / "data" / "character_info.csv")
+    return EDGE_PATHS + sorted(set(iter_paths(codes, 3000, seed=7)))
+
+
+def test_vectorized_matches_per_path_classification(paths):
+    frame = AssetTaxonomy().classify(paths)
+    assert frame["path"].tolist() == paths
+    got = list(zip(frame["category"].astype(str), frame["folder"].astype(str),
+                   frame["extension"].astype(str), frame["depth"].tolist()))
+    expected = [_classify_one(p) for p in paths]
+    mismatches = [(p, g, e) for p, g, e in zip(paths, got, expected) if g != e]
+    assert not mismatches, mismatches[:5]
+
+
+def test_root_level_paths():
+    frame = AssetTaxonomy().classify(["catalog.json", "Assets/logo.png", "Assets/ui/a.png"]).set_index("path")
+    assert frame.loc["catalog.json", "folder"] == AssetTaxonomy.ROOT
+    assert frame.loc["Assets/logo.png", "folder"] == AssetTaxonomy.ROOT
+    assert frame.loc["Assets/ui/a.png", "folder"] == "ui"
+    assert frame["depth"].tolist() == [1, 2, 3]
+
+
+def test_empty_and_facet_counts():
+    taxonomy = AssetTaxonomy()
+    assert taxonomy.classify([]).empty
+    frame = taxonomy.classify(["a/b/c.png", "a/d.png", "e.png", "a/b/f.txt"])
+    assert taxonomy.facet_counts(frame, "extension") == {".png": 3, ".txt": 1}
+    assert list(taxonomy.facet_counts(frame, "depth")) == ["1", "2", "3"]